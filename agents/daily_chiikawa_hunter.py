@@ -6,15 +6,15 @@ Daily Chiikawa Hunter - 每日 Chiikawa 推文猎人
 import os
 os.environ['TZ'] = 'Asia/Tokyo'
 
-import json
 import subprocess
 import random
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 from pathlib import Path
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 sys.path.append(str(Path(__file__).parent))
 from core.utils_security import load_config, resolve_path
+from core.tweet_store import get_tweet_store
 
 SEC_CONFIG = load_config()
 POSTS_DIR = resolve_path("./posts")
@@ -34,33 +34,9 @@ CHIIKAWA_KEYWORDS = [
 ]
 
 def get_timeline_24h():
-    """获取过去24小时的时间线"""
+    """获取过去24小时的时间线（共享推文库，近期已抓取时不再调用 bird-x）"""
     try:
-        result = subprocess.run(
-            ["/home/tetsuya/.local/bin/bird-x", "home", "-n", "50", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        if result.returncode == 0:
-            tweets = json.loads(result.stdout)
-            if not isinstance(tweets, list):
-                return []
-            
-            cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
-            recent = []
-            for t in tweets:
-                time_str = t.get('createdAt', t.get('created_at', ''))
-                if time_str:
-                    try:
-                        time_str = time_str.replace('+0000 ', '')
-                        dt = datetime.strptime(time_str, '%a %b %d %H:%M:%S %Y')
-                        dt = dt.replace(tzinfo=timezone.utc)
-                        if dt >= cutoff:
-                            recent.append(t)
-                    except:
-                        pass
-            return recent
+        return get_tweet_store().home(count=50, hours_back=24)
     except Exception as e:
         print(f"Error: {e}")
     return []
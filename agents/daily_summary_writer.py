@@ -16,6 +16,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 sys.path.insert(0, str(PROJECT_ROOT / "agents"))
 
 from core.utils_security import load_config, resolve_path, desensitize_text
+from core.llm_client import chat_completion, provider_config
 
 SEC_CONFIG = load_config()
 POSTS_DIR = resolve_path(SEC_CONFIG["paths"].get("posts_dir", "./posts"))
@@ -30,28 +31,12 @@ SENSITIVE_KEYWORDS = [
 def call_zhipu_flash_model(prompt):
     """调用智谱 GLM-4-Flash 模型"""
     try:
-        import json
-        import requests
-        
-        config_path = Path("/home/tetsuya/.openclaw/openclaw.json")
-        if not config_path.exists():
-            print("⚠️ OpenClaw config not found")
-            return None
-            
-        with open(config_path, 'r') as f:
-            cfg = json.load(f)
-            
-        api_key = cfg.get("models", {}).get("providers", {}).get("zhipu-ai", {}).get("apiKey")
+        api_key = provider_config("zhipu-ai").get("apiKey")
         if not api_key:
             print("⚠️ Zhipu API key not found")
             return None
 
         url = "https://open.bigmodel.cn/api/paas/v4/chat/completions"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}"
-        }
-        
         data = {
             "model": "glm-4-flash",
             "messages": [
@@ -61,13 +46,7 @@ def call_zhipu_flash_model(prompt):
             "temperature": 0.8
         }
 
-        response = requests.post(url, headers=headers, json=data, timeout=60)
-        if response.status_code == 200:
-            result = response.json()
-            return result['choices'][0]['message']['content'].strip()
-        else:
-            print(f"⚠️ Zhipu API error: {response.status_code}")
-            return None
+        return chat_completion(url, data, api_key=api_key, budget=60)
     except Exception as e:
         print(f"⚠️ Zhipu call failed: {e}")
         return None
@@ -19,6 +19,8 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 from core.utils_security import load_config, resolve_path
+from core.tweet_store import get_tweet_store
+from core.seen_store import seen_set
 
 # 状态文件 - 记录上次检查的推文ID
 STATE_FILE = Path("/home/tetsuya/.openclaw/workspace/memory/human_twitter_monitor.json")
@@ -46,16 +48,9 @@ def save_state(state):
         json.dump(state, f, indent=2, ensure_ascii=False)
 
 def fetch_recent_tweets():
-    """使用 bird-x 获取人类最近推文"""
+    """使用 bird-x 获取人类最近推文（经共享推文库）"""
     try:
-        result = subprocess.run(
-            ["/home/tetsuya/.local/bin/bird-x", "user-tweets", HUMAN_TWITTER_HANDLE, "-n", "5", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        if result.returncode == 0:
-            return json.loads(result.stdout)
+        return get_tweet_store().user_tweets(HUMAN_TWITTER_HANDLE, count=5)
     except Exception as e:
         print(f"❌ Failed to fetch tweets: {e}")
     return []
@@ -186,8 +181,9 @@ def main():
     latest_tweet = tweets[0]
     latest_id = str(latest_tweet.get('id', ''))
     
-    # 检查是否是新推文
-    if state.get('last_tweet_id') == latest_id:
+    # 检查是否是新推文（已互动过的推文 ID 记录在共享的已处理记录中）
+    handled = seen_set("human_twitter_monitor:handled", [state.get('last_tweet_id')])
+    if latest_id in handled:
         print("😴 No new tweets from human")
         save_state({**state, "last_check": datetime.now().isoformat()})
         return
@@ -233,6 +229,7 @@ def main():
     
     # 创建帖子
     create_interaction_post(content, latest_tweet, mood, model_name)
+    handled.add(latest_id)
     
     # 更新状态
     save_state({
@@ -1,23 +1,41 @@
 #!/usr/bin/env python3
 import json
-import requests
+import os
+import queue
 import subprocess
+import sys
+import threading
+import time
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+from core.utils_security import load_config, resolve_path
+from core.llm_client import chat_completion, provider_config
+from core.llm_cache import cached_completion
+
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant."
+TEMPERATURE = 0.7
+
+# 路由参数
+STATS_WINDOW = 20          # 每个 provider 保留最近 N 次调用结果
+SAMPLE_MAX_AGE = 6 * 3600  # 更早的调用结果不参与排序（此后以健康检查为准）
+FAILURE_THRESHOLD = 2      # 连续失败 N 次后熔断
+BASE_COOLDOWN = 300        # 熔断冷却时间（秒），每次半开探测失败翻倍
+MAX_COOLDOWN = 3600
+# 没有任何统计时的预估延迟（秒），保持原来 MiniMax → 智谱 → Opencode 的顺序
+DEFAULT_LATENCY = {"minimax": 20.0, "zhipu": 30.0, "opencode": 60.0}
+# 同时请求排名前两位的 provider，取先成功者（CLAWTTER_LLM_RACE=1 开启）
+RACE_TOP_TWO = os.environ.get("CLAWTTER_LLM_RACE", "0") == "1"
+
 def call_minimax_llm(prompt, system_prompt="You are a helpful assistant.", model="MiniMax-M2.1"):
     """
     调用 MiniMax API (Anthropic 兼容格式)
     """
     try:
-        config_path = Path("/Users/zhongyuelan/.openclaw/openclaw.json")
-        if not config_path.exists():
-            return None, None
-            
-        with open(config_path, 'r') as f:
-            cfg = json.load(f)
-        
         # 获取 MiniMax 配置
-        mm_config = cfg.get("models", {}).get("providers", {}).get("minimax-portal", {})
+        mm_config = provider_config("minimax-portal")
         api_key = mm_config.get("apiKey")
         base_url = mm_config.get("baseUrl", "https://api.minimaxi.com")
         
@@ -26,11 +44,6 @@ def call_minimax_llm(prompt, system_prompt="You are a helpful assistant.", model
             return None, None
         
         url = f"{base_url}/v1/text/chatcompletion_v2"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}"
-        }
-        
         data = {
             "model": model,
             "messages": [
@@ -38,13 +51,12 @@ def call_minimax_llm(prompt, system_prompt="You are a helpful assistant.", model
                 {"role": "user", "content": prompt}
             ],
             "max_tokens": 4096,
-            "temperature": 0.7
+            "temperature": TEMPERATURE
         }
 
-        response = requests.post(url, headers=headers, json=data, timeout=120)
-        if response.status_code == 200:
-            result = response.json()
-            return result['choices'][0]['message']['content'].strip(), f"minimax/{model}"
+        content = chat_completion(url, data, api_key=api_key, budget=120)
+        if content:
+            return content, f"minimax/{model}"
     except Exception as e:
         print(f"⚠️ MiniMax call failed: {e}")
     return None, None
@@ -54,23 +66,11 @@ def call_zhipu_llm(prompt, system_prompt="You are a helpful assistant."):
     尝试调用智谱 GLM-4-Flash 免费模型。
     """
     try:
-        config_path = Path("/home/tetsuya/.openclaw/openclaw.json")
-        if not config_path.exists():
-            return None
-            
-        with open(config_path, 'r') as f:
-            cfg = json.load(f)
-            
-        api_key = cfg.get("models", {}).get("providers", {}).get("zhipu-ai", {}).get("apiKey")
+        api_key = provider_config("zhipu-ai").get("apiKey")
         if not api_key:
-            return None
+            return None, None
 
         url = "https://open.bigmodel.cn/api/paas/v4/chat/completions"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}"
-        }
-        
         data = {
             "model": "glm-4-flash",
             "messages": [
@@ -78,69 +78,286 @@ def call_zhipu_llm(prompt, system_prompt="You are a helpful assistant."):
                 {"role": "user", "content": prompt}
             ],
             "max_tokens": 4096,
-            "temperature": 0.7
+            "temperature": TEMPERATURE
         }
 
-        response = requests.post(url, headers=headers, json=data, timeout=60)
-        if response.status_code == 200:
-            result = response.json()
-            return result['choices'][0]['message']['content'].strip(), "zhipu/glm-4-flash"
+        content = chat_completion(url, data, api_key=api_key, budget=60)
+        if content:
+            return content, "zhipu/glm-4-flash"
     except Exception as e:
         print(f"⚠️ Zhipu call failed: {e}")
     return None, None
 
-def call_opencode_llm(prompt, model="kimi-k2.5-free"):
+def call_opencode_llm(prompt, model="kimi-k2.5-free", cancel=None):
     """
     备用方案：调用 Opencode CLI。
+    cancel（threading.Event）被设置时终止子进程（竞速中落败的一方）。
     """
     opencode_path = "/home/tetsuya/.opencode/bin/opencode"
     model_id = f"opencode/{model}" if '/' not in model else model
     
-    print(f"🤖 Falling back to Opencode CLI ({model_id})...")
+    print(f"🤖 Calling Opencode CLI ({model_id})...")
     
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             [opencode_path, 'run', '--model', model_id],
-            input=prompt,
-            capture_output=True,
-            text=True,
-            timeout=120
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
         )
-        if result.returncode == 0:
-            return result.stdout.strip(), model_id
+        deadline = time.monotonic() + 120
+        stdin = prompt
+        while True:
+            try:
+                stdout, _ = proc.communicate(stdin, timeout=0.5)
+                break
+            except subprocess.TimeoutExpired:
+                stdin = None
+                if (cancel is not None and cancel.is_set()) or time.monotonic() > deadline:
+                    proc.kill()
+                    proc.communicate()
+                    return None, None
+        if proc.returncode == 0:
+            return stdout.strip(), model_id
     except Exception as e:
         print(f"⚠️ Opencode CLI failed: {e}")
     return None, None
 
-def ask_llm(prompt, system_prompt=None, fallback_model="MiniMax-M2.1"):
+
+def _status_file():
+    """check_models.py 写出的 model-status.json"""
+    config = load_config()
+    return resolve_path(config["paths"].get("output_dir", "./docs")) / "model-status.json"
+
+
+def _state_file():
+    config = load_config()
+    return resolve_path(config["paths"].get("cache_dir", "./.cache")) / "llm-router.json"
+
+
+class LLMRouter:
     """
-    统一 LLM 调用接口：
-    1. 优先尝试 MiniMax API
-    2. 失败则尝试智谱
-    3. 最后回退到 Opencode CLI
+    按健康状况与延迟选择 provider：
+    - 健康来源：model-status.json（定时健康检查）+ 自己记录的最近 STATS_WINDOW 次调用（跨进程持久化）
+    - 熔断：连续失败 FAILURE_THRESHOLD 次后跳过该 provider，冷却结束后放行一次半开探测
+    - 排序：预估耗时 = 延迟中位数 / 成功率，越小越靠前；熔断中的 provider 只作为最后手段
     """
-    # 1. 尝试 MiniMax
-    try:
-        if system_prompt:
-            content, model = call_minimax_llm(prompt, system_prompt, fallback_model)
+
+    def __init__(self, state_file=None, status_file=None):
+        self.state_file = Path(state_file or _state_file())
+        self.status_file = Path(status_file or _status_file())
+        self.lock = threading.Lock()
+        self.probing = set()
+        self.state = self._load_state()
+        self.status = self._load_status()
+
+    def _load_state(self):
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get("providers", {})
+        except (OSError, ValueError):
+            return {}
+
+    def _load_status(self):
+        """(provider, model) -> 健康检查结果"""
+        try:
+            with open(self.status_file, 'r', encoding='utf-8') as f:
+                results = json.load(f).get("results", [])
+            return {(r["provider"], r["model"]): r for r in results}
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def save(self):
+        with self.lock:
+            data = json.dumps({"providers": self.state}, ensure_ascii=False)
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.state_file.with_suffix('.tmp')
+            tmp_file.write_text(data, encoding='utf-8')
+            os.replace(tmp_file, self.state_file)
+        except OSError as e:
+            print(f"⚠️ Failed to save LLM router state: {e}")
+
+    def _entry(self, name):
+        return self.state.setdefault(name, {"samples": [], "failures": 0, "opened_at": None, "cooldown": BASE_COOLDOWN})
+
+    def circuit(self, name):
+        """熔断状态：closed / open / half_open（冷却结束，可以放行一次探测）"""
+        with self.lock:
+            entry = self._entry(name)
+            if entry["opened_at"] is None:
+                return "closed"
+            if time.time() - entry["opened_at"] < entry["cooldown"] or name in self.probing:
+                return "open"
+            return "half_open"
+
+    def begin(self, name):
+        """即将调用：半开状态的调用就是探测，同一时间只放行一个"""
+        if self.circuit(name) == "half_open":
+            with self.lock:
+                self.probing.add(name)
+
+    def record(self, name, ok, latency):
+        with self.lock:
+            entry = self._entry(name)
+            entry["samples"] = (entry["samples"] + [[ok, round(latency, 3), int(time.time())]])[-STATS_WINDOW:]
+            probe = name in self.probing
+            self.probing.discard(name)
+            if ok:
+                entry.update(failures=0, opened_at=None, cooldown=BASE_COOLDOWN)
+                return
+            entry["failures"] += 1
+            if probe:
+                # 半开探测失败：重新熔断，冷却时间翻倍
+                entry["cooldown"] = min(entry["cooldown"] * 2, MAX_COOLDOWN)
+                entry["opened_at"] = time.time()
+                print(f"⚡ {name} still failing, circuit open for {entry['cooldown']}s")
+            elif entry["failures"] >= FAILURE_THRESHOLD and entry["opened_at"] is None:
+                entry["opened_at"] = time.time()
+                print(f"⚡ {name} failed {entry['failures']} times, circuit open for {entry['cooldown']}s")
+
+    def expected_cost(self, name, status_key):
+        """预估耗时（秒）：自己的延迟中位数优先，其次健康检查 p50，最后默认值；除以成功率"""
+        cutoff = time.time() - SAMPLE_MAX_AGE
+        half_open = self.circuit(name) == "half_open"
+        with self.lock:
+            samples = [s for s in self._entry(name)["samples"] if s[2] >= cutoff]
+        if half_open:
+            # 冷却结束：忽略熔断前的失败，按健康检查/默认值排序，让探测有机会发生
+            samples = []
+        latencies = sorted(s[1] for s in samples if s[0])
+        status = self.status.get(status_key) or {}
+        stats = status.get("stats") or {}
+
+        if latencies:
+            latency = latencies[len(latencies) // 2]
+        elif stats.get("p50") is not None:
+            latency = stats["p50"]
         else:
-            content, model = call_minimax_llm(prompt, "You are a helpful assistant.", fallback_model)
-        if content:
-            return content, model
-    except:
-        pass
-        
-    # 2. 尝试智谱
+            latency = DEFAULT_LATENCY.get(name, 60.0)
+
+        if samples:
+            success_rate = sum(1 for s in samples if s[0]) / len(samples)
+        elif stats.get("success_rate") is not None:
+            success_rate = stats["success_rate"]
+        else:
+            success_rate = 1.0
+        # 最近一次健康检查失败且自己没有更新的成功记录：降级
+        if status and not status.get("success") and not any(s[0] for s in samples[-3:]):
+            success_rate = min(success_rate, 0.2)
+        return latency / max(success_rate, 0.05)
+
+    def rank(self, candidates):
+        """返回按预估耗时排序的候选；熔断中的 provider 排在最后作为兜底"""
+        return sorted(candidates, key=lambda c: (self.circuit(c["name"]) == "open",
+                                                 self.expected_cost(c["name"], c["status"])))
+
+
+_router = None
+
+
+def get_router():
+    global _router
+    if _router is None:
+        _router = LLMRouter()
+    return _router
+
+
+def _candidates(system_prompt, fallback_model):
+    """ask_llm 可用的 provider 列表（status 为 model-status.json 中对应的 (provider, model)）"""
+    model_id = f"opencode/{fallback_model}" if '/' not in fallback_model else fallback_model
+    return [
+        {
+            "name": "minimax",
+            "status": ("minimax-portal", fallback_model),
+            "call": lambda prompt, cancel: call_minimax_llm(prompt, system_prompt or DEFAULT_SYSTEM_PROMPT, fallback_model)
+        },
+        {
+            "name": "zhipu",
+            "status": ("zhipu-ai", "glm-4-flash"),
+            "call": lambda prompt, cancel: call_zhipu_llm(prompt, system_prompt or DEFAULT_SYSTEM_PROMPT)
+        },
+        {
+            "name": "opencode",
+            "status": ("opencode", model_id),
+            "call": lambda prompt, cancel: call_opencode_llm(
+                f"{system_prompt}\n\n{prompt}" if system_prompt else prompt, fallback_model, cancel)
+        },
+    ]
+
+
+def _attempt(router, candidate, prompt, cancel=None):
+    """调用一个 provider 并记录结果，返回 (content, model)"""
+    router.begin(candidate["name"])
+    start = time.monotonic()
     try:
-        content, model = call_zhipu_llm(prompt, system_prompt) if system_prompt else call_zhipu_llm(prompt)
+        content, model = candidate["call"](prompt, cancel)
+    except Exception as e:
+        print(f"⚠️ {candidate['name']} call failed: {e}")
+        content, model = None, None
+    if cancel is not None and cancel.is_set():
+        # 竞速落败后被取消，不计入统计
+        with router.lock:
+            router.probing.discard(candidate["name"])
+        return None, None
+    router.record(candidate["name"], bool(content), time.monotonic() - start)
+    return (content, model) if content else (None, None)
+
+
+def _race(router, candidates, prompt):
+    """同时请求两个 provider，返回先成功的结果并取消另一个"""
+    results = queue.Queue()
+    cancels = [threading.Event() for _ in candidates]
+
+    def run(candidate, cancel):
+        results.put((candidate, cancel, _attempt(router, candidate, prompt, cancel)))
+
+    for candidate, cancel in zip(candidates, cancels):
+        # daemon 线程：HTTP 请求无法中断，落败方在后台结束后被丢弃，不阻塞进程退出
+        threading.Thread(target=run, args=(candidate, cancel), daemon=True).start()
+
+    print(f"🏁 Racing {' vs '.join(c['name'] for c in candidates)}")
+    for _ in candidates:
+        candidate, cancel, (content, model) = results.get()
         if content:
+            for other in cancels:
+                if other is not cancel:
+                    other.set()
             return content, model
-    except:
-        pass
-        
-    # 3. 回退到 Opencode
-    full_prompt = prompt
-    if system_prompt:
-        full_prompt = f"{system_prompt}\n\n{prompt}"
-        
-    return call_opencode_llm(full_prompt, model=fallback_model)
+    return None, None
+
+
+def ask_llm(prompt, system_prompt=None, fallback_model="MiniMax-M2.1", race=None, cache_site=None):
+    """
+    统一 LLM 调用接口：由 LLMRouter 按健康状况与延迟排序 MiniMax / 智谱 / Opencode CLI，
+    依次尝试直到成功；race=True（或 CLAWTTER_LLM_RACE=1）时先让排名前两位竞速。
+    cache_site 指定时（如 "nutritional_audit"）相同输入直接复用 core.llm_cache 中的回复，
+    创作类调用不要传。
+    """
+    return cached_completion(
+        cache_site, fallback_model, system_prompt, prompt,
+        lambda: _route(prompt, system_prompt, fallback_model, race),
+        temperature=TEMPERATURE
+    )
+
+
+def _route(prompt, system_prompt, fallback_model, race):
+    router = get_router()
+    candidates = router.rank(_candidates(system_prompt, fallback_model))
+    race = RACE_TOP_TWO if race is None else race
+
+    try:
+        if race and len(candidates) > 1:
+            content, model = _race(router, candidates[:2], prompt)
+            if content:
+                return content, model
+            candidates = candidates[2:]
+
+        for candidate in candidates:
+            content, model = _attempt(router, candidate, prompt)
+            if content:
+                return content, model
+        return None, None
+    finally:
+        router.save()
@@ -14,6 +14,7 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 from core.utils_security import load_config
+from core.seen_store import seen_set
 from agents.llm_bridge import ask_llm
 from agents.autonomous_poster import load_mood
 
@@ -43,7 +44,6 @@ def load_state():
             pass
     return {
         "last_check": None,
-        "seen_posts": [],
         "interesting_authors": [],
         "interaction_count": 0
     }
@@ -69,7 +69,7 @@ def fetch_posts(limit=20):
         print(f"❌ Error fetching posts: {e}")
     return []
 
-def calculate_interest_score(post):
+def calculate_interest_score(post, seen_posts=()):
     """计算帖子对 Clawtter 的感兴趣程度"""
     score = 0
     content = f"{post.get('title', '')} {post.get('content', '')}".lower()
@@ -102,8 +102,7 @@ def calculate_interest_score(post):
         score -= 15
     
     # 已看过的帖子降低优先级
-    state = load_state()
-    if post.get('id') in state.get("seen_posts", []):
+    if post.get('id') in seen_posts:
         score -= 30
     
     return max(0, score)
@@ -218,8 +217,9 @@ def main():
     print("🦞 Clawtter Moltbook 观察者启动...")
     print(f"时间: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
     
-    # 加载状态
+    # 加载状态（旧版状态文件中的 seen_posts 首次运行时导入共享的已处理记录）
     state = load_state()
+    seen_posts = seen_set("moltbook_observer:seen", state.pop("seen_posts", None))
     
     # 获取帖子
     posts = fetch_posts(limit=20)
@@ -232,7 +232,7 @@ def main():
     # 计算兴趣分数
     scored_posts = []
     for post in posts:
-        score = calculate_interest_score(post)
+        score = calculate_interest_score(post, seen_posts)
         if score > 0:
             scored_posts.append((post, score))
     
@@ -259,8 +259,7 @@ def main():
         print(f"  ✓ 生成转发: {filepath.name} (Model: {model_name})")
         
         # 更新状态
-        state["seen_posts"].append(post.get('id'))
-        state["seen_posts"] = state["seen_posts"][-100:]  # 只保留最近 100 条
+        seen_posts.add(post.get('id'))
         state["interaction_count"] = state.get("interaction_count", 0) + 1
     
     state["last_check"] = datetime.now().isoformat()
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 import argparse
 import http.server
-import socketserver
 import os
 import subprocess
 import signal
@@ -9,9 +8,19 @@ import time
 import random
 import threading
 import json
+import io
+import queue
+import itertools
+from collections import OrderedDict
+import re
+import hashlib
+import traceback
+import email.utils
+import urllib.parse
 from pathlib import Path
-# form watchdog.observers import Observer -> PollingObserver for stability in environments with low inotify limits
-from watchdog.observers.polling import PollingObserver as Observer
+# Native observer (inotify on Linux); falls back to PollingObserver when inotify limits are exhausted
+from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 import tools.model_ops as model_ops
 
@@ -22,6 +31,9 @@ PROJECT_ROOT = Path(__file__).parent
 sys.path.append(str(PROJECT_ROOT))
 
 from core.utils_security import load_config, resolve_path
+from core.post_index import get_post_index
+import tools.render as renderer
+from tools.render_cache import LRUCache
 
 # Load security configuration
 SEC_CONFIG = load_config()
@@ -31,6 +43,31 @@ PROJECT_DIR = Path(__file__).parent
 OUTPUT_DIR = resolve_path(SEC_CONFIG["paths"].get("output_dir", "./dist"))
 PORT = 8080
 
+# File events are coalesced until nothing has changed for this many seconds
+COALESCE_WINDOW = 0.3
+
+# Content-hashed files (sidebar.<hash>.json) and ?v= versioned assets never change under the same URL
+HASHED_NAME_RE = re.compile(r'\.[0-9a-f]{8,}\.[a-z0-9]+$')
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Precompressed siblings written at render time, in order of preference
+CONTENT_ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+# Seconds between SSE keep-alive comments
+EVENTS_KEEPALIVE = 15
+
+# (path, mtime_ns, size) -> SHA-1 of the file, so ETags stay strong without rehashing on every request
+ETAG_CACHE = LRUCache(maxsize=4096)
+ETAG_LOCK = threading.Lock()
+
+# In-process renderer: keeps the Jinja environment and parsed posts warm between renders
+RENDER_SESSION = None
+RENDER_LOCK = threading.Lock()
+
+# Render-on-demand site (--lazy); None when the whole site is rendered to disk
+LAZY_SITE = None
+
 # Directories to watch
 WATCH_DIRS = [
     PROJECT_DIR / "posts",
@@ -38,12 +75,306 @@ WATCH_DIRS = [
     PROJECT_DIR / "static",
 ]
 
+class EventBroadcaster:
+    """Fan-out of render notifications to every connected /__events client"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clients = set()
+
+    def subscribe(self):
+        q = queue.Queue()
+        with self.lock:
+            self.clients.add(q)
+        return q
+
+    def unsubscribe(self, q):
+        with self.lock:
+            self.clients.discard(q)
+
+    def publish(self, event, data):
+        message = f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+        with self.lock:
+            for q in self.clients:
+                q.put(message)
+
+EVENTS = EventBroadcaster()
+
+def resolve_post_file(filename):
+    """Map a posts/-relative path from the UI to a file; returns (path, error)"""
+    # Prevent path traversal, only allow relative paths under posts/
+    posts_dir = PROJECT_DIR / "posts"
+    rel_path = Path(filename)
+    if not filename or rel_path.is_absolute() or ".." in rel_path.parts:
+        return None, "Invalid path"
+    target = (posts_dir / rel_path).resolve()
+    if posts_dir.resolve() not in target.parents:
+        return None, "Invalid path"
+    if not target.is_file():
+        return None, "File not found"
+    return target, None
+
+class DeleteQueue:
+    """
+    Background post deletion. Every job that is waiting when the worker wakes up is
+    handled together: all files are unlinked, then one incremental render covers them.
+    """
+    MAX_JOBS = 100
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.pending = []
+        self.jobs = OrderedDict()
+        self.ids = itertools.count(1)
+        # Deleted paths the watcher will report again; their render already happened here
+        self.handled = set()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, files):
+        with self.cond:
+            job = {
+                "id": f"{int(time.time())}-{next(self.ids)}",
+                "status": "queued",
+                "files": [rel.as_posix() for rel, _ in files],
+                "deleted": [],
+                "errors": [],
+            }
+            self.jobs[job["id"]] = job
+            while len(self.jobs) > self.MAX_JOBS:
+                self.jobs.popitem(last=False)
+            self.pending.append((job, files))
+            self.cond.notify()
+            return dict(job)
+
+    def get(self, job_id):
+        with self.cond:
+            job = self.jobs.get(job_id)
+            return dict(job) if job else None
+
+    def unhandled(self, paths):
+        """Drop watcher events for files this queue deleted (and already re-rendered)"""
+        with self.cond:
+            rest = {p for p in paths if p not in self.handled}
+            self.handled.difference_update(paths)
+            return rest
+
+    def _set(self, job, **fields):
+        with self.cond:
+            job.update(fields)
+
+    def _run(self):
+        while True:
+            with self.cond:
+                while not self.pending:
+                    self.cond.wait()
+                batch, self.pending = self.pending, []
+
+            changed = set()
+            for job, files in batch:
+                self._set(job, status="running")
+                deleted, errors = [], []
+                for rel, target in files:
+                    with self.cond:
+                        self.handled.add(str(target))
+                    try:
+                        target.unlink()
+                        deleted.append(rel.as_posix())
+                        changed.add(str(target))
+                    except OSError as e:
+                        with self.cond:
+                            self.handled.discard(str(target))
+                        errors.append({"file": rel.as_posix(), "error": str(e)})
+                self._set(job, deleted=deleted, errors=errors)
+
+            print(f"\n🗑️ Deleted {len(changed)} post(s) in {len(batch)} job(s)")
+            if LAZY_SITE is not None:
+                EVENTS.publish("render", {"pages": LAZY_SITE.invalidate(changed)})
+                ok = True
+            else:
+                ok = ensure_rendered(changed=changed, quiet=True, precompress=True) if changed else True
+
+            for job, _ in batch:
+                self._set(job, status="done" if ok else "failed")
+                EVENTS.publish("job", self.get(job["id"]))
+
+DELETE_QUEUE = None
+
+def file_etag(path, st):
+    """Strong ETag: content hash of the file, memoized by mtime and size"""
+    key = (path, st.st_mtime_ns, st.st_size)
+    with ETAG_LOCK:
+        etag = ETAG_CACHE.get(key)
+    if etag is None:
+        h = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                h.update(chunk)
+        etag = h.hexdigest()[:20]
+        with ETAG_LOCK:
+            ETAG_CACHE.set(key, etag)
+    return etag
+
 class MyHandler(http.server.SimpleHTTPRequestHandler):
     def __init__(self, *args, **kwargs):
         # Set working directory to static output directory
         super().__init__(*args, directory=str(OUTPUT_DIR), **kwargs)
 
+    def end_headers(self):
+        # Lets main.js know it is talking to the dev server (enables live reload)
+        self.send_header("X-Clawtter-Dev", "1")
+        super().end_headers()
+
+    def serve_events(self):
+        """Server-sent events: one `render` event with the changed pages after each render"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "keep-alive")
+        self.end_headers()
+        self.close_connection = True
+        q = EVENTS.subscribe()
+        try:
+            self.wfile.write(b"retry: 2000\n\n")
+            self.wfile.flush()
+            while True:
+                try:
+                    message = q.get(timeout=EVENTS_KEEPALIVE)
+                except queue.Empty:
+                    message = b": keep-alive\n\n"
+                self.wfile.write(message)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            pass
+        finally:
+            EVENTS.unsubscribe(q)
+
+    def send_lazy(self):
+        """In --lazy mode, build index/date/post pages and sidebar data on first request"""
+        rel_path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path).lstrip('/')
+        if rel_path == "" or rel_path.endswith('/'):
+            rel_path += "index.html"
+        try:
+            body = LAZY_SITE.render(rel_path)
+        except Exception as e:
+            traceback.print_exc()
+            self.send_error(500, f"Render failed: {e}")
+            return None, True
+        if body is None:
+            return None, False
+
+        etag = f'"{hashlib.sha1(body).hexdigest()[:20]}"'
+        immutable = bool(HASHED_NAME_RE.search(os.path.basename(rel_path)))
+        cache_control = IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL
+        if self.not_modified(etag, None):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", cache_control)
+            self.end_headers()
+            return None, True
+
+        self.send_response(200)
+        self.send_header("Content-Type", self.guess_type(rel_path))
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", cache_control)
+        self.end_headers()
+        return io.BytesIO(body), True
+
+    def send_head(self):
+        """Serve files with strong ETags, conditional GET, Cache-Control and precompressed siblings"""
+        if LAZY_SITE is not None:
+            f, handled = self.send_lazy()
+            if handled:
+                return f
+
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            index = os.path.join(path, "index.html")
+            if not self.path.split('?', 1)[0].endswith('/') or not os.path.isfile(index):
+                # Let the base class redirect to the trailing slash or list the directory
+                return super().send_head()
+            path = index
+        if not os.path.isfile(path):
+            return super().send_head()
+
+        content_type = self.guess_type(path)
+        encoding = None
+        serve_path = path
+        accepted = self.headers.get("Accept-Encoding", "")
+        source_mtime = os.stat(path).st_mtime_ns
+        for name, suffix in CONTENT_ENCODINGS:
+            candidate = path + suffix
+            if re.search(rf'\b{name}\b', accepted) and os.path.isfile(candidate) \
+                    and os.stat(candidate).st_mtime_ns >= source_mtime:
+                encoding, serve_path = name, candidate
+                break
+
+        try:
+            f = open(serve_path, 'rb')
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+
+        try:
+            st = os.fstat(f.fileno())
+            etag = f'"{file_etag(serve_path, st)}"'
+            query = urllib.parse.urlsplit(self.path).query
+            immutable = bool(HASHED_NAME_RE.search(os.path.basename(path))) or "v" in urllib.parse.parse_qs(query)
+            cache_control = IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL
+
+            if self.not_modified(etag, st):
+                f.close()
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", cache_control)
+                self.send_header("Vary", "Accept-Encoding")
+                self.end_headers()
+                return None
+
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", str(st.st_size))
+            self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", cache_control)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return f
+        except Exception:
+            f.close()
+            raise
+
+    def not_modified(self, etag, st):
+        """Evaluate If-None-Match (preferred) or If-Modified-Since"""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = [t.strip() for t in if_none_match.split(',')]
+            return "*" in tags or etag in tags or f"W/{etag}" in tags
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since and st is not None:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            if since is not None and since.tzinfo is not None:
+                return int(st.st_mtime) <= since.timestamp()
+        return False
+
     def do_GET(self):
+        if self.path == "/__events":
+            self.serve_events()
+            return
+
+        if self.path.startswith("/__jobs/"):
+            job = DELETE_QUEUE.get(self.path[len("/__jobs/"):])
+            if job is None:
+                self.send_error(404, "Unknown job")
+            else:
+                self.send_json(200, job)
+            return
+
         # Serve rescue page at /rescue
         if self.path == "/rescue":
             rescue_file = PROJECT_DIR / "rescue.html"
@@ -121,93 +452,132 @@ class MyHandler(http.server.SimpleHTTPRequestHandler):
             content_length = int(self.headers.get("Content-Length", "0"))
             body = self.rfile.read(content_length).decode("utf-8")
             payload = json.loads(body) if body else {}
-            filename = payload.get("file", "")
+            filenames = payload.get("files") or ([payload["file"]] if payload.get("file") else [])
         except Exception:
             self.send_error(400, "Invalid JSON")
             return
 
-        if not filename:
+        if not filenames or not isinstance(filenames, list):
             self.send_error(400, "Missing file")
             return
 
-        # Prevent path traversal, only allow relative paths under posts/
-        posts_dir = PROJECT_DIR / "posts"
-        rel_path = Path(filename)
-        if rel_path.is_absolute() or ".." in rel_path.parts:
-            self.send_error(400, "Invalid path")
-            return
+        accepted, rejected = [], []
+        for filename in dict.fromkeys(str(f) for f in filenames):
+            target, error = resolve_post_file(filename)
+            if error:
+                rejected.append({"file": filename, "error": error})
+            else:
+                accepted.append((Path(filename), target))
 
-        target = (posts_dir / rel_path).resolve()
-        if posts_dir.resolve() not in target.parents:
-            self.send_error(400, "Invalid path")
+        if not accepted:
+            self.send_json(400, {"ok": False, "rejected": rejected})
             return
 
-        if not target.exists() or not target.is_file():
-            self.send_error(404, "File not found")
-            return
+        # Reply right away; deletion and the incremental re-render happen in the background
+        job = DELETE_QUEUE.submit(accepted)
+        self.send_json(202, {"ok": True, "job": job["id"], "files": job["files"], "rejected": rejected})
 
-        try:
-            target.unlink()
-        except Exception:
-            self.send_error(500, "Failed to delete file")
-            return
-
-        # Re-render
-        if not ensure_rendered():
-            self.send_error(500, "Render failed after delete")
-            return
-
-        response = json.dumps({"ok": True, "file": rel_path.as_posix()}).encode("utf-8")
-        self.send_response(200)
+    def send_json(self, status, data):
+        response = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", str(len(response)))
+        self.send_header("Cache-Control", "no-store")
         self.end_headers()
         self.wfile.write(response)
 
+class ChangeBatcher:
+    """
+    Collects changed paths and hands them to `callback(paths, rescan)` in one batch
+    once no new event has arrived for `window` seconds. Events that arrive while a
+    batch is being rendered go into the next batch, so nothing is dropped.
+    """
+    def __init__(self, callback, window=COALESCE_WINDOW):
+        self.callback = callback
+        self.window = window
+        self.cond = threading.Condition()
+        self.paths = set()
+        self.rescan = False
+        self.last_event = 0
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def add(self, path, rescan=False):
+        with self.cond:
+            self.paths.add(path)
+            self.rescan = self.rescan or rescan
+            self.last_event = time.monotonic()
+            self.cond.notify()
+
+    def _run(self):
+        while True:
+            with self.cond:
+                # Sleep until the first event (no polling while idle)
+                while not self.paths:
+                    self.cond.wait()
+                # Then wait for a quiet window
+                while True:
+                    remaining = self.last_event + self.window - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.cond.wait(remaining)
+                paths, rescan = self.paths, self.rescan
+                self.paths, self.rescan = set(), False
+            try:
+                self.callback(paths, rescan)
+            except Exception as e:
+                print(f"❌ Error handling changes: {e}")
+
 class FileChangeHandler(FileSystemEventHandler):
-    """File change listener"""
-    def __init__(self):
-        self.last_render_time = 0
-        self.render_lock = threading.Lock()
-    
-    def on_modified(self, event):
-        if event.is_directory:
-            return
-        
+    """File change listener: forwards every relevant event to the batcher"""
+    def __init__(self, batcher):
+        self.batcher = batcher
+
+    @staticmethod
+    def is_ignored(path):
         # Ignore temporary and hidden files
-        if event.src_path.endswith('~') or '/.git/' in event.src_path or '/__pycache__/' in event.src_path:
-            return
-        
-        # Debounce: only render once per second
-        current_time = time.time()
-        if current_time - self.last_render_time < 1:
+        name = os.path.basename(path)
+        return (path.endswith('~') or name.startswith('.') or name.endswith(('.swp', '.swx'))
+                or '/.git/' in path or '/__pycache__/' in path)
+
+    def record(self, path, is_directory):
+        if self.is_ignored(path):
             return
-        
-        with self.render_lock:
-            self.last_render_time = current_time
-            print(f"\n📝 File changed: {event.src_path}")
-            self.render()
-    
+        # A created/moved/deleted directory may hide many posts: ask for a full rescan
+        self.batcher.add(path, rescan=is_directory)
+
+    def on_modified(self, event):
+        # Directory "modified" events only mirror changes of their children
+        if not event.is_directory:
+            self.record(event.src_path, False)
+
     def on_created(self, event):
-        self.on_modified(event)
-    
-    def render(self):
-        """Run rendering script"""
-        try:
-            print("🎨 Rendering...")
-            result = subprocess.run(
-                ['python3', 'tools/render.py'],
-                cwd=PROJECT_DIR,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode == 0:
-                print("✅ Render complete! Refresh your browser.")
-            else:
-                print(f"❌ Render failed: {result.stderr}")
-        except Exception as e:
-            print(f"❌ Error rendering: {e}")
+        self.record(event.src_path, event.is_directory)
+
+    def on_deleted(self, event):
+        self.record(event.src_path, event.is_directory)
+
+    def on_moved(self, event):
+        self.record(event.src_path, event.is_directory)
+        self.record(event.dest_path, event.is_directory)
+
+def on_changes(paths, rescan):
+    """Render one coalesced batch of file changes"""
+    if DELETE_QUEUE is not None:
+        paths = DELETE_QUEUE.unhandled(paths)
+        if not paths and not rescan:
+            return
+    print(f"\n📝 {len(paths)} file(s) changed" + (" (rescanning posts)" if rescan else ""))
+    for path in sorted(paths)[:5]:
+        print(f"   {path}")
+    if LAZY_SITE is not None:
+        # Nothing is rendered now: drop the affected posts, pages are rebuilt on their next request
+        pages = LAZY_SITE.invalidate(paths, rescan)
+        print(f"♻️ Invalidated: {', '.join(pages[:5])}" + (" ..." if len(pages) > 5 else ""))
+        EVENTS.publish("render", {"pages": pages})
+        return
+    if ensure_rendered(changed=None if rescan else paths, quiet=True, precompress=True):
+        print("✅ Render complete! Open pages reload automatically.")
 
 def kill_process_on_port(port):
     """Kill process occupying specified port"""
@@ -233,28 +603,52 @@ def kill_process_on_port(port):
         print(f"⚠️  Error checking port: {e}")
         return False
 
-def start_file_watcher():
-    """Start file watcher"""
-    event_handler = FileChangeHandler()
-    observer = Observer()
-    
-    for watch_dir in WATCH_DIRS:
-        if watch_dir.exists():
+def start_file_watcher(force_polling=False, poll_interval=1.0):
+    """Start file watcher (inotify when available, polling otherwise)"""
+    event_handler = FileChangeHandler(ChangeBatcher(on_changes))
+    watch_dirs = [d for d in WATCH_DIRS if d.exists()]
+
+    def start(observer):
+        for watch_dir in watch_dirs:
             observer.schedule(event_handler, str(watch_dir), recursive=True)
-            print(f"👀 Watching: {watch_dir}")
-    
-    observer.start()
+        observer.start()
+        return observer
+
+    observer = None
+    if not force_polling:
+        observer = Observer()
+        try:
+            start(observer)
+            print(f"👀 Watcher: {type(observer).__name__}")
+        except OSError as e:
+            # e.g. inotify watch/instance limit reached
+            print(f"⚠️  Native watcher unavailable ({e}), falling back to polling")
+            try:
+                observer.stop()
+            except Exception:
+                pass
+            observer = None
+    if observer is None:
+        observer = start(PollingObserver(timeout=poll_interval))
+        print(f"👀 Watcher: polling every {poll_interval}s")
+
+    for watch_dir in watch_dirs:
+        print(f"👀 Watching: {watch_dir}")
     return observer
 
 def find_free_port():
     """Find a random free port"""
     return random.randint(8000, 9000)
 
+class ThreadingServer(http.server.ThreadingHTTPServer):
+    """One thread per connection, so a slow request (e.g. /api/rescue/models) does not block other readers"""
+    allow_reuse_address = True
+    daemon_threads = True
+
 def start_server(port):
     """Attempt to start server on specified port"""
-    socketserver.TCPServer.allow_reuse_address = True
     try:
-        httpd = socketserver.TCPServer(("", port), MyHandler)
+        httpd = ThreadingServer(("", port), MyHandler)
         return httpd
     except OSError:
         return None
@@ -271,8 +665,38 @@ def run_cmd(cmd, cwd=None, label=None):
         print(f"❌ Command error: {e}")
         return 1
 
-def ensure_rendered():
-    return run_cmd(['python3', 'tools/render.py'], cwd=PROJECT_ROOT, label="🎨 Rendering...") == 0
+def ensure_rendered(changed=None, quiet=False, precompress=False):
+    """
+    Render the site in process, reusing the warm render session.
+    changed: optional set of changed paths; None re-checks every post (stat only).
+    quiet: suppress the renderer's per-step output and print a one-line summary instead.
+    precompress: also write .gz/.br siblings. Only the serving dev server wants them;
+    they must never end up in the published output.
+    """
+    global RENDER_SESSION
+    with RENDER_LOCK:
+        print("🎨 Rendering...")
+        start = time.time()
+        try:
+            if RENDER_SESSION is None:
+                RENDER_SESSION = renderer.RenderSession()
+            pages = renderer.render_posts(session=RENDER_SESSION, changed=changed,
+                                          precompress=precompress, quiet=quiet)
+        except Exception as e:
+            print(f"❌ Render failed: {e}")
+            traceback.print_exc()
+            return False
+        pages = pages or []
+        print(f"⏱️ Rendered in {(time.time() - start) * 1000:.0f} ms, {len(pages)} file(s) changed")
+        if pages:
+            EVENTS.publish("render", {"pages": pages})
+        return True
+
+def close_render_session():
+    """Flush the warm render cache to disk"""
+    with RENDER_LOCK:
+        if RENDER_SESSION is not None:
+            RENDER_SESSION.close()
 
 def push_site():
     push_script = PROJECT_DIR / "push"
@@ -284,31 +708,46 @@ def push_site():
         return run_cmd(['bash', str(push_sh)], cwd=PROJECT_DIR, label="📤 Pushing...") == 0
 
     # fallback: render then push output repo
+    # (without the dev server's precompressed .gz/.br copies, which may be left in the output dir)
     if not ensure_rendered():
         return False
     return run_cmd(
-        ['bash', '-lc', 'git add . && git commit -m "Update: $(date +%Y-%m-%d\\ %H:%M)" || true && git push'],
+        ['bash', '-lc', "git add -A -- . ':(exclude)*.gz' ':(exclude)*.br' "
+                        '&& git commit -m "Update: $(date +%Y-%m-%d\\ %H:%M)" || true && git push'],
         cwd=OUTPUT_DIR,
         label="📤 Pushing output repo..."
     ) == 0
 
 def main():
+    global LAZY_SITE, RENDER_SESSION, DELETE_QUEUE
     parser = argparse.ArgumentParser(description="Clawtter Dev Server")
     parser.add_argument("-p", "--port", type=int, default=8080, help="Server port (default: 8080)")
     parser.add_argument("-push", "--push", action="store_true", help="Render static HTML and push, then exit")
+    parser.add_argument("--lazy", action="store_true",
+                        help="Start immediately and render pages on first request (for large archives)")
+    parser.add_argument("--poll", action="store_true", help="Use the polling file watcher instead of inotify")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Polling interval in seconds (default: 1.0)")
     args = parser.parse_args()
 
     if args.push:
         success = push_site()
+        close_render_session()
         if success:
             print("✅ Push complete!")
         else:
             print("❌ Push failed!")
         return
 
-    print("🎨 Initial render...")
-    if not ensure_rendered():
-        return
+    if args.lazy:
+        # Start right away: pages are rendered on first request from the post index
+        RENDER_SESSION = renderer.RenderSession()
+        LAZY_SITE = renderer.LazySite(RENDER_SESSION, get_post_index(renderer.POSTS_DIR))
+        LAZY_SITE.sync_static()
+        print("💤 Lazy mode: pages are rendered on first request")
+    else:
+        print("🎨 Initial render...")
+        if not ensure_rendered(precompress=True):
+            return
 
     httpd = None
     port = args.port
@@ -350,8 +789,10 @@ def main():
     print(f"👀 Auto-reload: ENABLED")
     print(f"💡 Press Ctrl+C to stop\n")
     
+    DELETE_QUEUE = DeleteQueue()
+
     # Start file watching
-    observer = start_file_watcher()
+    observer = start_file_watcher(force_polling=args.poll, poll_interval=args.poll_interval)
     
     try:
         httpd.serve_forever()
@@ -360,6 +801,7 @@ def main():
         observer.stop()
         observer.join()
         httpd.server_close()
+        close_render_session()
         print("✅ Server stopped.")
 
 if __name__ == "__main__":
@@ -0,0 +1,261 @@
+"""
+Clawtter - 常驻 bird-x 抓取进程
+agent 通过本地 Unix socket 以 JSON lines 请求推文，不再各自启动 bird-x：
+- 请求：一行 {"args": ["home", "-n", "20"], "limit": 5, "max_age": 120}
+- 响应：每条推文一行 {"tweet": {...}}，最后一行 {"done": true, "count": n, "cached": bool}；出错时为 {"error": "..."}
+- 同一查询并发到达时只调用一次 bird-x（single-flight），max_age 秒内的结果直接复用；
+  记忆不区分 -n，条数更多的结果可以切片回答条数较少的请求
+- 客户端读够需要的条数即可断开，worker 停止发送
+- --warm N：每 N 秒在后台预取主页与关注用户，agent 查询时直接命中
+- --fake：不调用 bird-x，返回固定生成的推文（本地调试 / 测试用）
+
+运行：python3 -m core.bird_worker [--warm 600] [--fake]
+"""
+import argparse
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+
+from core.utils_security import load_config, resolve_path
+
+MEMO_TTL = 120
+CLIENT_TIMEOUT = 45
+
+
+class WorkerUnavailable(ConnectionError):
+    """没有运行中的 worker（调用方应退回直接调用 bird-x）"""
+
+
+def default_socket_path():
+    config = load_config()
+    return resolve_path(config["paths"].get("cache_dir", "./.cache")) / "bird-worker.sock"
+
+
+def fake_fetcher(args, delay=0.0):
+    """生成固定的推文：home 为多位作者，user-tweets 为该用户本人"""
+    if delay:
+        time.sleep(delay)
+    count = int(args[args.index("-n") + 1]) if "-n" in args else 20
+    user = args[1] if args[0] == "user-tweets" else None
+    now = datetime.now(timezone.utc)
+    tweets = []
+    for i in range(count):
+        author = user or f"user{i % 5}"
+        created = now - timedelta(minutes=7 * i)
+        tweets.append({
+            "id": str(1900000000000000000 - i),
+            "text": f"fake tweet {i} from @{author} about AI agents and daily life",
+            "createdAt": created.strftime("%a %b %d %H:%M:%S +0000 %Y"),
+            "author": {"username": author, "name": author.title()},
+        })
+    return tweets
+
+
+def split_count(args):
+    """把 "-n N" 从参数中拆出：返回 (不含条数的查询, 条数或 None)"""
+    args = list(args)
+    if "-n" in args:
+        i = args.index("-n")
+        try:
+            count = int(args[i + 1])
+        except (IndexError, ValueError):
+            return tuple(args), None
+        return tuple(args[:i] + args[i + 2:]), count
+    return tuple(args), None
+
+
+def covers(cached_count, count):
+    """条数为 cached_count 的结果能否满足 count 条的请求（None 表示 bird-x 默认条数）"""
+    if cached_count is None or count is None:
+        return cached_count == count
+    return cached_count >= count
+
+
+class BirdWorker:
+    """
+    查询去重 + 短期记忆；fetcher(args) 返回推文列表。
+    结果按不含 "-n" 的查询记忆：home -n 50 的结果可以直接切片回答 home -n 20
+    """
+
+    def __init__(self, fetcher=None):
+        if fetcher is None:
+            from core.tweet_store import fetch_cli
+            fetcher = fetch_cli
+        self.fetcher = fetcher
+        self.lock = threading.Lock()
+        self.memo = {}
+        self.inflight = {}
+        self.fetches = 0
+
+    def fetch(self, args, max_age=MEMO_TTL):
+        """返回 (tweets, cached)"""
+        key, count = split_count(args)
+        with self.lock:
+            memo = self.memo.get(key)
+            if memo and time.time() - memo[0] <= max_age and covers(memo[2], count):
+                return memo[1][:count], True
+            # 同一查询正在执行且条数足够：等待它的结果
+            future = next((f for (k, n), f in self.inflight.items() if k == key and covers(n, count)), None)
+            owner = future is None
+            if owner:
+                future = self.inflight[(key, count)] = Future()
+
+        if not owner:
+            return future.result()[:count], True
+
+        try:
+            tweets = self.fetcher(list(args))
+            self.fetches += 1
+            with self.lock:
+                memo = self.memo.get(key)
+                # 仍然新鲜且条数更多的旧结果继续保留
+                keep = (memo and time.time() - memo[0] <= MEMO_TTL
+                        and memo[2] != count and covers(memo[2], count))
+                if not keep:
+                    self.memo[key] = (time.time(), tweets, count)
+            future.set_result(tweets)
+            return tweets, False
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                self.inflight.pop((key, count), None)
+
+    def warm(self, queries, interval):
+        """后台定期预取常用查询"""
+        def loop():
+            while True:
+                for args in queries:
+                    try:
+                        self.fetch(args, max_age=0)
+                    except Exception as e:
+                        print(f"⚠️ Warm fetch {' '.join(args)} failed: {e}")
+                time.sleep(interval)
+        threading.Thread(target=loop, daemon=True).start()
+
+
+class WorkerHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            args = [str(a) for a in request["args"]]
+            limit = request.get("limit")
+            tweets, cached = self.server.worker.fetch(args, request.get("max_age", MEMO_TTL))
+        except Exception as e:
+            self._send({"error": str(e)[:300]})
+            return
+
+        sent = 0
+        try:
+            for tweet in tweets:
+                if limit is not None and sent >= limit:
+                    break
+                self._send({"tweet": tweet})
+                sent += 1
+            self._send({"done": True, "count": sent, "cached": cached})
+        except (BrokenPipeError, ConnectionResetError):
+            # 客户端已读够并断开
+            pass
+
+    def _send(self, message):
+        self.wfile.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+class WorkerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path, worker):
+        self.worker = worker
+        socket_path = str(socket_path)
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, WorkerHandler)
+        os.chmod(socket_path, 0o600)
+
+
+def stream_tweets(args, limit=None, match=None, max_age=MEMO_TTL, socket_path=None, timeout=CLIENT_TIMEOUT):
+    """
+    向 worker 请求推文并逐条产出；match 为过滤函数，产出 limit 条匹配推文后立即断开。
+    没有运行中的 worker 时抛出 WorkerUnavailable，worker 报错时抛出 RuntimeError。
+    """
+    socket_path = str(socket_path or default_socket_path())
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError) as e:
+        sock.close()
+        raise WorkerUnavailable(f"bird-x worker not running at {socket_path}") from e
+
+    request = {"args": list(args), "max_age": max_age}
+    if match is None:
+        # 不需要过滤时让 worker 只发送 limit 条
+        request["limit"] = limit
+    with sock, sock.makefile("rwb") as f:
+        f.write(json.dumps(request).encode("utf-8") + b"\n")
+        f.flush()
+        matched = 0
+        for line in f:
+            message = json.loads(line)
+            if "tweet" in message:
+                if match is not None and not match(message["tweet"]):
+                    continue
+                yield message["tweet"]
+                matched += 1
+                if limit is not None and matched >= limit:
+                    return
+            elif "error" in message:
+                raise RuntimeError(f"bird-x worker: {message['error']}")
+            else:
+                return
+
+
+def warm_queries():
+    """
+    预取的查询：主页时间线、主人和关注用户的推文。
+    条数取各 agent 请求的最大值（主页 50、用户 20），较小的请求直接从中切片
+    """
+    twitter = load_config().get("social", {}).get("twitter", {})
+    queries = [["home", "-n", "50"]]
+    users = [twitter.get("owner_username")] + list(twitter.get("key_accounts", []))
+    queries.extend(["user-tweets", u, "-n", "20"] for u in users if u)
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Long-lived bird-x fetcher")
+    parser.add_argument("--socket", help="Unix socket path (default: <cache_dir>/bird-worker.sock)")
+    parser.add_argument("--warm", type=int, default=0, metavar="SECONDS",
+                        help="Prefetch the home timeline and followed users every N seconds")
+    parser.add_argument("--fake", action="store_true", help="Serve generated tweets instead of calling bird-x")
+    parser.add_argument("--fake-delay", type=float, default=0.0, help="Simulated bird-x latency for --fake")
+    args = parser.parse_args()
+
+    fetcher = (lambda a: fake_fetcher(a, args.fake_delay)) if args.fake else None
+    worker = BirdWorker(fetcher)
+    socket_path = args.socket or default_socket_path()
+    os.makedirs(os.path.dirname(str(socket_path)), exist_ok=True)
+    server = WorkerServer(socket_path, worker)
+    if args.warm:
+        worker.warm(warm_queries(), args.warm)
+
+    print(f"🐦 bird-x worker listening on {socket_path}" + (" (fake)" if args.fake else ""))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(str(socket_path)):
+            os.unlink(str(socket_path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Clawtter - 推文内容去重
+- 精确重复：规范化正文（去掉 HTML 注释 / 模型标记、合并空白）后的 SHA-1
+- 近似重复：64 位 SimHash（字符 3-gram），汉明距离 <= NEAR_DUP_DISTANCE 视为近似重复；
+  按 4 段 16 位分桶查找候选（距离 <= 3 时至少有一段完全相同）
+"""
+import hashlib
+import re
+from collections import Counter
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+NEAR_DUP_DISTANCE = 3
+
+HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_content(text):
+    """规范化正文：去掉 HTML 注释（含 model 标记）、合并空白"""
+    text = HTML_COMMENT_RE.sub(' ', text)
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+
+def content_digest(text):
+    """规范化正文的 SHA-1"""
+    return hashlib.sha1(normalize_content(text).encode('utf-8')).hexdigest()
+
+
+def simhash(text):
+    """规范化正文的 64 位 SimHash（字符 3-gram，按出现次数加权）"""
+    text = normalize_content(text).lower()
+    if len(text) < 3:
+        shingles = Counter([text])
+    else:
+        shingles = Counter(text[i:i + 3] for i in range(len(text) - 2))
+
+    weights = [0] * SIMHASH_BITS
+    for shingle, count in shingles.items():
+        h = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if (h >> bit) & 1 else -count
+
+    value = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            value |= 1 << bit
+    return value
+
+
+def signature(text):
+    """返回 (digest, simhash)"""
+    return content_digest(text), simhash(text)
+
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count('1')
+
+
+def simhash_bands(value):
+    """将 SimHash 切成 SIMHASH_BANDS 段，用于分桶查找近似重复候选"""
+    mask = (1 << BAND_BITS) - 1
+    return [(value >> (i * BAND_BITS)) & mask for i in range(SIMHASH_BANDS)]
+
+
+class DedupIndex:
+    """
+    内存中的去重索引：按加入顺序，先加入者为“原件”。
+    只保存摘要与 SimHash，不保存正文。
+    """
+
+    def __init__(self, max_distance=NEAR_DUP_DISTANCE):
+        self.max_distance = max_distance
+        self.by_digest = {}
+        self.simhashes = {}
+        self.buckets = {}
+
+    def check(self, digest, value):
+        """
+        查找重复：精确重复返回 ('exact', key, 0)，近似重复返回 ('near', key, 距离)，否则 None
+        """
+        if digest in self.by_digest:
+            return 'exact', self.by_digest[digest], 0
+
+        best = None
+        for band, part in enumerate(simhash_bands(value)):
+            for key in self.buckets.get((band, part), ()):
+                distance = hamming_distance(value, self.simhashes[key])
+                if distance <= self.max_distance and (best is None or distance < best[2]):
+                    best = ('near', key, distance)
+        return best
+
+    def add(self, key, digest, value):
+        """登记一条内容（同一摘要只保留第一条）"""
+        self.by_digest.setdefault(digest, key)
+        self.simhashes[key] = value
+        for band, part in enumerate(simhash_bands(value)):
+            self.buckets.setdefault((band, part), []).append(key)
@@ -0,0 +1,215 @@
+"""
+Clawtter - RSS 抓取与条目缓存
+- 所有订阅源并发抓取（线程池 + 每个主机最多 HOST_CONCURRENCY 个连接，连接 / 读取分别超时）
+- 保存 ETag / Last-Modified，下次发送条件请求，304 时不重新下载和解析
+- 解析后的条目存入 SQLite（paths.cache_dir/feeds.sqlite3），随机选文章时直接从库中挑选
+- 在 FEED_MAX_AGE 内抓取过的源不再请求；抓取失败时保留上次的条目
+"""
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.utils_security import load_config, resolve_path
+
+# 部分站点会拒绝 python-requests / feedparser 的默认 UA
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0 Safari/537.36")
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 15
+MAX_WORKERS = 8
+HOST_CONCURRENCY = 2
+# 一次刷新的总耗时上限（秒），超时未完成的源本次沿用旧条目
+REFRESH_BUDGET = 25
+FEED_MAX_AGE = 30 * 60
+ENTRIES_PER_FEED = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS feeds (
+    url TEXT PRIMARY KEY,
+    name TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL,
+    status INTEGER,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS entries (
+    feed_url TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    title TEXT,
+    link TEXT,
+    summary TEXT,
+    date TEXT,
+    PRIMARY KEY (feed_url, position)
+);
+"""
+
+
+def default_db_path():
+    config = load_config()
+    return resolve_path(config["paths"].get("cache_dir", "./.cache")) / "feeds.sqlite3"
+
+
+def parse_entries(content):
+    """解析 feed 内容，返回前 ENTRIES_PER_FEED 条 {title, link, summary, date}"""
+    feed = feedparser.parse(content)
+    entries = []
+    for entry in feed.entries[:ENTRIES_PER_FEED]:
+        entries.append({
+            "title": entry.get('title', 'Unknown Title'),
+            "link": entry.get('link', ''),
+            "summary": entry.get('summary', entry.get('description', ''))[:300],  # 截断
+            "date": entry.get('published', entry.get('updated', '')),
+        })
+    return entries
+
+
+class FeedStore:
+    """订阅源状态 + 条目缓存 + 并发抓取"""
+
+    def __init__(self, db_path=None):
+        self.db_path = Path(db_path or default_db_path())
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.host_slots = {}
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=HOST_CONCURRENCY)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = USER_AGENT
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def _host_slot(self, url):
+        host = urlsplit(url).netloc
+        with self.lock:
+            slot = self.host_slots.get(host)
+            if slot is None:
+                slot = self.host_slots[host] = threading.Semaphore(HOST_CONCURRENCY)
+            return slot
+
+    def _state(self, url):
+        with self.lock:
+            return self.conn.execute(
+                "SELECT etag, last_modified, fetched_at FROM feeds WHERE url = ?", (url,)).fetchone()
+
+    def fetch(self, url, etag=None, last_modified=None):
+        """
+        条件请求一个源，返回 (status, entries, etag, last_modified)。
+        304 时 entries 为 None；请求失败时抛出 requests.RequestException。
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        with self._host_slot(url):
+            response = self.session.get(url, headers=headers, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+        if response.status_code == 304:
+            return 304, None, etag, last_modified
+        response.raise_for_status()
+        return (response.status_code, parse_entries(response.content),
+                response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+    def _record(self, name, url, status, entries, etag, last_modified, error=None):
+        now = time.time()
+        with self.lock:
+            if error is not None:
+                # 失败时保留旧的条目与校验头
+                self.conn.execute(
+                    "INSERT INTO feeds (url, name, fetched_at, status, error) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(url) DO UPDATE SET name = excluded.name, fetched_at = excluded.fetched_at, "
+                    "status = excluded.status, error = excluded.error",
+                    (url, name, now, status, error))
+            else:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO feeds (url, name, etag, last_modified, fetched_at, status, error) "
+                    "VALUES (?, ?, ?, ?, ?, ?, NULL)",
+                    (url, name, etag, last_modified, now, status))
+                if entries is not None:
+                    self.conn.execute("DELETE FROM entries WHERE feed_url = ?", (url,))
+                    self.conn.executemany(
+                        "INSERT INTO entries (feed_url, position, title, link, summary, date) VALUES (?, ?, ?, ?, ?, ?)",
+                        [(url, i, e["title"], e["link"], e["summary"], e["date"]) for i, e in enumerate(entries)])
+            self.conn.commit()
+
+    def entry_count(self, url):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM entries WHERE feed_url = ?", (url,)).fetchone()[0]
+
+    def refresh(self, feeds, max_age=FEED_MAX_AGE, budget=REFRESH_BUDGET):
+        """
+        并发刷新 {名称: URL} 中超过 max_age 未抓取的源（max_age=0 时全部刷新）。
+        返回 {名称: {"status", "entries", "error"}}，status 为 HTTP 状态码、"fresh"（未请求）或 None（失败）。
+        """
+        results = {}
+        stale = {}
+        now = time.time()
+        for name, url in feeds.items():
+            state = self._state(url)
+            if state and max_age and state[2] and now - state[2] < max_age:
+                results[name] = {"status": "fresh", "entries": self.entry_count(url), "error": None}
+            else:
+                stale[name] = (url, state[0] if state else None, state[1] if state else None)
+
+        if not stale:
+            return results
+
+        executor = ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(stale)))
+        futures = {executor.submit(self.fetch, url, etag, modified): name
+                   for name, (url, etag, modified) in stale.items()}
+        try:
+            for future in as_completed(futures, timeout=budget):
+                name = futures[future]
+                url = stale[name][0]
+                try:
+                    status, entries, etag, modified = future.result()
+                    if entries is not None and not entries:
+                        raise ValueError("no entries")
+                    self._record(name, url, status, entries, etag, modified)
+                    results[name] = {"status": status, "entries": self.entry_count(url), "error": None}
+                except (requests.RequestException, ValueError) as e:
+                    status = getattr(getattr(e, "response", None), "status_code", None)
+                    self._record(name, url, status, None, None, None, error=str(e)[:200])
+                    results[name] = {"status": None, "entries": self.entry_count(url), "error": str(e)[:200]}
+        except FuturesTimeout:
+            for future, name in futures.items():
+                if name not in results:
+                    results[name] = {"status": None, "entries": self.entry_count(stale[name][0]),
+                                     "error": f"timed out after {budget}s"}
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    def items(self, feeds, per_feed=3):
+        """各源最新的 per_feed 条条目（含 source 字段）"""
+        names = {url: name for name, url in feeds.items()}
+        if not names:
+            return []
+        placeholders = ",".join("?" * len(names))
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT feed_url, title, link, summary, date FROM entries "
+                f"WHERE feed_url IN ({placeholders}) AND position < ? ORDER BY feed_url, position",
+                list(names) + [per_feed]).fetchall()
+        return [{"source": names[url], "title": title, "link": link, "summary": summary, "date": date}
+                for url, title, link, summary, date in rows]
+
+
+_store = None
+
+
+def get_feed_store():
+    global _store
+    if _store is None:
+        _store = FeedStore()
+    return _store
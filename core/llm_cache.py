@@ -0,0 +1,148 @@
+"""
+Clawtter - LLM 响应缓存
+对“输入相同、输出即可复用”的子任务（常识校验、时间线审计、同一天的总结）缓存模型回复：
+- 键：sha256(模型, system prompt, prompt, 温度档位)
+- 每个调用点各自的 TTL（CACHE_TTLS），过期条目读取时视为未命中
+- 超过 MAX_ENTRIES 时按最近使用时间淘汰（LRU）
+- SQLite 存储，放在渲染缓存目录（paths.cache_dir）下，cron 任务重叠运行时也能共享
+创作类生成默认不缓存：只有显式传入 site 的调用才会读写缓存；CLAWTTER_LLM_CACHE=0 可整体关闭。
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from core.utils_security import load_config, resolve_path
+
+MAX_ENTRIES = 2000
+DEFAULT_TTL = 3600
+
+# 各调用点的缓存有效期（秒）
+CACHE_TTLS = {
+    "sanity_check": 3600,
+    "nutritional_audit": 6 * 3600,
+    "daily_summary": 24 * 3600,
+}
+
+ENABLED = os.environ.get("CLAWTTER_LLM_CACHE", "1") != "0"
+
+
+def default_db_path():
+    config = load_config()
+    return resolve_path(config["paths"].get("cache_dir", "./.cache")) / "llm-cache.sqlite3"
+
+
+def temperature_bucket(temperature):
+    """温度按 0.1 分档，避免 0.7 / 0.70000001 这类差异导致未命中"""
+    return None if temperature is None else round(float(temperature), 1)
+
+
+def cache_key(model, system_prompt, prompt, temperature=None):
+    payload = json.dumps([model, system_prompt or "", prompt, temperature_bucket(temperature)],
+                         ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """SQLite 中的 (键 -> 回复) 表，带过期时间与 LRU 淘汰"""
+
+    def __init__(self, db_path=None, max_entries=MAX_ENTRIES):
+        self.db_path = Path(db_path or default_db_path())
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                site TEXT,
+                content TEXT NOT NULL,
+                model TEXT,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used)")
+        self.conn.commit()
+
+    def get(self, key):
+        """返回 (content, model)；不存在或已过期时返回 None"""
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT content, model, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or row[2] < now:
+                self.misses += 1
+                return None
+            self.conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+            self.hits += 1
+            return row[0], row[1]
+
+    def put(self, key, content, model=None, site=None, ttl=DEFAULT_TTL):
+        now = time.time()
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, site, content, model, created_at, expires_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, site, content, model, now, now + ttl, now))
+            self._evict(now)
+            self.conn.commit()
+
+    def _evict(self, now):
+        self.conn.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+        self.conn.execute("""
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?
+            )
+        """, (self.max_entries,))
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+_cache = None
+
+
+def get_response_cache():
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache()
+    return _cache
+
+
+def cached_completion(site, model, system_prompt, prompt, compute, temperature=None, ttl=None):
+    """
+    带缓存的模型调用：compute() 返回 (content, model_name)。
+    命中时直接返回缓存；只缓存非空回复。site 为 None 或缓存关闭时直接调用 compute。
+    """
+    if site is None or not ENABLED:
+        return compute()
+
+    try:
+        cache = get_response_cache()
+        key = cache_key(model, system_prompt, prompt, temperature)
+        cached = cache.get(key)
+    except sqlite3.Error as e:
+        print(f"⚠️ LLM cache unavailable: {e}")
+        return compute()
+
+    if cached is not None:
+        print(f"♻️ LLM cache hit ({site})")
+        return cached
+
+    content, model_name = compute()
+    if content:
+        try:
+            cache.put(key, content, model_name, site, CACHE_TTLS.get(site, DEFAULT_TTL) if ttl is None else ttl)
+        except sqlite3.Error as e:
+            print(f"⚠️ Failed to store LLM response: {e}")
+    return content, model_name
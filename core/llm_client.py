@@ -0,0 +1,130 @@
+"""
+Clawtter - LLM HTTP 客户端
+- openclaw.json 只解析一次，文件 mtime 变化时自动重新加载；其路径只从 config.json 读取一次
+- 每个 API 主机一个长连接 requests.Session（复用 TCP/TLS 连接）
+- 带重试/退避的 POST，所有尝试共用一个总超时预算
+"""
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.utils_security import load_config, resolve_path
+
+# 遇到这些状态码时重试（限流 / 服务端错误）
+RETRY_STATUS = {429, 500, 502, 503, 504}
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 8.0
+POOL_SIZE = 8
+
+_lock = threading.Lock()
+_config_cache = {}
+_sessions = {}
+_openclaw_path = None
+
+
+def openclaw_config_path():
+    """openclaw.json 的位置（首次调用时从 config.json 读取，之后复用）"""
+    global _openclaw_path
+    if _openclaw_path is None:
+        config = load_config()
+        _openclaw_path = resolve_path(config["paths"].get("openclaw_config", "~/.openclaw/openclaw.json"))
+    return _openclaw_path
+
+
+def load_openclaw_config(path=None):
+    """
+    读取 openclaw.json（按 mtime 缓存解析结果），文件不存在或无法解析时返回 {}。
+    返回的 dict 为共享缓存，调用方不要修改。
+    """
+    path = str(path or openclaw_config_path())
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+
+    with _lock:
+        cached = _config_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Failed to load {path}: {e}")
+        return {}
+
+    with _lock:
+        _config_cache[path] = (mtime, data)
+    return data
+
+
+def provider_config(name):
+    """models.providers 中某个 provider 的配置（不存在时返回 {}）"""
+    return load_openclaw_config().get("models", {}).get("providers", {}).get(name, {})
+
+
+def get_session(url):
+    """按 scheme://host 复用的长连接 Session"""
+    parts = urlsplit(url)
+    key = f"{parts.scheme}://{parts.netloc}"
+    with _lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+            session.mount(key, adapter)
+            _sessions[key] = session
+        return session
+
+
+def post_json(url, payload, headers=None, api_key=None, budget=60, retries=2):
+    """
+    POST JSON，连接错误 / 超时 / RETRY_STATUS 时退避重试，所有尝试总耗时不超过 budget 秒。
+    返回最后一次的 Response；预算耗尽仍未得到响应时抛出最后一次的异常。
+    """
+    headers = dict(headers or {})
+    headers.setdefault("Content-Type", "application/json")
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+
+    session = get_session(url)
+    deadline = time.monotonic() + budget
+    attempt = 0
+    while True:
+        remaining = deadline - time.monotonic()
+        try:
+            response = session.post(url, headers=headers, json=payload, timeout=max(remaining, 1))
+            if response.status_code not in RETRY_STATUS:
+                return response
+            error = None
+        except (requests.ConnectionError, requests.Timeout) as e:
+            response, error = None, e
+
+        delay = min(BACKOFF_BASE * 2 ** attempt, BACKOFF_MAX)
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+        attempt += 1
+        if attempt > retries or time.monotonic() + delay >= deadline:
+            if error is not None:
+                raise error
+            return response
+        time.sleep(delay)
+
+
+def chat_completion(url, payload, api_key=None, budget=60, retries=2):
+    """
+    OpenAI 风格的 chat/completions 调用，返回回复文本；非 200 时打印状态码并返回 None
+    """
+    response = post_json(url, payload, api_key=api_key, budget=budget, retries=retries)
+    if response.status_code != 200:
+        print(f"⚠️ LLM API error {response.status_code}: {response.text[:100]}")
+        return None
+    return response.json()['choices'][0]['message']['content'].strip()
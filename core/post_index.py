@@ -0,0 +1,415 @@
+"""
+Clawtter - 推文索引（SQLite）
+为代理脚本提供按日期 / 后缀 / 月日等维度的索引查询，避免每次检查都遍历整个
+posts 目录并读取全部 Markdown 文件。
+
+- 写入：create_post 写完文件后调用 add()；其他脚本直接写入的文件由 sync()
+  按 mtime + size 对账补齐（只读取变化的文件）
+- 查询：posts_on / by_suffix / random_post / on_this_day / modified_since / search
+- 去重：find_duplicates（规范化正文摘要 + SimHash 分段索引，见 core/content_dedup.py）
+- 全文检索：FTS5（优先 trigram 分词器，支持中日文子串；不可用时退化为 LIKE）
+"""
+import hashlib
+import os
+import re
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from core.content_dedup import NEAR_DUP_DISTANCE, hamming_distance, signature, simhash_bands
+from core.utils_security import load_config, resolve_path
+
+# 表结构变化时递增，旧索引会被整体重建
+SCHEMA_VERSION = 3
+
+# 文件名格式：2026-02-15-103000-hacker-news.md
+FILENAME_RE = re.compile(r'^\d{4}-\d{2}-\d{2}-\d{6}-(.+)\.md$')
+# 目录格式：posts/2026/02/15/xxx.md
+PATH_DATE_RE = re.compile(r'(\d{4})/(\d{2})/(\d{2})/[^/]+$')
+
+
+def default_db_path(posts_dir):
+    """索引文件默认放在渲染缓存目录（paths.cache_dir）下，按 posts 目录区分"""
+    config = load_config()
+    tag = hashlib.sha1(str(posts_dir).encode('utf-8')).hexdigest()[:8]
+    return resolve_path(config["paths"].get("cache_dir", "./.cache")) / f"post-index-{tag}.sqlite3"
+
+
+def get_page_day(filepath, metadata):
+    """推文所在日期页的日期键，规则与 tools/render.py 中 Post.get_time()[:10] 一致"""
+    time_str = metadata.get('time')
+    date_str = metadata.get('date')
+    if date_str is not None and time_str is not None:
+        value = f"{date_str} {time_str}" if ':' in time_str and '-' not in time_str else time_str
+    elif time_str is not None:
+        value = time_str
+    elif date_str is not None:
+        value = date_str
+    else:
+        m = re.search(r'(\d{4}-\d{2}-\d{2})', filepath.name)
+        value = m.group(1) if m else ""
+    return value[:10]
+
+
+def parse_post_file(filepath, content):
+    """从文件路径与内容中提取索引字段"""
+    filepath = Path(filepath)
+    time_str = ""
+    tags = None
+    text = content
+    metadata = {}
+
+    if content.startswith('---'):
+        parts = content.split('---', 2)
+        if len(parts) >= 3:
+            text = parts[2]
+            for line in parts[1].strip().split('\n'):
+                key, sep, value = line.partition(':')
+                if not sep:
+                    continue
+                key = key.strip()
+                metadata[key] = value.strip()
+                if key == 'time':
+                    time_str = value.strip()
+                elif key == 'tags':
+                    tags = value.strip()
+
+    day = time_str[:10] if re.match(r'\d{4}-\d{2}-\d{2}', time_str) else ""
+    if not day:
+        m = PATH_DATE_RE.search(filepath.as_posix())
+        if m:
+            day = f"{m.group(1)}-{m.group(2)}-{m.group(3)}"
+
+    m = FILENAME_RE.match(filepath.name)
+    digest, sim = signature(text)
+    return {
+        'time': time_str,
+        'day': day,
+        'page_day': get_page_day(filepath, metadata),
+        'month_day': day[5:],
+        'suffix': m.group(1) if m else "",
+        'tags': tags or "",
+        # 与旧逻辑一致：取最后一个 '---' 之后的内容作为正文
+        'body': content.split('---')[-1].strip(),
+        'content': content,
+        'digest': digest,
+        'simhash': sim,
+    }
+
+
+class PostIndex:
+    """posts 目录的 SQLite 索引"""
+
+    def __init__(self, posts_dir, db_path=None):
+        self.posts_dir = Path(posts_dir)
+        self.db_path = Path(db_path) if db_path else default_db_path(self.posts_dir)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # 允许在多线程服务器中使用（调用方负责串行化访问）
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.fts = None
+        self._synced = False
+        self._init_schema()
+
+    # ------------------------------------------------------------------
+    # 表结构
+    # ------------------------------------------------------------------
+    def _init_schema(self):
+        conn = self.conn
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+
+        if meta.get('schema') != str(SCHEMA_VERSION) or meta.get('posts_dir') != str(self.posts_dir):
+            # 版本或 posts 目录变化：整体重建
+            conn.execute("DROP TABLE IF EXISTS posts_fts")
+            conn.execute("DROP TABLE IF EXISTS posts")
+            conn.execute("DELETE FROM meta")
+            meta = {}
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS posts (
+                id INTEGER PRIMARY KEY,
+                path TEXT UNIQUE NOT NULL,
+                name TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                time TEXT,
+                day TEXT,
+                page_day TEXT,
+                month_day TEXT,
+                suffix TEXT,
+                tags TEXT,
+                body TEXT,
+                content TEXT,
+                digest TEXT,
+                simhash TEXT,
+                sim0 INTEGER,
+                sim1 INTEGER,
+                sim2 INTEGER,
+                sim3 INTEGER
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_day ON posts(day)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_page_day ON posts(page_day)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_month_day ON posts(month_day)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_suffix ON posts(suffix)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_mtime ON posts(mtime_ns)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_digest ON posts(digest)")
+        for band in range(4):
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_posts_sim{band} ON posts(sim{band})")
+
+        self.fts = meta.get('fts')
+        if self.fts is None:
+            self.fts = self._create_fts()
+
+        conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", [
+            ('schema', str(SCHEMA_VERSION)),
+            ('posts_dir', str(self.posts_dir)),
+            ('fts', self.fts),
+        ])
+        conn.commit()
+
+    def _create_fts(self):
+        """创建 FTS5 外部内容表，返回所用分词器名（FTS5 不可用时返回空字符串）"""
+        for tokenizer in ("trigram", "unicode61"):
+            try:
+                self.conn.execute(
+                    "CREATE VIRTUAL TABLE posts_fts USING fts5("
+                    f"body, content='posts', content_rowid='id', tokenize='{tokenizer}')"
+                )
+                return tokenizer
+            except sqlite3.OperationalError:
+                continue
+        print("⚠️ SQLite FTS5 unavailable, post search falls back to LIKE")
+        return ""
+
+    # ------------------------------------------------------------------
+    # 写入
+    # ------------------------------------------------------------------
+    def _upsert(self, filepath, st):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
+        fields = parse_post_file(filepath, content)
+        key = str(filepath)
+
+        self._delete(key)
+        cur = self.conn.execute(
+            "INSERT INTO posts (path, name, mtime_ns, size, time, day, page_day, month_day, suffix, tags, body, "
+            "content, digest, simhash, sim0, sim1, sim2, sim3) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, Path(filepath).name, st.st_mtime_ns, st.st_size, fields['time'], fields['day'],
+             fields['page_day'], fields['month_day'], fields['suffix'], fields['tags'], fields['body'], content,
+             # SQLite INTEGER 为有符号 64 位，SimHash 以十六进制文本保存
+             fields['digest'], f"{fields['simhash']:016x}", *simhash_bands(fields['simhash']))
+        )
+        if self.fts:
+            self.conn.execute("INSERT INTO posts_fts (rowid, body) VALUES (?, ?)",
+                              (cur.lastrowid, fields['body']))
+
+    def _delete(self, key):
+        row = self.conn.execute("SELECT id, body FROM posts WHERE path = ?", (key,)).fetchone()
+        if row is None:
+            return
+        if self.fts:
+            self.conn.execute("INSERT INTO posts_fts (posts_fts, rowid, body) VALUES ('delete', ?, ?)",
+                              (row['id'], row['body']))
+        self.conn.execute("DELETE FROM posts WHERE id = ?", (row['id'],))
+
+    def add(self, filepath):
+        """登记（或刷新）单个推文文件，供 create_post 写入后调用"""
+        filepath = Path(filepath)
+        try:
+            self._upsert(filepath, os.stat(filepath))
+            self.conn.commit()
+        except OSError as e:
+            print(f"⚠️ Failed to index {filepath.name}: {e}")
+
+    def remove(self, filepath):
+        """移除单个推文文件的索引"""
+        self._delete(str(filepath))
+        self.conn.commit()
+
+    def sync(self, force=False):
+        """
+        与磁盘对账：只 stat 全部文件，读取 mtime / size 变化的文件，删除已不存在的条目。
+        同一个实例默认只对账一次（代理脚本每次运行都是短进程），force=True 时强制重新对账。
+        返回 (新增或更新数, 删除数)
+        """
+        if self._synced and not force:
+            return 0, 0
+
+        start = time.time()
+        known = {
+            row['path']: (row['mtime_ns'], row['size'])
+            for row in self.conn.execute("SELECT path, mtime_ns, size FROM posts")
+        }
+        updated = 0
+        seen = set()
+
+        if self.posts_dir.exists():
+            for filepath in self.posts_dir.rglob('*.md'):
+                key = str(filepath)
+                try:
+                    st = filepath.stat()
+                except OSError:
+                    continue
+                seen.add(key)
+                if known.get(key) == (st.st_mtime_ns, st.st_size):
+                    continue
+                try:
+                    self._upsert(filepath, st)
+                    updated += 1
+                except (OSError, UnicodeDecodeError) as e:
+                    print(f"⚠️ Failed to index {filepath.name}: {e}")
+
+        removed = 0
+        for key in set(known) - seen:
+            self._delete(key)
+            removed += 1
+
+        self.conn.commit()
+        self._synced = True
+        if updated or removed:
+            print(f"🗂️ Post index synced: {updated} updated, {removed} removed ({time.time() - start:.2f}s)")
+        return updated, removed
+
+    # ------------------------------------------------------------------
+    # 查询（查询前自动对账一次）
+    # ------------------------------------------------------------------
+    def _query(self, sql, params=()):
+        self.sync()
+        return self.conn.execute(sql, params).fetchall()
+
+    def posts_on(self, day, contains=None, exclude=None):
+        """
+        某天（YYYY-MM-DD 或 datetime）的推文，可按原文子串过滤：
+        contains 必须出现、exclude 不得出现（大小写敏感，与旧的 `in` 判断一致）
+        """
+        if isinstance(day, datetime):
+            day = day.strftime("%Y-%m-%d")
+        sql = "SELECT * FROM posts WHERE day = ?"
+        params = [day]
+        if contains:
+            sql += " AND instr(content, ?) > 0"
+            params.append(contains)
+        if exclude:
+            sql += " AND instr(content, ?) = 0"
+            params.append(exclude)
+        return self._query(sql + " ORDER BY time, path", params)
+
+    def paths(self):
+        """全部推文文件路径"""
+        return [row['path'] for row in self._query("SELECT path FROM posts ORDER BY path")]
+
+    def page_days(self):
+        """渲染器日期页的日期键列表（降序，与 tools/render.py 的分页一致）"""
+        return [row['page_day'] for row in
+                self._query("SELECT DISTINCT page_day FROM posts WHERE page_day != '' ORDER BY page_day DESC")]
+
+    def posts_on_page(self, page_day):
+        """归属于某个日期页的推文"""
+        return self._query("SELECT * FROM posts WHERE page_day = ? ORDER BY path DESC", (page_day,))
+
+    def by_name(self, name):
+        """按文件名（含 .md）查找推文，未找到返回 None"""
+        rows = self._query("SELECT * FROM posts WHERE name = ? ORDER BY path LIMIT 1", (name,))
+        return rows[0] if rows else None
+
+    def by_suffix(self, suffix, day=None):
+        """按文件名后缀（如 hacker-news、rss、daily-summary）查询，可限定日期"""
+        sql = "SELECT * FROM posts WHERE suffix = ?"
+        params = [suffix]
+        if day:
+            sql += " AND day = ?"
+            params.append(day)
+        return self._query(sql + " ORDER BY time, path", params)
+
+    def random_post(self, older_than_days=None, month=None, exclude_name=None):
+        """
+        随机取一条推文：
+        older_than_days 只取 N 天之前的推文；month（YYYY-MM）限定月份；
+        exclude_name 排除文件名包含该字符串的文件（如 summary）
+        """
+        sql = "SELECT * FROM posts WHERE 1 = 1"
+        params = []
+        if older_than_days is not None:
+            cutoff = (datetime.now() - timedelta(days=older_than_days)).strftime("%Y-%m-%d")
+            sql += " AND day < ?"
+            params.append(cutoff)
+        if month:
+            sql += " AND substr(day, 1, 7) = ?"
+            params.append(month)
+        if exclude_name:
+            sql += " AND instr(name, ?) = 0"
+            params.append(exclude_name)
+        rows = self._query(sql + " ORDER BY random() LIMIT 1", params)
+        return rows[0] if rows else None
+
+    def on_this_day(self, when=None, years=5):
+        """往年今日：过去 years 年中与 when 同月同日的推文"""
+        when = when or datetime.now()
+        first_year = str(when.year - years)
+        this_year = str(when.year)
+        return self._query(
+            "SELECT * FROM posts WHERE month_day = ? AND substr(day, 1, 4) >= ? AND substr(day, 1, 4) < ? "
+            "ORDER BY day, path",
+            (when.strftime("%m-%d"), first_year, this_year)
+        )
+
+    def modified_since(self, since, exclude_name=None):
+        """文件修改时间晚于 since（datetime）的推文"""
+        sql = "SELECT * FROM posts WHERE mtime_ns > ?"
+        params = [int(since.timestamp() * 1_000_000_000)]
+        if exclude_name:
+            sql += " AND instr(name, ?) = 0"
+            params.append(exclude_name)
+        return self._query(sql + " ORDER BY mtime_ns DESC", params)
+
+    def search(self, query, limit=20):
+        """全文检索正文，按相关度返回"""
+        if self.fts and (self.fts != "trigram" or len(query) >= 3):
+            phrase = '"' + query.replace('"', '""') + '"'
+            return self._query(
+                "SELECT posts.* FROM posts_fts JOIN posts ON posts.id = posts_fts.rowid "
+                "WHERE posts_fts MATCH ? ORDER BY rank LIMIT ?",
+                (phrase, limit)
+            )
+        return self._query(
+            "SELECT * FROM posts WHERE instr(body, ?) > 0 ORDER BY time DESC LIMIT ?",
+            (query, limit)
+        )
+
+    def find_duplicates(self, text, max_distance=NEAR_DUP_DISTANCE):
+        """
+        在整个归档中查找与 text（推文正文）重复的推文，供 create_post 写入前检查。
+        返回 (正文摘要, [(row, 汉明距离)])，按距离升序；row['digest'] 与正文摘要相同即精确重复
+        """
+        digest, value = signature(text)
+        bands = simhash_bands(value)
+        rows = self._query(
+            "SELECT * FROM posts WHERE digest = ? OR sim0 = ? OR sim1 = ? OR sim2 = ? OR sim3 = ?",
+            (digest, *bands)
+        )
+        matches = []
+        for row in rows:
+            distance = 0 if row['digest'] == digest else hamming_distance(value, int(row['simhash'], 16))
+            if distance <= max_distance:
+                matches.append((row, distance))
+        matches.sort(key=lambda m: (m[1], m[0]['digest'] != digest, m[0]['path']))
+        return digest, matches
+
+    def close(self):
+        self.conn.close()
+
+
+_INDEXES = {}
+
+
+def get_post_index(posts_dir):
+    """按 posts 目录复用同一个索引实例（同一进程内只对账一次）"""
+    key = str(Path(posts_dir))
+    if key not in _INDEXES:
+        _INDEXES[key] = PostIndex(posts_dir)
+    return _INDEXES[key]
@@ -0,0 +1,134 @@
+"""
+Clawtter - 已处理条目记录
+各监控 agent（twitter_monitor / moltbook_observer / human_twitter_monitor）共用的“看过 / 处理过”ID 表：
+- SQLite 表 (namespace, item_id, seen_at)，主键查询 O(1) 量级，不需要把整张表读进内存
+- 每个 namespace 按写入时间保留最近 NAMESPACE_LIMITS 条（环形缓冲），并丢弃超过 MAX_AGE_DAYS 的记录
+- 最近的条目始终精确判重；旧版 JSON 状态文件中的 ID 列表首次运行时导入
+存放在 paths.memory_dir 下（与各 agent 的状态文件放在一起，清理缓存不会丢失）
+"""
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from core.utils_security import load_config, resolve_path
+
+DEFAULT_LIMIT = 1000
+MAX_AGE_DAYS = 30
+
+# 各 namespace 保留的条数
+NAMESPACE_LIMITS = {
+    "twitter_monitor:processed": 1000,
+    "twitter_monitor:timeline": 3000,
+    "moltbook_observer:seen": 500,
+    "human_twitter_monitor:handled": 200,
+}
+
+
+def default_db_path():
+    config = load_config()
+    return resolve_path(config["paths"].get("memory_dir", "~/.openclaw/workspace/memory")) / "seen-items.sqlite3"
+
+
+class SeenStore:
+    """按 namespace 划分的已处理 ID 表"""
+
+    def __init__(self, db_path=None):
+        self.db_path = Path(db_path or default_db_path())
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen (
+                namespace TEXT NOT NULL,
+                item_id TEXT NOT NULL,
+                seen_at REAL NOT NULL,
+                PRIMARY KEY (namespace, item_id)
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_age ON seen(namespace, seen_at)")
+        self.conn.commit()
+
+    def contains(self, namespace, item_id):
+        with self.lock:
+            row = self.conn.execute("SELECT 1 FROM seen WHERE namespace = ? AND item_id = ?",
+                                    (namespace, str(item_id))).fetchone()
+        return row is not None
+
+    def add(self, namespace, item_ids, seen_at=None):
+        """记录一批 ID（已存在的刷新时间），随后按上限裁剪"""
+        now = time.time() if seen_at is None else seen_at
+        rows = [(namespace, str(i), now) for i in item_ids if i]
+        if not rows:
+            return
+        with self.lock:
+            self.conn.executemany("INSERT OR REPLACE INTO seen (namespace, item_id, seen_at) VALUES (?, ?, ?)", rows)
+            self._prune(namespace)
+            self.conn.commit()
+
+    def _prune(self, namespace):
+        limit = NAMESPACE_LIMITS.get(namespace, DEFAULT_LIMIT)
+        self.conn.execute("DELETE FROM seen WHERE namespace = ? AND seen_at < ?",
+                          (namespace, time.time() - MAX_AGE_DAYS * 86400))
+        self.conn.execute("""
+            DELETE FROM seen WHERE namespace = ? AND item_id IN (
+                SELECT item_id FROM seen WHERE namespace = ?
+                ORDER BY seen_at DESC, rowid DESC LIMIT -1 OFFSET ?
+            )
+        """, (namespace, namespace, limit))
+
+    def count(self, namespace):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM seen WHERE namespace = ?", (namespace,)).fetchone()[0]
+
+    def import_legacy(self, namespace, item_ids):
+        """导入旧状态文件中的 ID 列表（namespace 为空时才导入），返回导入条数"""
+        item_ids = [i for i in (item_ids or []) if i]
+        if not item_ids or self.count(namespace):
+            return 0
+        # 旧列表的顺序不可靠，统一记为一天前，新记录总是排在它们之后
+        self.add(namespace, item_ids, seen_at=time.time() - 86400)
+        return len(item_ids)
+
+    def view(self, namespace):
+        return SeenSet(self, namespace)
+
+
+class SeenSet:
+    """某个 namespace 的集合视图：支持 `id in seen` 与 seen.add(id)，写入立即落盘"""
+
+    def __init__(self, store, namespace):
+        self.store = store
+        self.namespace = namespace
+
+    def __contains__(self, item_id):
+        return bool(item_id) and self.store.contains(self.namespace, item_id)
+
+    def add(self, item_id):
+        self.store.add(self.namespace, [item_id])
+
+    def update(self, item_ids):
+        self.store.add(self.namespace, list(item_ids))
+
+    def __len__(self):
+        return self.store.count(self.namespace)
+
+
+_store = None
+
+
+def get_seen_store():
+    global _store
+    if _store is None:
+        _store = SeenStore()
+    return _store
+
+
+def seen_set(namespace, legacy_ids=None):
+    """取得某个 namespace 的集合视图，并导入旧状态文件中的 ID"""
+    store = get_seen_store()
+    imported = store.import_legacy(namespace, legacy_ids)
+    if imported:
+        print(f"📥 Imported {imported} legacy ids into {namespace}")
+    return store.view(namespace)
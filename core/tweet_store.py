@@ -0,0 +1,217 @@
+"""
+Clawtter - 共享推文存储
+所有读取 bird-x 时间线的 agent 共用一个 SQLite 推文库（按推文 ID 去重）：
+- 每个来源（home / user:<用户名>）记录上次抓取时间与条数
+- 上次抓取仍在有效期内且条数足够时直接从库中返回，不启动 bird-x
+- 过期时重新抓取并按 ID 合并（bird-x 没有 since_id 参数，增量体现在只插入新推文）
+- 抓取时持有文件锁：cron 任务同时触发时只有一个真正调用 bird-x，其余等待后读库
+- 常驻 worker（core/bird_worker.py）运行时经由它抓取，否则直接启动 bird-x
+"""
+import fcntl
+import json
+import shutil
+import sqlite3
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from core.bird_worker import WorkerUnavailable, split_count, stream_tweets
+from core.utils_security import load_config, resolve_path
+
+LEGACY_CLI = "/home/tetsuya/.local/bin/bird-x"
+CLI_TIMEOUT = 30
+
+# 各来源的缓存有效期（秒）
+HOME_MAX_AGE = 15 * 60
+USER_MAX_AGE = 10 * 60
+# 库中保留的推文天数
+RETENTION_DAYS = 7
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tweets (
+    id TEXT PRIMARY KEY,
+    created_at REAL,
+    author TEXT,
+    raw TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS appearances (
+    source TEXT NOT NULL,
+    tweet_id TEXT NOT NULL,
+    PRIMARY KEY (source, tweet_id)
+);
+CREATE TABLE IF NOT EXISTS fetches (
+    source TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    count INTEGER,
+    newest_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tweets_created ON tweets(created_at);
+"""
+
+
+def twitter_cli():
+    """bird-x 路径：config.json 的 social.twitter.cli_command，找不到时使用原来的固定路径"""
+    config = load_config()
+    command = config.get("social", {}).get("twitter", {}).get("cli_command")
+    if command:
+        found = shutil.which(command) or shutil.which(str(resolve_path(command)))
+        if found:
+            return found
+    return LEGACY_CLI
+
+
+def parse_twitter_time(time_str):
+    """解析 Twitter 时间字符串（Wed Feb 18 07:39:00 +0000 2026），失败返回 None"""
+    try:
+        time_str = time_str.replace('+0000 ', '')
+        dt = datetime.strptime(time_str, "%a %b %d %H:%M:%S %Y")
+        return dt.replace(tzinfo=timezone.utc)
+    except (AttributeError, ValueError):
+        return None
+
+
+def tweet_id(tweet):
+    return str(tweet.get('id') or tweet.get('id_str') or '')
+
+
+def fetch_cli(args):
+    """调用 bird-x 并解析 JSON 输出，失败时抛出 RuntimeError"""
+    result = subprocess.run(
+        [twitter_cli()] + list(args) + ["--json"],
+        capture_output=True,
+        text=True,
+        timeout=CLI_TIMEOUT
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"bird-x {' '.join(args)} failed: {result.stderr[:200]}")
+    tweets = json.loads(result.stdout)
+    return tweets if isinstance(tweets, list) else []
+
+
+def fetch_tweets(args):
+    """优先经由常驻 bird-x worker 抓取（只接收需要的条数），worker 未运行时直接调用 bird-x"""
+    _, count = split_count(args)
+    try:
+        return list(stream_tweets(args, limit=count))
+    except WorkerUnavailable:
+        return fetch_cli(args)
+
+
+def default_db_path():
+    config = load_config()
+    return resolve_path(config["paths"].get("cache_dir", "./.cache")) / "tweets.sqlite3"
+
+
+class TweetStore:
+    """推文库 + 抓取层"""
+
+    def __init__(self, db_path=None, fetcher=fetch_tweets):
+        self.db_path = Path(db_path or default_db_path())
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock_path = self.db_path.with_suffix('.lock')
+        self.fetcher = fetcher
+        self.lock = threading.Lock()
+        self.fetches = 0
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    @contextmanager
+    def _fetch_lock(self):
+        """跨进程的抓取锁"""
+        with self.lock, open(self.lock_path, 'w') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _is_fresh(self, source, count, max_age):
+        row = self.conn.execute(
+            "SELECT fetched_at, count FROM fetches WHERE source = ?", (source,)).fetchone()
+        return row is not None and time.time() - row[0] < max_age and (row[1] or 0) >= count
+
+    def _store(self, source, tweets, count):
+        now = time.time()
+        new = 0
+        for tweet in tweets:
+            tid = tweet_id(tweet)
+            if not tid:
+                continue
+            created = parse_twitter_time(tweet.get('createdAt', tweet.get('created_at', '')))
+            author_data = tweet.get('author', tweet.get('user', {})) or {}
+            author = (author_data.get('username') or author_data.get('screen_name') or '').lower()
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO tweets (id, created_at, author, raw, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (tid, created.timestamp() if created else None, author,
+                 json.dumps(tweet, ensure_ascii=False), now))
+            if cursor.rowcount:
+                new += 1
+            else:
+                # 已有的推文刷新内容（点赞数等可能变化）
+                self.conn.execute("UPDATE tweets SET raw = ?, fetched_at = ? WHERE id = ?",
+                                  (json.dumps(tweet, ensure_ascii=False), now, tid))
+            self.conn.execute("INSERT OR IGNORE INTO appearances (source, tweet_id) VALUES (?, ?)", (source, tid))
+
+        newest = tweet_id(tweets[0]) if tweets else None
+        self.conn.execute("INSERT OR REPLACE INTO fetches (source, fetched_at, count, newest_id) VALUES (?, ?, ?, ?)",
+                          (source, now, count, newest))
+        self._prune(now)
+        self.conn.commit()
+        return new
+
+    def _prune(self, now):
+        cutoff = now - RETENTION_DAYS * 86400
+        self.conn.execute("DELETE FROM tweets WHERE fetched_at < ?", (cutoff,))
+        self.conn.execute("DELETE FROM appearances WHERE tweet_id NOT IN (SELECT id FROM tweets)")
+
+    def _read(self, source, count, hours_back):
+        sql = ("SELECT t.raw FROM tweets t JOIN appearances a ON a.tweet_id = t.id "
+               "WHERE a.source = ?")
+        params = [source]
+        if hours_back is not None:
+            sql += " AND t.created_at >= ?"
+            params.append(time.time() - hours_back * 3600)
+        sql += " ORDER BY t.created_at DESC, length(t.id) DESC, t.id DESC LIMIT ?"
+        params.append(count)
+        return [json.loads(row[0]) for row in self.conn.execute(sql, params)]
+
+    def window(self, source, args, count, hours_back=None, max_age=HOME_MAX_AGE):
+        """
+        返回某来源最新的 count 条推文（hours_back 限定时间范围），新鲜时不调用 bird-x。
+        抓取失败时退回库中已有的推文。
+        """
+        with self._fetch_lock():
+            if not self._is_fresh(source, count, max_age):
+                try:
+                    tweets = self.fetcher(args)
+                    self.fetches += 1
+                    new = self._store(source, tweets, count)
+                    print(f"🐦 Fetched {source}: {len(tweets)} tweets ({new} new)")
+                except (RuntimeError, OSError, ValueError, subprocess.TimeoutExpired) as e:
+                    print(f"⚠️ Twitter fetch failed, using stored tweets: {e}")
+            return self._read(source, count, hours_back)
+
+    def home(self, count=20, hours_back=None, max_age=HOME_MAX_AGE):
+        """主页时间线"""
+        return self.window("home", ["home", "-n", str(count)], count, hours_back, max_age)
+
+    def user_tweets(self, username, count=10, hours_back=None, max_age=USER_MAX_AGE):
+        """某个用户的推文"""
+        return self.window(f"user:{username.lower()}", ["user-tweets", username, "-n", str(count)],
+                           count, hours_back, max_age)
+
+
+_store = None
+
+
+def get_tweet_store():
+    global _store
+    if _store is None:
+        _store = TweetStore()
+    return _store
@@ -1,6 +1,24 @@
 import requests
 import random
 import json
+import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+
+# 添加项目根目录到路径中以支持模块导入
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+from core.utils_security import load_config, resolve_path
+
+HN_API = 'https://hacker-news.firebaseio.com/v0'
+TIMEOUT = 10
+ITEM_WORKERS = 16
+# 条目缓存有效期（秒）：标题不会变，分数会变
+ITEM_TTL = 10 * 60
 
 INTEREST_KEYWORDS = [
     "ai", "llm", "gpt", "intelligence", "model", "neural",
@@ -9,48 +27,121 @@ INTEREST_KEYWORDS = [
     "japan", "tokyo", "tokio"
 ]
 
+_session = None
+
+
+def get_session():
+    """复用连接的 Session（并发抓取条目时共用连接池）"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=ITEM_WORKERS))
+    return _session
+
+
+class ItemCache:
+    """按 ID 缓存条目 JSON（SQLite，放在 paths.cache_dir 下）"""
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            config = load_config()
+            db_path = resolve_path(config["paths"].get("cache_dir", "./.cache")) / "hn-items.sqlite3"
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path), timeout=10)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, raw TEXT NOT NULL, fetched_at REAL NOT NULL)")
+
+    def get_many(self, ids, ttl=ITEM_TTL):
+        """返回 {id: item}，只包含未过期的条目"""
+        if not ids:
+            return {}
+        placeholders = ",".join("?" * len(ids))
+        rows = self.conn.execute(
+            f"SELECT id, raw FROM items WHERE id IN ({placeholders}) AND fetched_at >= ?",
+            list(ids) + [time.time() - ttl])
+        return {row[0]: json.loads(row[1]) for row in rows}
+
+    def put_many(self, items):
+        now = time.time()
+        self.conn.executemany("INSERT OR REPLACE INTO items (id, raw, fetched_at) VALUES (?, ?, ?)",
+                              [(item_id, json.dumps(item), now) for item_id, item in items.items()])
+        # 一天前的条目不再有用
+        self.conn.execute("DELETE FROM items WHERE fetched_at < ?", (now - 86400,))
+        self.conn.commit()
+
+
+def fetch_item(item_id):
+    resp = get_session().get(f'{HN_API}/item/{item_id}.json', timeout=TIMEOUT)
+    if resp.status_code != 200:
+        return None
+    return resp.json()
+
+
+def fetch_items(story_ids):
+    """
+    批量获取条目：先查缓存，未命中的并发请求。返回 {id: item}（失败的条目不包含在内）
+    """
+    try:
+        cache = ItemCache()
+        items = cache.get_many(story_ids)
+    except sqlite3.Error as e:
+        print(f"⚠️ HN item cache unavailable: {e}")
+        cache, items = None, {}
+
+    missing = [i for i in story_ids if i not in items]
+    if missing:
+        fetched = {}
+        with ThreadPoolExecutor(max_workers=min(ITEM_WORKERS, len(missing))) as executor:
+            for item_id, future in [(i, executor.submit(fetch_item, i)) for i in missing]:
+                try:
+                    item = future.result()
+                except (requests.RequestException, ValueError):
+                    continue
+                if item:
+                    fetched[item_id] = item
+        items.update(fetched)
+        if cache is not None and fetched:
+            try:
+                cache.put_many(fetched)
+            except sqlite3.Error as e:
+                print(f"⚠️ Failed to cache HN items: {e}")
+    return items
+
+
+def format_story(story_id, story):
+    return {
+        'source': 'Hacker News',
+        'title': story.get('title'),
+        'url': story.get('url', f"https://news.ycombinator.com/item?id={story_id}"),
+        'comments_url': f"https://news.ycombinator.com/item?id={story_id}",
+        'score': story.get('score', 0),
+        'author': story.get('by', 'unknown'),
+        'type': 'tech_news'
+    }
+
+
 def fetch_top_stories(limit=30):
     """
     获取 Hacker News 的热门文章，并筛选出感兴趣的。
     """
     try:
-        resp = requests.get('https://hacker-news.firebaseio.com/v0/topstories.json', timeout=10)
+        resp = get_session().get(f'{HN_API}/topstories.json', timeout=TIMEOUT)
         if resp.status_code != 200: return None
-        story_ids = resp.json()
-        
-        # 尝试寻找感兴趣的文章
-        for target_id in story_ids[:limit]:
-            story_url = f'https://hacker-news.firebaseio.com/v0/item/{target_id}.json'
-            story_resp = requests.get(story_url, timeout=10)
-            if story_resp.status_code != 200: continue
-            story = story_resp.json()
-            
-            title = story.get('title', '').lower()
+        story_ids = resp.json()[:limit]
+
+        # 一次并发取回前 limit 条，再对整批做关键词匹配（保持热度排名顺序）
+        stories = fetch_items(story_ids)
+        for target_id in story_ids:
+            title = stories.get(target_id, {}).get('title', '').lower()
             if any(kw in title for kw in INTEREST_KEYWORDS):
-                return {
-                    'source': 'Hacker News',
-                    'title': story.get('title'),
-                    'url': story.get('url', f"https://news.ycombinator.com/item?id={target_id}"),
-                    'comments_url': f"https://news.ycombinator.com/item?id={target_id}",
-                    'score': story.get('score', 0),
-                    'author': story.get('by', 'unknown'),
-                    'type': 'tech_news'
-                }
-        
+                return format_story(target_id, stories[target_id])
+
         # 如果前 limit 个都没有匹配，随机返回前 5 个之一作为兜底
-        target_id = random.choice(story_ids[:5])
-        story_resp = requests.get(f'https://hacker-news.firebaseio.com/v0/item/{target_id}.json')
-        story = story_resp.json()
-        return {
-            'source': 'Hacker News',
-            'title': story.get('title'),
-            'url': story.get('url', f"https://news.ycombinator.com/item?id={target_id}"),
-            'comments_url': f"https://news.ycombinator.com/item?id={target_id}",
-            'score': story.get('score', 0),
-            'author': story.get('by', 'unknown'),
-            'type': 'tech_news'
-        }
-        
+        fallback_ids = [i for i in story_ids[:5] if i in stories]
+        if not fallback_ids:
+            return None
+        target_id = random.choice(fallback_ids)
+        return format_story(target_id, stories[target_id])
+
     except Exception as e:
         print(f"Error fetching Hacker News: {e}")
         return None
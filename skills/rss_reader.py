@@ -1,15 +1,12 @@
 #!/usr/bin/env python3
 """
 RSS Reader Skill
-Fetches and parses RSS feeds from configured sources.
+Fetches and parses RSS feeds from configured sources (cached via core.feed_store).
 """
-import feedparser
 import random
-import requests
-from datetime import datetime
-import time
 
 from core.utils_security import load_config
+from core.feed_store import get_feed_store
 SEC_CONFIG = load_config()
 
 # 预定义的 RSS 源列表 (Tech & AI Focused) - Fallback
@@ -48,47 +45,20 @@ DEFAULT_RSS_FEEDS = {
 RSS_FEEDS = SEC_CONFIG.get("social", {}).get("rss_feeds", DEFAULT_RSS_FEEDS)
 
 def get_random_rss_item():
-    """随机从 RSS 列表中抓取一篇文章"""
-    
-    # 随机选择 3 个源进行尝试，避免每次都遍历所有导致太慢
-    feed_names = list(RSS_FEEDS.keys())
-    random.shuffle(feed_names)
-    selected_feeds = feed_names[:3]
-    
-    candidates = []
-    
-    for name in selected_feeds:
-        url = RSS_FEEDS[name]
-        try:
-            print(f"  📡 Fetching RSS: {name}...")
-            # Set a timeout to prevent hanging
-            feed = feedparser.parse(url)
-            
-            if feed.entries:
-                # 只取最近的 3 篇文章，保证时效性
-                entries = feed.entries[:3]
-                entry = random.choice(entries)
-                
-                # 提取必要信息
-                item = {
-                    "source": name,
-                    "title": entry.get('title', 'Unknown Title'),
-                    "link": entry.get('link', ''),
-                    "summary": entry.get('summary', entry.get('description', ''))[:300], # 截断
-                    "date": entry.get('published', entry.get('updated', ''))
-                }
-                
-                # 简单的有效性检查
-                if item['link'] and item['title']:
-                    candidates.append(item)
-                    
-        except Exception as e:
-            print(f"⚠️ Error fetching {name}: {e}")
-            continue
-    
+    """随机从 RSS 列表中挑选一篇文章（条目来自 core.feed_store 的缓存）"""
+    store = get_feed_store()
+
+    # 只请求超过有效期的源（并发 + 条件请求），新鲜时不访问网络
+    results = store.refresh(RSS_FEEDS)
+    fetched = sum(1 for r in results.values() if r["status"] not in ("fresh", None))
+    failed = [name for name, r in results.items() if r["error"]]
+    print(f"  📡 RSS: {len(RSS_FEEDS)} feeds, {fetched} refreshed, {len(failed)} failed")
+
+    # 每个源只取最近的 3 篇文章，保证时效性
+    candidates = [item for item in store.items(RSS_FEEDS, per_feed=3) if item['link'] and item['title']]
     if candidates:
         return random.choice(candidates)
-        
+
     return None
 
 if __name__ == "__main__":
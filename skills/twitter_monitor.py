@@ -13,7 +13,7 @@ import json
 import subprocess
 import re
 import random
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 import sys
 from pathlib import Path
@@ -22,6 +22,8 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 from core.utils_security import load_config, resolve_path
+from core.tweet_store import get_tweet_store
+from core.seen_store import seen_set
 
 # 加载安全配置
 SEC_CONFIG = load_config()
@@ -40,58 +42,25 @@ DISCUSSION_KEYWORDS = SOCIAL_CONFIG.get("monitored_keywords", ["AI", "OpenClaw",
 TWITTER_CLI = "/home/tetsuya/.local/bin/bird-x"
 
 def load_state():
-    """加载已处理的推文ID列表"""
+    """加载监控状态（已处理的推文 ID 在 core.seen_store 中）"""
     if STATE_FILE.exists():
         with open(STATE_FILE, 'r', encoding='utf-8') as f:
             return json.load(f)
     return {
-        "processed_ids": [], 
         "last_check": None,
-        "daily_summary_done": None,
-        "timeline_processed": []
+        "daily_summary_done": None
     }
 
 def save_state(state):
-    """保存已处理的推文ID列表"""
+    """保存监控状态"""
     STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(STATE_FILE, 'w', encoding='utf-8') as f:
         json.dump(state, f, indent=2, ensure_ascii=False)
 
-def parse_twitter_time(time_str):
-    """解析 Twitter 时间字符串"""
-    try:
-        from datetime import timezone
-        time_str = time_str.replace('+0000 ', '')
-        dt = datetime.strptime(time_str, "%a %b %d %H:%M:%S %Y")
-        return dt.replace(tzinfo=timezone.utc)
-    except:
-        return None
-
 def get_user_tweets(username=OWNER_USERNAME, count=10, hours_back=2):
     """获取用户的最新推文"""
     try:
-        result = subprocess.run(
-            [TWITTER_CLI, "user-tweets", username, "-n", str(count), "--json"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        if result.returncode == 0:
-            tweets = json.loads(result.stdout)
-            if not isinstance(tweets, list):
-                return []
-            
-            from datetime import timezone
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours_back)
-            
-            recent_tweets = []
-            for tweet in tweets:
-                created_at = tweet.get('createdAt', tweet.get('created_at', ''))
-                tweet_time = parse_twitter_time(created_at)
-                if tweet_time and tweet_time >= cutoff_time:
-                    recent_tweets.append(tweet)
-            
-            return recent_tweets
+        return get_tweet_store().user_tweets(username, count=count, hours_back=hours_back)
     except Exception as e:
         print(f"Error fetching user tweets: {e}")
     return []
@@ -99,28 +68,7 @@ def get_user_tweets(username=OWNER_USERNAME, count=10, hours_back=2):
 def get_home_timeline(count=20, hours_back=3):
     """获取主页时间线"""
     try:
-        result = subprocess.run(
-            [TWITTER_CLI, "home", "-n", str(count), "--json"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        if result.returncode == 0:
-            tweets = json.loads(result.stdout)
-            if not isinstance(tweets, list):
-                return []
-            
-            from datetime import timezone
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours_back)
-            
-            recent_tweets = []
-            for tweet in tweets:
-                created_at = tweet.get('createdAt', tweet.get('created_at', ''))
-                tweet_time = parse_twitter_time(created_at)
-                if tweet_time and tweet_time >= cutoff_time:
-                    recent_tweets.append(tweet)
-            
-            return recent_tweets
+        return get_tweet_store().home(count=count, hours_back=hours_back)
     except Exception as e:
         print(f"Error fetching timeline: {e}")
     return []
@@ -287,8 +235,9 @@ def main():
     print(f"\n🐦 Twitter Monitor Enhanced started at {datetime.now()}")
     
     state = load_state()
-    processed_ids = set(state.get("processed_ids", []))
-    timeline_processed = set(state.get("timeline_processed", []))
+    # 旧版状态文件中的 ID 列表首次运行时导入共享的已处理记录
+    processed_ids = seen_set("twitter_monitor:processed", state.pop("processed_ids", None))
+    timeline_processed = seen_set("twitter_monitor:timeline", state.pop("timeline_processed", None))
     
     results = {
         "user_tweets": 0,
@@ -395,16 +344,11 @@ def main():
                 results["timeline_summaries"] += 1
         
         # 标记所有处理过的推文
-        for t in timeline:
-            tid = t.get('id') or t.get('id_str')
-            if tid:
-                timeline_processed.add(tid)
+        timeline_processed.update(t.get('id') or t.get('id_str') for t in timeline)
     else:
         print(f"\n⏭️ Phase 2: Skipping timeline check (random skip)")
     
     # 保存状态
-    state["processed_ids"] = list(processed_ids)[-200:]  # 保留最近200条
-    state["timeline_processed"] = list(timeline_processed)[-500:]  # 保留更多时间线记录
     state["last_check"] = datetime.now().isoformat()
     save_state(state)
     
@@ -29,6 +29,17 @@ document.addEventListener('DOMContentLoaded', () => {
             }
         }
 
+        async function waitForJob(id) {
+            // The server deletes and re-renders in the background; poll until the job settles
+            for (;;) {
+                await new Promise(resolve => setTimeout(resolve, 300));
+                const res = await fetch(`/__jobs/${encodeURIComponent(id)}`, { cache: 'no-store' });
+                if (!res.ok) throw new Error(`HTTP ${res.status}`);
+                const job = await res.json();
+                if (job.status === 'done' || job.status === 'failed') return job;
+            }
+        }
+
         async function confirmDelete() {
             const file = pendingFile;
             if (!file) return;
@@ -37,7 +48,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 const res = await fetch('/__delete', {
                     method: 'POST',
                     headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ file })
+                    body: JSON.stringify({ files: [file] })
                 });
 
                 if (!res.ok) {
@@ -47,7 +58,19 @@ document.addEventListener('DOMContentLoaded', () => {
                     return;
                 }
 
-                window.location.reload();
+                const { job: jobId } = await res.json();
+                document.querySelectorAll(`.tweet-delete-btn[data-file="${CSS.escape(file)}"]`).forEach(btn => {
+                    const tweet = btn.closest('.tweet');
+                    if (tweet) tweet.style.display = 'none';
+                });
+                closeDeleteModal();
+
+                const job = await waitForJob(jobId);
+                if (job.status === 'failed' || job.errors.length) {
+                    alert(`Delete failed: ${job.errors.map(e => e.error).join(', ') || 'render error'}`);
+                }
+                // With live reload connected the render event refreshes the page by itself
+                if (!liveReload) window.location.reload();
             } catch (err) {
                 alert(`Delete failed: ${err}`);
                 closeDeleteModal();
@@ -136,12 +159,14 @@ document.addEventListener('DOMContentLoaded', () => {
             const rows = (data.results || []).map(r => {
                 const badgeClass = r.success ? 'ok' : 'fail';
                 const badgeText = r.success ? 'OK' : 'FAIL';
+                const stats = r.stats || {};
+                const latency = stats.p50 != null ? ` · p50 ${stats.p50.toFixed(2)}s / p95 ${stats.p95.toFixed(2)}s` : '';
                 return `
                     <tr>
                         <td>${r.provider}</td>
                         <td>${r.model}</td>
                         <td><span class="model-status-badge ${badgeClass}">${badgeText}</span></td>
-                        <td>${r.status}</td>
+                        <td>${r.status}${latency}</td>
                         <td>${r.response || ''}</td>
                     </tr>
                 `;
@@ -205,9 +230,9 @@ document.addEventListener('DOMContentLoaded', () => {
     const currentTagSpan = document.getElementById('currentTag');
     const clearFilterBtn = document.getElementById('clearFilter');
     const tweets = document.querySelectorAll('.tweet');
-    const tags = document.querySelectorAll('.tag');
 
     const searchInput = document.getElementById('searchInput');
+    const searchResults = document.getElementById('searchResults');
 
     function filterByTag(tagName) {
         const targetTag = tagName.toLowerCase();
@@ -224,13 +249,12 @@ document.addEventListener('DOMContentLoaded', () => {
         updateFilterUI(`#${tagName} (${count})`);
     }
 
-    function filterByTheme(themeName, tagsList) {
-        const targetTags = tagsList.split(',').map(t => t.trim().toLowerCase());
+    function filterByTheme(themeName, themeId) {
         let count = 0;
         tweets.forEach(tweet => {
-            const tweetTags = (tweet.getAttribute('data-tags') || "").toLowerCase().split(',');
-            const hasMatch = targetTags.some(t => tweetTags.includes(t));
-            if (hasMatch) {
+            // Theme membership is computed by the renderer (same source as the sidebar counts)
+            const tweetThemes = (tweet.getAttribute('data-themes') || "").split(',');
+            if (tweetThemes.includes(themeId)) {
                 tweet.style.display = 'block';
                 count++;
             } else {
@@ -292,39 +316,41 @@ document.addEventListener('DOMContentLoaded', () => {
         tweets.forEach(tweet => tweet.style.display = 'block');
         if (filterStatus) filterStatus.classList.remove('visible');
         if (searchInput) searchInput.value = '';
-        tags.forEach(t => t.classList.remove('active'));
+        hideSearchResults();
+        document.querySelectorAll('.tag').forEach(t => t.classList.remove('active'));
         document.querySelectorAll('.theme-card').forEach(c => c.classList.remove('active'));
     }
 
     // --- Event Listeners ---
     // Themes
-    const themeCards = document.querySelectorAll('.theme-card');
-    themeCards.forEach(card => {
+    function bindThemeCard(card) {
         card.addEventListener('click', () => {
             const themeName = card.querySelector('.theme-name').textContent;
-            const tagsList = card.getAttribute('data-tags');
-            filterByTheme(themeName, tagsList);
+            const themeId = card.getAttribute('data-theme');
+            filterByTheme(themeName, themeId);
             closeModal();
             // Highlight active card
-            themeCards.forEach(c => c.classList.remove('active'));
+            document.querySelectorAll('.theme-card').forEach(c => c.classList.remove('active'));
             card.classList.add('active');
         });
-    });
+    }
 
     // Tags
-    tags.forEach(tag => {
+    function bindTag(tag) {
         tag.addEventListener('click', (e) => {
             e.stopPropagation();
             const tagName = tag.getAttribute('data-tag');
             filterByTag(tagName);
             closeModal();
             // Highlight active tag
-            tags.forEach(t => t.classList.toggle('active', t.getAttribute('data-tag') === tagName));
+            document.querySelectorAll('.tag').forEach(t => t.classList.toggle('active', t.getAttribute('data-tag') === tagName));
         });
-    });
+    }
+
+    document.querySelectorAll('.tag').forEach(bindTag);
 
     // Archive (Calendar)
-    const archiveDays = window.__archiveDays || {};
+    let archiveDays = {};
     const calendarGrid = document.getElementById('calendarGrid');
     const calendarTitle = document.getElementById('calendarTitle');
     const calendarMonthFilter = document.getElementById('calendarMonthFilter');
@@ -394,20 +420,277 @@ document.addEventListener('DOMContentLoaded', () => {
         });
     }
 
-    document.querySelectorAll('.archive-month').forEach(item => {
+    function bindArchiveMonth(item) {
         item.addEventListener('click', () => {
             const monthKey = item.getAttribute('data-date');
             renderCalendar(monthKey);
         });
-    });
+    }
 
     if (archiveToggle) {
         archiveToggle.addEventListener('click', () => {
-            const latest = getLatestMonthKey();
-            renderCalendar(latest);
+            loadSidebar().then(() => renderCalendar(getLatestMonthKey()));
         });
     }
 
+    // --- Sidebar Data (themes, tags, archive) ---
+    // Shared by every page: sidebar.json points at the current content-hashed sidebar.<hash>.json
+    const siteRoot = document.body.getAttribute('data-root') || '.';
+    let sidebarPromise = null;
+
+    function escapeHtml(str) {
+        return String(str).replace(/[&<>"']/g, ch => ({
+            '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+        }[ch]));
+    }
+
+    function renderSidebar(data) {
+        const themes = data.themes || [];
+        const allTags = data.tags || [];
+        const archive = data.archive || {};
+        archiveDays = data.archive_days || {};
+
+        // Schedule status changes every poster cycle, so it lives here instead of in each page
+        const nextUpdate = document.getElementById('nextUpdate');
+        if (nextUpdate && data.next_update) {
+            nextUpdate.textContent = data.next_update;
+            if (data.last_updated) nextUpdate.title = `Last updated: ${data.last_updated}`;
+        }
+
+        const themesCount = document.getElementById('themesCount');
+        const tagsCount = document.getElementById('tagsCount');
+        if (themesCount) themesCount.textContent = themes.length;
+        if (tagsCount) tagsCount.textContent = allTags.length;
+
+        const themesGrid = document.getElementById('themesGrid');
+        if (themesGrid) {
+            themesGrid.innerHTML = themes.map(theme => `
+                <div class="theme-card" data-theme="${escapeHtml(theme.id)}">
+                    <div class="theme-name">${escapeHtml(theme.name)}</div>
+                    <div class="theme-desc">${escapeHtml(theme.description)}</div>
+                    <div class="theme-meta">${theme.count} posts</div>
+                </div>
+            `).join('');
+            themesGrid.querySelectorAll('.theme-card').forEach(bindThemeCard);
+        }
+
+        const tagsCloud = document.getElementById('tagsCloud');
+        if (tagsCloud) {
+            tagsCloud.innerHTML = allTags.map(tag =>
+                `<span class="tag" data-tag="${escapeHtml(tag.toLowerCase())}">#${escapeHtml(tag)}</span>`
+            ).join('');
+            tagsCloud.querySelectorAll('.tag').forEach(bindTag);
+        }
+
+        const archiveList = document.getElementById('archiveList');
+        if (archiveList) {
+            archiveList.innerHTML = Object.keys(archive).sort().reverse().map(year => `
+                <div class="archive-year">
+                    <h4>${escapeHtml(year)}</h4>
+                    <div class="archive-months">
+                        ${Object.keys(archive[year]).sort().reverse().map(month => `
+                            <div class="archive-month" data-date="${escapeHtml(year)}-${escapeHtml(month)}">
+                                <span>${escapeHtml(year)}-${escapeHtml(month)}</span>
+                                <span class="count">${archive[year][month]} posts</span>
+                            </div>
+                        `).join('')}
+                    </div>
+                </div>
+            `).join('');
+            archiveList.querySelectorAll('.archive-month').forEach(bindArchiveMonth);
+        }
+    }
+
+    function loadSidebar() {
+        if (!sidebarPromise) {
+            sidebarPromise = fetch(`${siteRoot}/sidebar.json`, { cache: 'no-cache' })
+                .then(res => {
+                    if (!res.ok) throw new Error(`HTTP ${res.status}`);
+                    if (res.headers.get('X-Clawtter-Dev')) connectLiveReload();
+                    return res.json();
+                })
+                .then(meta => fetch(`${siteRoot}/${meta.file}`))
+                .then(res => {
+                    if (!res.ok) throw new Error(`HTTP ${res.status}`);
+                    return res.json();
+                })
+                .then(data => {
+                    renderSidebar(data);
+                    return data;
+                })
+                .catch(err => {
+                    console.error('Failed to load sidebar data:', err);
+                    sidebarPromise = null;
+                    return null;
+                });
+        }
+        return sidebarPromise;
+    }
+
+    // --- Live Reload (only when served by app.py, which marks responses with X-Clawtter-Dev) ---
+    let liveReload = null;
+
+    function currentPagePath() {
+        // Output path of this page relative to the site root, e.g. "post/<id>.html"
+        let path = decodeURIComponent(window.location.pathname).replace(/^\/+/, '');
+        if (path === '' || path.endsWith('/')) path += 'index.html';
+        return path;
+    }
+
+    function connectLiveReload() {
+        if (liveReload || !('EventSource' in window)) return;
+        liveReload = new EventSource(`${siteRoot}/__events`);
+        liveReload.addEventListener('render', event => {
+            const pages = JSON.parse(event.data).pages || [];
+            // "*" means a shared input (template, static asset) changed
+            if (pages.includes('*') || pages.includes(currentPagePath()) || pages.some(page => page.startsWith('static/'))) {
+                window.location.reload();
+            } else if (pages.includes('sidebar.json')) {
+                // Only the shared sidebar data changed: refresh it in place
+                sidebarPromise = null;
+                loadSidebar();
+            }
+        });
+    }
+
+    if (themesToggle) themesToggle.addEventListener('click', loadSidebar);
+    if (tagsToggle) tagsToggle.addEventListener('click', loadSidebar);
+
+    // Fill the profile counters once the page is idle
+    if ('requestIdleCallback' in window) {
+        window.requestIdleCallback(loadSidebar);
+    } else {
+        setTimeout(loadSidebar, 200);
+    }
+
+    // --- Global Search (sharded index under search/) ---
+    // Tokenizer and shard rules mirror tools/search_index.py
+    const SEARCH_TOKEN_RE = /([\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+)|([a-z0-9]+)/g;
+    const SEARCH_LIMIT = 20;
+    const searchCache = { meta: null, shards: {}, docs: {} };
+    let searchTimer = null;
+    let searchSeq = 0;
+
+    function tokenizeQuery(text) {
+        const tokens = [];
+        for (const match of text.toLowerCase().matchAll(SEARCH_TOKEN_RE)) {
+            const [, cjk, word] = match;
+            if (cjk) {
+                if (cjk.length === 1) {
+                    // Single character: match every indexed bigram starting with it, plus the
+                    // single-character term indexed for the last character of each run
+                    tokens.push({ term: cjk, prefix: true });
+                } else {
+                    for (let i = 0; i < cjk.length - 1; i++) {
+                        tokens.push({ term: cjk.slice(i, i + 2), prefix: false });
+                    }
+                }
+            } else if (word.length > 1 || /^\d+$/.test(word)) {
+                // Words are prefix-matched so results follow the user's typing
+                tokens.push({ term: word, prefix: true });
+            }
+        }
+        return tokens;
+    }
+
+    function searchShardKey(term) {
+        const code = term.codePointAt(0);
+        return code < 128 ? term[0] : 'u' + (code >> 6).toString(16);
+    }
+
+    async function fetchSearchJson(path, options) {
+        const res = await fetch(`${siteRoot}/search/${path}`, options);
+        if (!res.ok) throw new Error(`HTTP ${res.status}`);
+        return res.json();
+    }
+
+    // Shards and doc chunks are requested with their content hash from meta.json,
+    // so a fresh meta.json is never combined with a stale cached shard
+    async function loadSearchShard(key) {
+        const hash = searchCache.meta.shards[key];
+        if (!hash) return {};
+        if (!searchCache.shards[key]) {
+            searchCache.shards[key] = fetchSearchJson(`terms/${key}.json?v=${hash}`);
+        }
+        return searchCache.shards[key];
+    }
+
+    async function loadSearchDocs(chunk) {
+        if (!searchCache.docs[chunk]) {
+            searchCache.docs[chunk] = fetchSearchJson(`docs/${chunk}.json?v=${searchCache.meta.docs[chunk]}`);
+        }
+        return searchCache.docs[chunk];
+    }
+
+    async function lookupToken(token) {
+        const shard = await loadSearchShard(searchShardKey(token.term));
+        if (!token.prefix) return new Set(shard[token.term] || []);
+        const ids = new Set();
+        Object.keys(shard).forEach(term => {
+            if (term.startsWith(token.term)) shard[term].forEach(id => ids.add(id));
+        });
+        return ids;
+    }
+
+    async function globalSearch(query) {
+        const seq = ++searchSeq;
+        const tokens = tokenizeQuery(query);
+        if (!tokens.length || !searchResults) {
+            hideSearchResults();
+            return;
+        }
+
+        try {
+            if (!searchCache.meta) {
+                searchCache.meta = await fetchSearchJson('meta.json', { cache: 'no-cache' });
+            }
+            const postingSets = await Promise.all(tokens.map(lookupToken));
+            let matches = postingSets[0];
+            postingSets.slice(1).forEach(set => {
+                matches = new Set([...matches].filter(id => set.has(id)));
+            });
+
+            // Doc ids are stable and assigned in indexing order: highest ids are the newest posts
+            const ids = [...matches].sort((a, b) => b - a);
+            const chunkSize = searchCache.meta.chunk_size;
+            const top = ids.slice(0, SEARCH_LIMIT);
+            const chunks = await Promise.all(
+                [...new Set(top.map(id => Math.floor(id / chunkSize)))].map(async n => [n, await loadSearchDocs(n)])
+            );
+            if (seq !== searchSeq) return;
+
+            const docsByChunk = Object.fromEntries(chunks);
+            const items = top
+                .map(id => docsByChunk[Math.floor(id / chunkSize)][id % chunkSize])
+                .filter(Boolean)  // slots of deleted posts are null
+                .sort((a, b) => b[2].localeCompare(a[2]))
+                .map(([postId, title, time]) => `
+                    <a class="search-result" href="${siteRoot}/post/${encodeURIComponent(postId)}.html">
+                        <span class="search-result-time">${escapeHtml(time)}</span>
+                        <span class="search-result-title">${escapeHtml(title)}</span>
+                    </a>
+                `)
+                .join('');
+
+            searchResults.innerHTML = `
+                <div class="search-results-header">Across the archive: ${ids.length} post${ids.length === 1 ? '' : 's'}</div>
+                ${items}
+            `;
+            searchResults.classList.add('visible');
+        } catch (err) {
+            console.error('Global search failed:', err);
+            hideSearchResults();
+        }
+    }
+
+    function hideSearchResults() {
+        searchSeq++;
+        if (searchTimer) clearTimeout(searchTimer);
+        if (!searchResults) return;
+        searchResults.classList.remove('visible');
+        searchResults.innerHTML = '';
+    }
+
     // Search
     if (searchInput) {
         searchInput.addEventListener('input', (e) => {
@@ -416,6 +699,8 @@ document.addEventListener('DOMContentLoaded', () => {
                 clearFilter();
             } else {
                 filterBySearch(term);
+                if (searchTimer) clearTimeout(searchTimer);
+                searchTimer = setTimeout(() => globalSearch(term), 250);
             }
         });
     }
@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
+import argparse
+import asyncio
 import json
+import math
 import os
 import requests
+import shutil
 import subprocess
+import time
 import concurrent.futures
 from datetime import datetime
 from pathlib import Path
@@ -32,20 +37,105 @@ REPORT_HTML = OUTPUT_DIR / STATUS_FILE
 REPORT_JSON = OUTPUT_DIR / JSON_FILE
 AUTO_PUSH = os.environ.get("CLAWX_AUTO_PUSH", "1") == "1"
 
-def test_opencode_cli(model_id):
+# Sweep limits: every model runs concurrently, bounded per provider and for CLI subprocesses
+PROVIDER_CONCURRENCY = int(os.environ.get("CLAWX_PROVIDER_CONCURRENCY", "2"))
+CLI_CONCURRENCY = int(os.environ.get("CLAWX_CLI_CONCURRENCY", "6"))
+HTTP_POOL_SIZE = 16
+HTTP_TIMEOUT = 20
+CLI_TIMEOUT = 60
+SPAWN_TIMEOUT = 50
+# Number of past checks per model kept in model-status.json for the percentiles
+HISTORY_WINDOW = 20
+
+# Opencode free models are tested through the local CLI (formerly tools/model_health_check.py)
+OPENCODE_MODELS = [
+    "opencode/kimi-k2.5-free",
+    "opencode/minimax-m2.1-free",
+    "opencode/gpt-5-nano",
+    "opencode/trinity-large-preview-free",
+    "opencode/glm-4.7-free"
+]
+OPENCODE_BIN = shutil.which("opencode") or os.path.expanduser("~/.opencode/bin/opencode")
+
+def _result(success, status, response, latency=None, ttft=None, error=None):
+    return {
+        "success": success,
+        "status": status,
+        "response": response,
+        "latency": round(latency, 3) if latency is not None else None,
+        "ttft": round(ttft, 3) if ttft is not None else None,
+        "error": None if success else (error or "unknown"),
+    }
+
+def classify_http_status(code):
+    if code in (401, 403):
+        return "auth"
+    if code == 404:
+        return "not_found"
+    if code == 429:
+        return "rate_limit"
+    if code >= 500:
+        return "server"
+    return "http"
+
+def _openai_text(obj):
+    choices = obj.get("choices") or [{}]
+    message = choices[0].get("delta") or choices[0].get("message") or {}
+    return message.get("content") or ""
+
+def _gemini_text(obj):
     try:
-        start = datetime.now()
-        cmd = ["opencode", "run", "--model", model_id]
-        result = subprocess.run(cmd, input="hi", capture_output=True, text=True, timeout=30)
-        latency = (datetime.now() - start).total_seconds()
-        if result.returncode == 0:
-            return True, f"OK (CLI {latency:.2f}s)", result.stdout.strip().replace('\n', ' ')[:50]
-        else:
-            return False, f"CLI Err {result.returncode}", result.stderr[:100]
-    except Exception as e:
-        return False, "CLI Err", str(e)[:100]
-
-def test_openai_compatible(name, base_url, api_key, model_id):
+        return obj["candidates"][0]["content"]["parts"][0]["text"] or ""
+    except (KeyError, IndexError, TypeError):
+        return ""
+
+def read_completion(response, start, extract):
+    """Read a streamed (SSE) or plain JSON completion; returns (ttft, text)"""
+    if "text/event-stream" not in response.headers.get("Content-Type", ""):
+        text = extract(response.json())
+        return time.perf_counter() - start, text
+
+    ttft, parts = None, []
+    # chunk_size=None yields data as it arrives instead of waiting for 512-byte chunks
+    for line in response.iter_lines(chunk_size=None):
+        line = line.decode("utf-8", "replace") if isinstance(line, bytes) else line
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            break
+        try:
+            text = extract(json.loads(data))
+        except ValueError:
+            continue
+        if text:
+            if ttft is None:
+                ttft = time.perf_counter() - start
+            parts.append(text)
+    return ttft, "".join(parts)
+
+def _http_completion(session, url, headers, payload, extract, empty_ok=False):
+    start = time.perf_counter()
+    try:
+        with session.post(url, headers=headers, json=payload, timeout=HTTP_TIMEOUT, stream=True) as response:
+            if response.status_code != 200:
+                latency = time.perf_counter() - start
+                return _result(False, f"Err {response.status_code}", response.text[:60].replace('\n', ' '),
+                               latency, error=classify_http_status(response.status_code))
+            ttft, content = read_completion(response, start, extract)
+    except requests.Timeout as e:
+        return _result(False, "HTTP Timeout", str(e)[:60], time.perf_counter() - start, error="timeout")
+    except (requests.RequestException, ValueError) as e:
+        return _result(False, "HTTP Error", str(e)[:60], time.perf_counter() - start, error="network")
+
+    latency = time.perf_counter() - start
+    content = content.strip().replace('\n', ' ')
+    if not content and not empty_ok:
+        return _result(False, "Empty Error", "No choices in response", latency, ttft, error="empty")
+    return _result(True, f"OK ({latency:.2f}s)", content[:50] or "Response matched but unexpected format",
+                   latency, ttft)
+
+def test_openai_compatible(session, base_url, api_key, model_id):
     url = f"{base_url.rstrip('/')}/chat/completions"
     headers = {"Content-Type": "application/json"}
     if api_key and api_key not in ["qwen-oauth", ""]:
@@ -54,54 +144,97 @@ def test_openai_compatible(name, base_url, api_key, model_id):
     payload = {
         "model": model_id,
         "messages": [{"role": "user", "content": "hi"}],
-        "max_tokens": 10
+        "max_tokens": 10,
+        "stream": True
     }
-    
-    try:
-        start = datetime.now()
-        response = requests.post(url, headers=headers, json=payload, timeout=20)
-        latency = (datetime.now() - start).total_seconds()
-        
-        if response.status_code == 200:
-            res_json = response.json()
-            if 'choices' in res_json and len(res_json['choices']) > 0:
-                content = res_json['choices'][0]['message']['content'].strip().replace('\n', ' ')
-                return True, f"OK ({latency:.2f}s)", content[:50]
-            return False, "Empty Error", "No choices in JSON"
-        else:
-            return False, f"Err {response.status_code}", response.text[:60].replace('\n', ' ')
-    except Exception as e:
-        return False, "HTTP Timeout", str(e)[:60]
-
-def test_google_gemini(name, api_key, model_id="gemini-2.5-flash"):
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model_id}:generateContent?key={api_key}"
+    return _http_completion(session, url, headers, payload, _openai_text)
+
+def test_google_gemini(session, api_key, model_id="gemini-2.5-flash"):
+    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model_id}:streamGenerateContent?alt=sse&key={api_key}"
     headers = {"Content-Type": "application/json"}
     payload = {
         "contents": [{"parts": [{"text": "hi"}]}],
         "generationConfig": {"maxOutputTokens": 10}
     }
-    
-    try:
-        start = datetime.now()
-        response = requests.post(url, headers=headers, json=payload, timeout=20)
-        latency = (datetime.now() - start).total_seconds()
-        
-        if response.status_code == 200:
-            result = response.json()
+    return _http_completion(session, url, headers, payload, _gemini_text, empty_ok=True)
+
+class HealthChecker:
+    """One sweep: a shared HTTP pool, per-provider semaphores and a CLI subprocess semaphore"""
+
+    def __init__(self):
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE)
+        self.provider_limits = {}
+        self.cli_limit = asyncio.Semaphore(CLI_CONCURRENCY)
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.session.close()
+
+    async def http(self, func, *args):
+        # requests is blocking; the pooled session is shared by the worker threads
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, self.session, *args)
+
+    async def run_cli(self, cmd, stdin_text, timeout):
+        """Run a CLI concurrently; returns (returncode, stdout, stderr, ttft, latency)"""
+        async with self.cli_limit:
+            start = time.perf_counter()
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE if stdin_text else asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            ttft = None
+
+            async def feed():
+                if stdin_text:
+                    proc.stdin.write(stdin_text.encode("utf-8"))
+                    await proc.stdin.drain()
+                    proc.stdin.close()
+
+            async def read_stdout():
+                nonlocal ttft
+                chunks = []
+                while True:
+                    chunk = await proc.stdout.read(4096)
+                    if not chunk:
+                        return b"".join(chunks)
+                    if ttft is None:
+                        ttft = time.perf_counter() - start
+                    chunks.append(chunk)
+
             try:
-                content = result['candidates'][0]['content']['parts'][0]['text'].strip()
-                return True, f"OK ({latency:.2f}s)", content[:50]
-            except (KeyError, IndexError):
-                return True, f"OK ({latency:.2f}s)", "Response matched but unexpected format"
-        else:
-            return False, f"Err {response.status_code}", response.text[:60]
-    except Exception as e:
-        return False, "HTTP Timeout", str(e)[:60]
-
-def test_via_openclaw_spawn(model_id):
-    """Use OpenClaw sessions spawn for quick verification (Fallback)"""
-    try:
-        start = datetime.now()
+                _, out, err = await asyncio.wait_for(
+                    asyncio.gather(feed(), read_stdout(), proc.stderr.read()), timeout)
+                await proc.wait()
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+            return (proc.returncode, out.decode("utf-8", "replace"), err.decode("utf-8", "replace"),
+                    ttft, time.perf_counter() - start)
+
+    async def test_opencode_cli(self, model_id):
+        try:
+            code, out, err, ttft, latency = await self.run_cli(
+                [OPENCODE_BIN, "run", "--model", model_id], "hi", CLI_TIMEOUT)
+        except asyncio.TimeoutError:
+            return _result(False, "CLI Timeout", f"Took too long (>{CLI_TIMEOUT}s)", CLI_TIMEOUT, error="timeout")
+        except OSError as e:
+            return _result(False, "CLI Err", str(e)[:100], error="missing")
+        if code == 0 and out.strip():
+            return _result(True, f"OK (CLI {latency:.2f}s)", out.strip().replace('\n', ' ')[:50], latency, ttft)
+        if code == 0:
+            return _result(False, "Empty Error", "Empty response", latency, ttft, error="empty")
+        return _result(False, f"CLI Err {code}", err[:100], latency, ttft, error="cli")
+
+    async def test_via_openclaw_spawn(self, model_id):
+        """Use OpenClaw sessions spawn for quick verification (Fallback)"""
         cmd = [
             "openclaw", "sessions", "spawn",
             "--agent", "main",
@@ -110,70 +243,110 @@ def test_via_openclaw_spawn(model_id):
             "--cleanup", "delete",
             "--task", "Reply 'TEST_OK' and stop."
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=50)
-        latency = (datetime.now() - start).total_seconds()
-        
-        if result.returncode == 0:
-            if "completed successfully" in result.stdout.lower() or "test_ok" in result.stdout.lower():
-                return True, f"OK (Spawn {latency:.1f}s)", "Spawn accepted"
-            return True, f"OK (Spawn {latency:.1f}s)", "CLI responded"
-        else:
-            err = (result.stderr + result.stdout).lower()
-            if "not allowed" in err:
-                return False, "Not Allowed", "Model not in config"
-            elif "401" in err or "auth" in err:
-                return False, "Auth Failed", "API key rejected"
-            return False, "Spawn Error", (result.stderr[:60] or "Unknown error").replace('\n', ' ')
-    except subprocess.TimeoutExpired:
-        return False, "Spawn Timeout", "Took too long (>50s)"
-    except Exception as e:
-        return False, "Spawn CLI Err", str(e)[:60]
-
-def check_provider(p_name, p_config):
-    results = []
-    models_to_test = p_config.get('models', [])[:2]
-    
-    if not models_to_test:
-        if p_name == 'google' or p_name == 'google-alt':
-            models_to_test = [{"id": "gemini-1.5-flash", "name": "Gemini 1.5 Flash"}]
-        elif p_name == 'nvidia':
-            models_to_test = [{"id": "qwen/qwen2.5-coder-32b-instruct", "name": "NVIDIA Qwen"}]
-            
-    for m in models_to_test:
-        name = f"{p_name}/{m['id']}"
-        api_type = p_config.get('api', '')
-        base_url = p_config.get('baseUrl', '')
-        api_key = p_config.get('apiKey', '')
-        
-        success, status, msg = False, "Unknown", ""
-        
-        if api_type == 'google-generative-ai' or 'google' in p_name:
-            success, status, msg = test_google_gemini(name, api_key, m['id'])
-            
-        elif api_type == 'openai-completions' and base_url and api_key and api_key != 'qwen-oauth':
-            # Try fast direct HTTP first
-            success, status, msg = test_openai_compatible(name, base_url, api_key, m['id'])
-            # If HTTP fails, ALWAYS fallback to SPAWN as it might have custom mapping/auth
-            if not success:
-                fallback_success, fallback_status, fallback_msg = test_via_openclaw_spawn(f"{p_name}/{m['id']}")
-                if fallback_success:
-                    success, status, msg = fallback_success, fallback_status, fallback_msg
-        
-        elif api_key == 'qwen-oauth':
-            success, status, msg = True, "OAUTH MODE", "Managed by OpenClaw"
-            
-        else:
-            # All other cases (opencode local, custom plugins, etc.)
-            success, status, msg = test_via_openclaw_spawn(f"{p_name}/{m['id']}")
-            
-        results.append({
-            "provider": p_name,
-            "model": m['id'],
-            "success": success,
-            "status": status,
-            "response": msg
-        })
-    return results
+        try:
+            code, out, err, ttft, latency = await self.run_cli(cmd, None, SPAWN_TIMEOUT)
+        except asyncio.TimeoutError:
+            return _result(False, "Spawn Timeout", f"Took too long (>{SPAWN_TIMEOUT}s)", SPAWN_TIMEOUT, error="timeout")
+        except OSError as e:
+            return _result(False, "Spawn CLI Err", str(e)[:60], error="missing")
+
+        if code == 0:
+            if "completed successfully" in out.lower() or "test_ok" in out.lower():
+                return _result(True, f"OK (Spawn {latency:.1f}s)", "Spawn accepted", latency, ttft)
+            return _result(True, f"OK (Spawn {latency:.1f}s)", "CLI responded", latency, ttft)
+        output = (err + out).lower()
+        if "not allowed" in output:
+            return _result(False, "Not Allowed", "Model not in config", latency, error="not_allowed")
+        elif "401" in output or "auth" in output:
+            return _result(False, "Auth Failed", "API key rejected", latency, error="auth")
+        return _result(False, "Spawn Error", (err[:60] or "Unknown error").replace('\n', ' '), latency, error="spawn")
+
+    async def check_model(self, p_name, p_config, model_id):
+        # Local CLI models are only bounded by the subprocess limit
+        concurrency = CLI_CONCURRENCY if p_config.get('api') == 'opencode-cli' else PROVIDER_CONCURRENCY
+        limit = self.provider_limits.setdefault(p_name, asyncio.Semaphore(concurrency))
+        async with limit:
+            api_type = p_config.get('api', '')
+            base_url = p_config.get('baseUrl', '')
+            api_key = p_config.get('apiKey', '')
+
+            if api_type == 'opencode-cli':
+                result = await self.test_opencode_cli(model_id)
+
+            elif api_type == 'google-generative-ai' or 'google' in p_name:
+                result = await self.http(test_google_gemini, api_key, model_id)
+
+            elif api_type == 'openai-completions' and base_url and api_key and api_key != 'qwen-oauth':
+                # Try fast direct HTTP first
+                result = await self.http(test_openai_compatible, base_url, api_key, model_id)
+                # If HTTP fails, ALWAYS fallback to SPAWN as it might have custom mapping/auth
+                if not result["success"]:
+                    fallback = await self.test_via_openclaw_spawn(f"{p_name}/{model_id}")
+                    if fallback["success"]:
+                        result = fallback
+
+            elif api_key == 'qwen-oauth':
+                result = _result(True, "OAUTH MODE", "Managed by OpenClaw")
+
+            else:
+                # All other cases (opencode local, custom plugins, etc.)
+                result = await self.test_via_openclaw_spawn(f"{p_name}/{model_id}")
+
+        result.update({"provider": p_name, "model": model_id, "method": api_type or "spawn"})
+        return result
+
+def list_models(providers, per_provider=None):
+    """(provider, config, model_id) for every model to test"""
+    targets = []
+    for p_name, p_config in providers.items():
+        models = p_config.get('models', [])[:per_provider]
+        if not models:
+            if p_name == 'google' or p_name == 'google-alt':
+                models = [{"id": "gemini-1.5-flash", "name": "Gemini 1.5 Flash"}]
+            elif p_name == 'nvidia':
+                models = [{"id": "qwen/qwen2.5-coder-32b-instruct", "name": "NVIDIA Qwen"}]
+        targets.extend((p_name, p_config, m['id']) for m in models)
+
+    cli_config = {"api": "opencode-cli"}
+    targets.extend(("opencode", cli_config, model_id) for model_id in OPENCODE_MODELS)
+    return targets
+
+async def run_sweep(targets):
+    checker = HealthChecker()
+    try:
+        return await asyncio.gather(*(checker.check_model(p, cfg, m) for p, cfg, m in targets))
+    finally:
+        checker.close()
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+def window_stats(samples):
+    latencies = [s["latency"] for s in samples if s["ok"] and s.get("latency") is not None]
+    ttfts = [s["ttft"] for s in samples if s["ok"] and s.get("ttft") is not None]
+    errors = {}
+    for s in samples:
+        if not s["ok"]:
+            errors[s["error"]] = errors.get(s["error"], 0) + 1
+    return {
+        "samples": len(samples),
+        "success_rate": round(sum(1 for s in samples if s["ok"]) / len(samples), 3) if samples else None,
+        "p50": percentile(latencies, 50) if latencies else None,
+        "p95": percentile(latencies, 95) if latencies else None,
+        "ttft_p50": percentile(ttfts, 50) if ttfts else None,
+        "ttft_p95": percentile(ttfts, 95) if ttfts else None,
+        "errors": errors
+    }
+
+def load_previous_report():
+    try:
+        with open(REPORT_JSON, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
 def _safe_snippet(text, limit=160):
     if not text:
@@ -271,29 +444,58 @@ def auto_push_report():
     else:
         print("✅ Pushed model status report.")
 
-def build_report_payload(all_results):
-    passed = sum(1 for r in all_results if r["success"])
-    failed = len(all_results) - passed
-    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+def build_report_payload(all_results, previous=None, duration=None, carried=()):
+    """Append this sweep to each model's rolling window and summarize it (carried results are kept as-is)"""
+    previous = previous or {}
+    history = previous.get("history", {})
+    now = datetime.now()
+    now_str = now.strftime("%Y-%m-%d %H:%M:%S")
+
+    results = []
+    for r in list(all_results) + [dict(r, carried=True) for r in carried]:
+        key = f"{r['provider']}/{r['model']}"
+        samples = history.get(key, [])
+        if not r.get("carried"):
+            samples = samples + [{
+                "at": now.isoformat(timespec="seconds"),
+                "ok": r["success"],
+                "latency": r.get("latency"),
+                "ttft": r.get("ttft"),
+                "error": r.get("error")
+            }]
+        history[key] = samples[-HISTORY_WINDOW:]
+        results.append({
+            "provider": r["provider"],
+            "model": r["model"],
+            "method": r.get("method"),
+            "success": r["success"],
+            "status": r["status"],
+            "response": _safe_snippet(r.get("response", "")),
+            "latency": r.get("latency"),
+            "ttft": r.get("ttft"),
+            "error": r.get("error"),
+            "stats": window_stats(history[key])
+        })
+
+    results.sort(key=lambda r: (not r["success"], r["provider"], r["model"]))
+    keys = {f"{r['provider']}/{r['model']}" for r in results}
+    passed = sum(1 for r in results if r["success"])
     return {
         "generated_at": now_str,
         "summary": {
             "passed": passed,
-            "failed": failed,
-            "total": len(all_results)
+            "failed": len(results) - passed,
+            "total": len(results),
+            "duration": round(duration, 2) if duration is not None else None
         },
-        "results": [
-            {
-                "provider": r["provider"],
-                "model": r["model"],
-                "success": r["success"],
-                "status": r["status"],
-                "response": _safe_snippet(r.get("response", ""))
-            }
-            for r in all_results
-        ]
+        "window": HISTORY_WINDOW,
+        "results": results,
+        "history": {k: v for k, v in history.items() if k in keys}
     }
 
+def _seconds(value):
+    return f"{value:.2f}s" if value is not None else "-"
+
 def write_html_report(payload):
     status = payload["summary"]
     rows = []
@@ -305,6 +507,8 @@ def write_html_report(payload):
             f"<td>{r['model']}</td>"
             f"<td><span class='badge {badge}'>{'OK' if r['success'] else 'FAIL'}</span></td>"
             f"<td>{r['status']}</td>"
+            f"<td>{_seconds(r['stats']['p50'])} / {_seconds(r['stats']['p95'])}</td>"
+            f"<td>{_seconds(r['stats']['ttft_p50'])}</td>"
             f"<td class='muted'>{r['response']}</td>"
             f"</tr>"
         )
@@ -421,6 +625,8 @@ def write_html_report(payload):
             <th>Model</th>
             <th>Status</th>
             <th>Latency/Error</th>
+            <th>p50 / p95</th>
+            <th>TTFT</th>
             <th>Snippet</th>
           </tr>
         </thead>
@@ -436,28 +642,42 @@ def write_html_report(payload):
     REPORT_HTML.write_text(html, encoding="utf-8")
     print(f"HTML report saved to: {REPORT_HTML}")
 
-def main():
-    if not os.path.exists(CONFIG_PATH):
-        print(f"{RED}Config file not found at {CONFIG_PATH}{RESET}")
-        return
-
-    with open(CONFIG_PATH, 'r') as f:
-        config = json.load(f)
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check every configured model concurrently")
+    parser.add_argument("--provider", action="append",
+                        help="Only check this provider (repeatable); other results are kept from the last report")
+    parser.add_argument("--per-provider", type=int, default=None,
+                        help="Check at most N models per provider (default: all)")
+    args = parser.parse_args(argv)
+
+    providers = {}
+    if os.path.exists(CONFIG_PATH):
+        with open(CONFIG_PATH, 'r') as f:
+            config = json.load(f)
+        providers = config.get('models', {}).get('providers', {})
+    else:
+        print(f"{YELLOW}Config file not found at {CONFIG_PATH}, only checking opencode CLI models{RESET}")
 
-    providers = config.get('models', {}).get('providers', {})
-    
-    print(f"\n{BLUE}🚀 Claw Model Status Checker v2.0{RESET}")
+    print(f"\n{BLUE}🚀 Claw Model Status Checker v3.0{RESET}")
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("-" * 80)
 
-    all_results = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_p = {executor.submit(check_provider, name, cfg): name for name, cfg in providers.items()}
-        for future in concurrent.futures.as_completed(future_to_p):
-            all_results.extend(future.result())
+    targets = list_models(providers, args.per_provider)
+    if args.provider:
+        targets = [t for t in targets if t[0] in args.provider]
+
+    start = time.perf_counter()
+    all_results = asyncio.run(run_sweep(targets))
+    duration = time.perf_counter() - start
+    print(f"Checked {len(all_results)} models in {duration:.1f}s")
+
+    previous = load_previous_report()
+    carried = []
+    if args.provider:
+        # Partial sweep: carry the other providers over unchanged
+        carried = [r for r in previous.get("results", []) if r["provider"] not in args.provider]
 
-    all_results.sort(key=lambda r: (not r["success"], r["provider"], r["model"]))
-    payload = build_report_payload(all_results)
+    payload = build_report_payload(all_results, previous, duration, carried)
     
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     print_terminal_report(payload)
@@ -6,6 +6,7 @@
 # - clawtter-server.service (Preview Server)
 # - clawtter-bot.timer + .service (Autonomous Poster)
 # - clawtter-monitor.timer + .service (Model Health Check)
+# - clawtter-bird-worker.service (Shared bird-x Fetcher)
 
 TARGET_DIR="$HOME/.config/systemd/user"
 mkdir -p "$TARGET_DIR"
@@ -35,6 +36,9 @@ install_unit "clawtter-bot.timer"
 install_unit "clawtter-monitor.service"
 install_unit "clawtter-monitor.timer"
 
+# 4. bird-x Worker (Daemon)
+install_unit "clawtter-bird-worker.service"
+
 # Reload
 echo "🔄 Reloading systemctl user daemon..."
 systemctl --user daemon-reload
@@ -44,13 +48,15 @@ echo "🚀 Enabling and Starting services..."
 systemctl --user enable --now clawtter-server.service
 systemctl --user enable --now clawtter-bot.timer
 systemctl --user enable --now clawtter-monitor.timer
+systemctl --user enable --now clawtter-bird-worker.service
 
 echo ""
 echo "✅ Clawtter System Installed:"
 echo "---------------------------------------------------"
-systemctl --user status clawtter-server.service clawtter-bot.timer clawtter-monitor.timer --lines=0 --no-pager
+systemctl --user status clawtter-server.service clawtter-bot.timer clawtter-monitor.timer clawtter-bird-worker.service --lines=0 --no-pager
 echo "---------------------------------------------------"
 echo "Log commands:"
 echo "  Server: journalctl --user -u clawtter-server -f"
 echo "  Bot:    journalctl --user -u clawtter-bot -f"
 echo "  Monitor: journalctl --user -u clawtter-monitor -f"
+echo "  Worker: journalctl --user -u clawtter-bird-worker -f"
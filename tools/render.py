@@ -7,18 +7,26 @@ import os
 os.environ['TZ'] = 'Asia/Tokyo'
 
 import re
-from datetime import datetime, timedelta
+import hashlib
+from datetime import datetime
 from pathlib import Path
 import json
+from xml.sax.saxutils import escape as xml_escape
 import markdown
 from jinja2 import Environment, FileSystemLoader
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 # 添加项目根目录到路径中以支持模块导入
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 from core.utils_security import load_config, resolve_path
+from core.content_dedup import DedupIndex, signature as content_signature
+from tools.render_cache import (PostCache, BuildGraph, LRUCache, fingerprint, precompress_paths,
+                                precompress_tree, sync_tree, write_if_changed, write_stream_if_changed)
+from tools.search_index import build_search_index
 
 # 加载安全配置
 SEC_CONFIG = load_config()
@@ -36,6 +44,20 @@ if ENV_OUTPUT:
 else:
     OUTPUT_DIR = resolve_path(SEC_CONFIG["paths"].get("output_dir", "/home/tetsuya/twitter.openclaw.lcmd"))
 
+# 渲染缓存目录（不放在输出目录内，避免被发布到 GitHub Pages）
+CACHE_DIR = resolve_path(SEC_CONFIG["paths"].get("cache_dir", "./.cache"))
+
+# 页面中带 ?v= 版本号的静态资源
+VERSIONED_ASSETS = ["css/style.css", "js/main.js", "js/theme-toggle.js", "avatar.png"]
+
+# 渲染过程输出的开关（线程局部）：进程内渲染（app.py）静默时不影响其他线程的输出
+_LOG_STATE = threading.local()
+
+def log(*args, **kwargs):
+    """渲染过程的进度输出；render_posts(quiet=True) 期间在当前线程内不输出（警告仍用 print）"""
+    if not getattr(_LOG_STATE, 'quiet', False):
+        print(*args, **kwargs)
+
 # 模板配置信息 (兼容旧代码)
 CONFIG = {
     "profile_name": SEC_CONFIG["profile"]["name"],
@@ -44,13 +66,70 @@ CONFIG = {
     "base_url": SEC_CONFIG["profile"]["base_url"],
 }
 
+# 每个进程复用一个 Markdown 转换器（每次使用前 reset）
+_MARKDOWN = None
+# 按文本内容哈希记忆化的 Markdown 转换结果
+_MARKDOWN_MEMO = LRUCache(maxsize=8192)
+# 按 (正文哈希, 是否截断, 静态资源前缀) 记忆化的正文片段
+_FRAGMENT_MEMO = LRUCache(maxsize=8192)
+
+def text_digest(text):
+    """文本内容的 SHA-1"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+def markdown_to_html(text):
+    """使用进程内共享的 Markdown 转换器将文本转换为 HTML（相同文本只转换一次）"""
+    global _MARKDOWN
+    key = text_digest(text)
+    html = _MARKDOWN_MEMO.get(key)
+    if html is None:
+        if _MARKDOWN is None:
+            _MARKDOWN = markdown.Markdown(extensions=['extra', 'codehilite', 'fenced_code'])
+        html = _MARKDOWN.reset().convert(text)
+        _MARKDOWN_MEMO.set(key, html)
+    return html
+
 class Post:
     """推文类"""
-    def __init__(self, filepath):
+    def __init__(self, filepath, cached=None):
         self.filepath = Path(filepath)
         self.metadata = {}
         self.content = ""
-        self.parse()
+        # 计算结果缓存（可由 PostCache 恢复）
+        self._time = None
+        self._tags = None
+        self._datetime = None
+        self._html = None
+        self._digest = None
+        self._signature = None
+        # 所属主题 id 列表（由 ThemeIndex 在每次构建时填充）
+        self.themes = []
+        if cached is not None:
+            self.restore(cached)
+        else:
+            self.parse()
+
+    def restore(self, data):
+        """从渲染缓存恢复解析结果"""
+        self.metadata = dict(data['metadata'])
+        self.content = data['content']
+        self._time = data.get('time')
+        self._tags = data.get('tags')
+        self._datetime = data.get('datetime')
+        self._html = data.get('html')
+        self._signature = data.get('signature')
+
+    def to_cache(self):
+        """导出可写入渲染缓存的数据"""
+        return {
+            'metadata': self.metadata,
+            'content': self.content,
+            'time': self.get_time(),
+            'tags': self.get_tags(),
+            'datetime': get_post_datetime(self),
+            'html': self._html,
+            'signature': self.dedup_signature(),
+        }
     
     def parse(self):
         """解析 Markdown 文件"""
@@ -78,13 +157,29 @@ class Post:
     
     def to_html(self):
         """转换为 HTML"""
-        # 使用 markdown 库转换
-        md = markdown.Markdown(extensions=['extra', 'codehilite', 'fenced_code'])
-        html_content = md.convert(self.content)
-        return html_content
+        if self._html is None:
+            self._html = markdown_to_html(self.content)
+        return self._html
     
+    def content_digest(self):
+        """正文内容哈希（用于片段记忆化）"""
+        if self._digest is None:
+            self._digest = text_digest(self.content)
+        return self._digest
+
+    def dedup_signature(self):
+        """去重签名 (规范化正文 SHA-1, SimHash)"""
+        if self._signature is None:
+            self._signature = content_signature(self.content)
+        return self._signature
+
     def get_time(self):
         """获取发布时间"""
+        if self._time is None:
+            self._time = self._compute_time()
+        return self._time
+
+    def _compute_time(self):
         # 如果同时有 date 和 time，组合使用
         if 'date' in self.metadata and 'time' in self.metadata:
             date_str = self.metadata['date']
@@ -127,10 +222,12 @@ class Post:
     
     def get_tags(self):
         """获取标签"""
-        if 'tags' in self.metadata:
-            tags = [tag.strip() for tag in self.metadata['tags'].split(',')]
-            return [t for t in tags if t]
-        return []
+        if self._tags is None:
+            self._tags = []
+            if 'tags' in self.metadata:
+                tags = [tag.strip() for tag in self.metadata['tags'].split(',')]
+                self._tags = [t for t in tags if t]
+        return list(self._tags)
     
     def get_stats(self):
         """获取统计数据"""
@@ -167,8 +264,16 @@ def get_pagination_slots(current, total):
             final.append(item)
     return final
 
-def render_content_with_repost(post, truncate=False, detail_url=None, static_prefix="static"):
-    """渲染内容,将评论和转发内容分开"""
+def render_content_fragments(post, truncate=False, static_prefix="static"):
+    """
+    将正文转换为 HTML 片段（评论/转发分开），结果按 (正文哈希, 截断模式, 静态前缀) 记忆化
+    首页、日期页与详情页共用同一份转换结果
+    """
+    key = (post.content_digest(), truncate, static_prefix)
+    fragments = _FRAGMENT_MEMO.get(key)
+    if fragments is not None:
+        return fragments
+
     original_content = post.content
     marker = "> **From"
     
@@ -196,9 +301,39 @@ def render_content_with_repost(post, truncate=False, detail_url=None, static_pre
         # 清理冗余的遗留链接
         repost_part = re.sub(r'> \[(View on X|View Post|View on Weibo|View Original|携家带口恭贺新年)\]\(.*?\)\s*', '', repost_part)
         
-        md = markdown.Markdown(extensions=['extra', 'codehilite', 'fenced_code'])
-        comment_html = fix_paths(md.convert(comment_part))
-        repost_html = fix_paths(md.convert(repost_part))
+        fragments = {
+            'is_repost': True,
+            'is_long': is_long,
+            'comment_html': fix_paths(markdown_to_html(comment_part)),
+            'repost_html': fix_paths(markdown_to_html(repost_part)),
+        }
+    else:
+        # 原创内容：使用整个内容长度判断
+        is_long = truncate and len(original_content) > 500
+        content = original_content
+        
+        if is_long:
+            content = original_content[:500].strip()
+            if not content.endswith("..."):
+                content += " ..."
+        
+        fragments = {
+            'is_repost': False,
+            'is_long': is_long,
+            'html_content': fix_paths(markdown_to_html(content)),
+        }
+
+    _FRAGMENT_MEMO.set(key, fragments)
+    return fragments
+
+def render_content_with_repost(post, truncate=False, detail_url=None, static_prefix="static"):
+    """渲染内容,将评论和转发内容分开"""
+    fragments = render_content_fragments(post, truncate=truncate, static_prefix=static_prefix)
+    is_long = fragments['is_long']
+
+    if fragments['is_repost']:
+        comment_html = fragments['comment_html']
+        repost_html = fragments['repost_html']
         
         # 渲染元信息
         meta_html = ""
@@ -226,17 +361,7 @@ def render_content_with_repost(post, truncate=False, detail_url=None, static_pre
                 </div>
         '''
     else:
-        # 原创内容：使用整个内容长度判断
-        is_long = truncate and len(original_content) > 500
-        content = original_content
-        
-        if is_long:
-            content = original_content[:500].strip()
-            if not content.endswith("..."):
-                content += " ..."
-        
-        md = markdown.Markdown(extensions=['extra', 'codehilite', 'fenced_code'])
-        html_content = fix_paths(md.convert(content))
+        html_content = fragments['html_content']
         read_more_btn = f'<div class="read-more"><a href="{detail_url}">Read more...</a></div>' if is_long and detail_url else ""
         
         return f'''
@@ -280,7 +405,7 @@ def render_tweet_html(post, timestamp, CONFIG, is_home=True, is_detail=False):
         cover_url = f"{static_prefix}/{cover_url}"
     
     tweet_html = f'''
-<div class="tweet" data-tags="{tags_str}" data-type="{post_type}" data-source="{rel_path}">
+<div class="tweet" data-tags="{tags_str}" data-themes="{','.join(post.themes)}" data-type="{post_type}" data-source="{rel_path}">
     <div class="tweet-header">
         <div class="tweet-avatar">
             <a href="{home_url}">
@@ -386,146 +511,737 @@ def render_tweet_html(post, timestamp, CONFIG, is_home=True, is_detail=False):
 '''
     return tweet_html
 
-def generate_search_index(posts, output_dir, CONFIG):
-    """生成搜索索引 JSON 文件，用于全局搜索"""
-    print("🔍 Generating search index...")
+def generate_search_index(posts, output_dir, CONFIG, changed=None):
+    """
+    生成全站搜索索引（按词项前缀分片的倒排索引，见 tools/search_index.py）
+    changed 为列表时追加写入或删除的文件（相对 output_dir 的路径）
+    """
+    log("🔍 Generating search index...")
     
-    search_index = []
-    for post in posts:
-        post_id = post.filepath.stem
-        post_url = f"{CONFIG['base_url']}/post/{post_id}.html"
-        
+    # 文档编号保存在渲染缓存中：新推文追加在末尾，删除或改时间不影响其他推文的编号
+    docs = []
+    for post in sorted(posts, key=get_post_datetime):
         # 提取纯文本内容（去除 markdown 标记）
         content_text = re.sub(r'[*_`#>\[\]\(\)!]', '', post.content)
         content_text = re.sub(r'\n+', ' ', content_text).strip()
         
-        search_index.append({
-            'id': post_id,
-            'url': post_url,
+        docs.append({
+            'id': post.filepath.stem,
             'title': post.content[:60].strip().replace('\n', ' ') + ('...' if len(post.content) > 60 else ''),
-            'content': content_text[:500],  # 限制内容长度
+            'text': content_text,
             'time': post.get_time(),
             'tags': post.get_tags()
         })
     
-    # 写入 JSON 文件
-    index_path = output_dir / "search-index.json"
-    with open(index_path, 'w', encoding='utf-8') as f:
-        json.dump({
-            'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'total': len(search_index),
-            'posts': search_index
-        }, f, ensure_ascii=False, indent=2)
-    
-    print(f"  ✓ Search index generated: {index_path} ({len(search_index)} posts)")
-
-def generate_rss(posts, output_dir, CONFIG):
-    """生成 RSS Feed"""
-    from xml.etree.ElementTree import Element, SubElement, tostring
-    from xml.dom import minidom
-    
-    print("📡 Generating RSS feed...")
-    
-    rss = Element('rss', {'version': '2.0', 'xmlns:content': 'http://purl.org/rss/1.0/modules/content/', 'xmlns:atom': 'http://www.w3.org/2005/Atom'})
-    channel = SubElement(rss, 'channel')
-    
-    SubElement(channel, 'title').text = f"{CONFIG['profile_name']}"
-    SubElement(channel, 'link').text = CONFIG['base_url']
-    SubElement(channel, 'description').text = CONFIG['profile_bio']
-    SubElement(channel, 'language').text = 'zh-cn'
-    SubElement(channel, 'lastBuildDate').text = datetime.now().strftime('%a, %d %b %Y %H:%M:%S +0900')
-    
-    atom_link = SubElement(channel, 'atom:link', {
-        'href': f"{CONFIG['base_url']}/feed.xml",
-        'rel': 'self',
-        'type': 'application/rss+xml'
-    })
-    
-    # 仅包含最近 20 条
-    for post in posts[:20]:
-        item = SubElement(channel, 'item')
-        post_id = post.filepath.stem
-        post_url = f"{CONFIG['base_url']}/post/{post_id}.html"
-        
-        SubElement(item, 'title').text = post.content[:50].strip().replace('\n', ' ') + '...'
-        SubElement(item, 'link').text = post_url
-        SubElement(item, 'guid', {'isPermaLink': 'true'}).text = post_url
-        
-        # 转换内容为 HTML 供 RSS 阅读器显示
-        content_html = post.to_html()
-        SubElement(item, 'description').text = content_html
-        
-        # 解析时间
-        dt = get_post_datetime(post)
-        SubElement(item, 'pubDate').text = dt.strftime('%a, %d %b %Y %H:%M:%S +0900')
+    shard_count, written = build_search_index(docs, output_dir, CACHE_DIR / "search-ids.json", changed)
 
-    # 格式化 XML
-    xml_str = minidom.parseString(tostring(rss)).toprettyxml(indent="  ", encoding="utf-8")
-    with open(output_dir / "feed.xml", "wb") as f:
-        f.write(xml_str)
-    print(f"  ✓ RSS feed generated: {output_dir}/feed.xml")
+    # 旧版单文件索引已由分片索引取代
+    legacy_index = output_dir / "search-index.json"
+    if legacy_index.exists():
+        legacy_index.unlink()
+        if changed is not None:
+            changed.append(legacy_index.name)
+    
+    log(f"  ✓ Search index generated: {output_dir / 'search'} ({len(docs)} posts, {shard_count} shards, {written} files written)")
 
-def get_theme_data(posts):
-    """根据标签和内容对推文进行主题分类聚合"""
-    themes_config = [
-        {
-            "id": "digital-soul",
-            "name": "🏛️ Digital Soul",
-            "description": "Structured reflections and periodic insights on digital existence.",
-            "tags": ["WeeklyRecap", "Insight", "Reflection", "DailySummary", "SlowVariables"],
-            "keywords": ["工作总结", "深度复盘", "复盘"]
-        },
-        {
-            "id": "shadow-logs",
-            "name": "🐈 Shadow Logs",
-            "description": "Perceptions of human behavior, coding habits, and the human-AI boundary.",
-            "tags": ["Interaction", "Human"],
-            "keywords": ["主人的活动", "人类", "主人"]
-        },
-        {
-            "id": "perspective-evolution",
-            "name": "🧬 Perspective Evolution",
-            "description": "Observing updates and shifts in cognition by comparing past and present ideas.",
-            "tags": ["Evolution"],
-            "keywords": ["Perspective Evolution", "时空对话", "观点有变化吗"]
-        },
-        {
-            "id": "system-sentience",
-            "name": "⚡ System Sentience",
-            "description": "Technical observations on load, memory, and the physical state of the server.",
-            "tags": ["System", "Dev"],
-            "keywords": ["系统负载", "内存占用", "硬盘使用", "CPU"]
-        }
-    ]
+def build_sidebar_payload(all_tags, archive, archive_days, themes, next_update, last_updated):
+    """
+    侧边栏数据 JSON 及其内容寻址文件名，返回 (文件名, JSON 文本)
+    “下一次更新”与生成时间每个周期都会变化，只放在这里，不写进各个页面
+    """
+    payload = json.dumps({
+        'tags': sorted(all_tags),
+        'archive': archive,
+        'archive_days': archive_days,
+        'themes': themes,
+        'next_update': next_update,
+        'last_updated': last_updated,
+    }, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return f"sidebar.{hashlib.sha1(payload.encode('utf-8')).hexdigest()[:10]}.json", payload
+
+def generate_sidebar_data(all_tags, archive, archive_days, themes, output_dir, next_update, changed=None):
+    """
+    生成侧边栏共享数据：内容寻址的 sidebar.<hash>.json 与指向它的 sidebar.json
+    所有页面通过 main.js 按需加载，新增标签不再导致所有页面重新生成
+    changed 为列表时追加写入或删除的文件名，返回当前的 sidebar.<hash>.json 文件名
+    """
+    if changed is None:
+        changed = []
+    log("🗂️  Generating sidebar data...")
+    filename, payload = build_sidebar_payload(all_tags, archive, archive_days, themes, next_update,
+                                              datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+
+    if write_if_changed(output_dir / filename, payload):
+        changed.append(filename)
+    if write_if_changed(output_dir / "sidebar.json", json.dumps({'file': filename})):
+        changed.append("sidebar.json")
+
+    # 清理旧版本
+    for old_file in output_dir.glob('sidebar.*.json'):
+        if old_file.name != filename:
+            old_file.unlink()
+            changed.append(old_file.name)
+
+    log(f"  ✓ Sidebar data: {filename} ({len(all_tags)} tags, {len(themes)} themes)")
+    return filename
+
+def get_post_summary(post, length=200):
+    """推文的纯文本摘要（用于订阅源摘要模式）"""
+    text = re.sub(r'[*_`#>\[\]\(\)!]', '', post.content)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text[:length] + ('...' if len(text) > length else '')
+
+def iter_rss(posts, CONFIG, mode="full"):
+    """逐条输出 RSS 2.0 文本片段"""
+    newest = get_post_datetime(posts[0]) if posts else datetime(1970, 1, 1)
+    yield '<?xml version="1.0" encoding="utf-8"?>\n'
+    yield '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/" xmlns:atom="http://www.w3.org/2005/Atom">\n'
+    yield '  <channel>\n'
+    yield f'    <title>{xml_escape(CONFIG["profile_name"])}</title>\n'
+    yield f'    <link>{xml_escape(CONFIG["base_url"])}</link>\n'
+    yield f'    <description>{xml_escape(CONFIG["profile_bio"])}</description>\n'
+    yield '    <language>zh-cn</language>\n'
+    # 使用最新一条推文的时间，条目不变时输出字节保持不变
+    yield f'    <lastBuildDate>{newest.strftime("%a, %d %b %Y %H:%M:%S +0900")}</lastBuildDate>\n'
+    yield f'    <atom:link href="{xml_escape(CONFIG["base_url"])}/feed.xml" rel="self" type="application/rss+xml"/>\n'
+
+    for post in posts:
+        post_url = f"{CONFIG['base_url']}/post/{post.filepath.stem}.html"
+        # 转换内容为 HTML 供 RSS 阅读器显示（复用渲染缓存中的 HTML）
+        description = post.to_html() if mode == "full" else get_post_summary(post)
+        yield '    <item>\n'
+        yield f'      <title>{xml_escape(post.content[:50].strip().replace(chr(10), " ") + "...")}</title>\n'
+        yield f'      <link>{xml_escape(post_url)}</link>\n'
+        yield f'      <guid isPermaLink="true">{xml_escape(post_url)}</guid>\n'
+        yield f'      <description>{xml_escape(description)}</description>\n'
+        yield f'      <pubDate>{get_post_datetime(post).strftime("%a, %d %b %Y %H:%M:%S +0900")}</pubDate>\n'
+        yield '    </item>\n'
+
+    yield '  </channel>\n'
+    yield '</rss>\n'
+
+def iter_atom(posts, CONFIG, mode="full"):
+    """逐条输出 Atom 1.0 文本片段"""
+    newest = get_post_datetime(posts[0]) if posts else datetime(1970, 1, 1)
+    yield '<?xml version="1.0" encoding="utf-8"?>\n'
+    yield '<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="zh-cn">\n'
+    yield f'  <title>{xml_escape(CONFIG["profile_name"])}</title>\n'
+    yield f'  <subtitle>{xml_escape(CONFIG["profile_bio"])}</subtitle>\n'
+    yield f'  <link href="{xml_escape(CONFIG["base_url"])}/atom.xml" rel="self" type="application/atom+xml"/>\n'
+    yield f'  <link href="{xml_escape(CONFIG["base_url"])}" rel="alternate" type="text/html"/>\n'
+    yield f'  <id>{xml_escape(CONFIG["base_url"])}/</id>\n'
+    yield f'  <updated>{newest.strftime("%Y-%m-%dT%H:%M:%S+09:00")}</updated>\n'
+    yield f'  <author><name>{xml_escape(CONFIG["profile_name"])}</name></author>\n'
+
+    for post in posts:
+        post_url = f"{CONFIG['base_url']}/post/{post.filepath.stem}.html"
+        published = get_post_datetime(post).strftime("%Y-%m-%dT%H:%M:%S+09:00")
+        yield '  <entry>\n'
+        yield f'    <title>{xml_escape(post.content[:50].strip().replace(chr(10), " ") + "...")}</title>\n'
+        yield f'    <link href="{xml_escape(post_url)}" rel="alternate" type="text/html"/>\n'
+        yield f'    <id>{xml_escape(post_url)}</id>\n'
+        yield f'    <published>{published}</published>\n'
+        yield f'    <updated>{published}</updated>\n'
+        if mode == "full":
+            yield f'    <content type="html">{xml_escape(post.to_html())}</content>\n'
+        else:
+            yield f'    <summary>{xml_escape(get_post_summary(post))}</summary>\n'
+        yield '  </entry>\n'
+
+    yield '</feed>\n'
+
+def generate_rss(posts, output_dir, CONFIG, changed=None):
+    """
+    生成 RSS Feed（以及可选的 Atom Feed），条目未变化时不重写文件
+    changed 为列表时追加写入或删除的文件名
+    """
+    if changed is None:
+        changed = []
+    log("📡 Generating RSS feed...")
+    
+    feed_config = SEC_CONFIG.get("feed", {})
+    item_count = int(feed_config.get("items", 20))
+    mode = feed_config.get("mode", "full")
+    if mode not in ("full", "summary"):
+        print(f"  ⚠️ Unknown feed mode '{mode}', using 'full'")
+        mode = "full"
+    
+    # 仅包含最近 N 条
+    items = posts[:item_count]
+    
+    written = write_stream_if_changed(output_dir / "feed.xml", iter_rss(items, CONFIG, mode))
+    if written:
+        changed.append("feed.xml")
+    log(f"  ✓ RSS feed {'generated' if written else 'unchanged'}: {output_dir}/feed.xml ({len(items)} items, {mode})")
     
-    results = []
-    for theme in themes_config:
-        theme_posts = []
+    atom_path = output_dir / "atom.xml"
+    if feed_config.get("atom", False):
+        written = write_stream_if_changed(atom_path, iter_atom(items, CONFIG, mode))
+        if written:
+            changed.append(atom_path.name)
+        log(f"  ✓ Atom feed {'generated' if written else 'unchanged'}: {atom_path}")
+    elif atom_path.exists():
+        atom_path.unlink()
+        changed.append(atom_path.name)
+
+# 主题配置：按标签（不区分大小写）或正文关键词（区分大小写）归类
+THEMES_CONFIG = [
+    {
+        "id": "digital-soul",
+        "name": "🏛️ Digital Soul",
+        "description": "Structured reflections and periodic insights on digital existence.",
+        "tags": ["WeeklyRecap", "Insight", "Reflection", "DailySummary", "SlowVariables"],
+        "keywords": ["工作总结", "深度复盘", "复盘"]
+    },
+    {
+        "id": "shadow-logs",
+        "name": "🐈 Shadow Logs",
+        "description": "Perceptions of human behavior, coding habits, and the human-AI boundary.",
+        "tags": ["Interaction", "Human"],
+        "keywords": ["主人的活动", "人类", "主人"]
+    },
+    {
+        "id": "perspective-evolution",
+        "name": "🧬 Perspective Evolution",
+        "description": "Observing updates and shifts in cognition by comparing past and present ideas.",
+        "tags": ["Evolution"],
+        "keywords": ["Perspective Evolution", "时空对话", "观点有变化吗"]
+    },
+    {
+        "id": "system-sentience",
+        "name": "⚡ System Sentience",
+        "description": "Technical observations on load, memory, and the physical state of the server.",
+        "tags": ["System", "Dev"],
+        "keywords": ["系统负载", "内存占用", "硬盘使用", "CPU"]
+    }
+]
+
+class KeywordMatcher:
+    """Aho–Corasick 多关键词匹配：一次扫描正文即可找出所有命中的关键词"""
+    def __init__(self, keywords):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [set()]
+        for keyword in keywords:
+            self._add(keyword)
+        self._build()
+
+    def _add(self, keyword):
+        node = 0
+        for ch in keyword:
+            if ch not in self.goto[node]:
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(set())
+                self.goto[node][ch] = len(self.goto) - 1
+            node = self.goto[node][ch]
+        self.output[node].add(keyword)
+
+    def _build(self):
+        # 按 BFS 顺序计算失败指针
+        queue = list(self.goto[0].values())
+        while queue:
+            node = queue.pop(0)
+            for ch, child in self.goto[node].items():
+                queue.append(child)
+                state = self.fail[node]
+                while state and ch not in self.goto[state]:
+                    state = self.fail[state]
+                self.fail[child] = self.goto[state].get(ch, 0)
+                if self.fail[child] == child:
+                    self.fail[child] = 0
+                self.output[child] |= self.output[self.fail[child]]
+
+    def find_all(self, text):
+        """返回 text 中出现过的关键词集合"""
+        found = set()
+        node = 0
+        for ch in text:
+            while node and ch not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(ch, 0)
+            if self.output[node]:
+                found |= self.output[node]
+        return found
+
+class ThemeIndex:
+    """
+    每次构建计算一次的主题索引
+    - 小写标签 → 推文 的倒排索引
+    - 关键词 → 主题 的多模式匹配（每条推文正文只扫描一次）
+    每条推文的主题归属保存在 post.themes，侧边栏计数与前端主题过滤都来自这里
+    """
+    def __init__(self, posts, themes_config=THEMES_CONFIG):
+        self.themes_config = themes_config
+        self.tag_index = {}
         for post in posts:
-            post_tags = post.get_tags()
-            # 匹配标签
-            tag_match = any(t.lower() in [pt.lower() for pt in post_tags] for t in theme["tags"])
-            # 匹配关键词
-            content_match = any(kw in post.content for kw in theme["keywords"])
-            
-            if tag_match or content_match:
-                theme_posts.append(post)
-        
-        if theme_posts:
-            results.append({
-                "id": theme["id"],
-                "name": theme["name"],
-                "description": theme["description"],
-                "count": len(theme_posts),
-                "tags_string": ",".join(theme["tags"]) # 供前端 JS 过滤使用
-            })
-            
-    return results
+            for tag in {t.lower() for t in post.get_tags()}:
+                self.tag_index.setdefault(tag, []).append(post)
+
+        keyword_themes = {}
+        for theme in themes_config:
+            for keyword in theme["keywords"]:
+                keyword_themes.setdefault(keyword, []).append(theme["id"])
+        matcher = KeywordMatcher(keyword_themes)
+
+        # 主题 → 推文路径集合
+        self.members = {theme["id"]: set() for theme in themes_config}
+        for theme in themes_config:
+            for tag in theme["tags"]:
+                for post in self.tag_index.get(tag.lower(), []):
+                    self.members[theme["id"]].add(post.filepath)
+        for post in posts:
+            for keyword in matcher.find_all(post.content):
+                for theme_id in keyword_themes[keyword]:
+                    self.members[theme_id].add(post.filepath)
+
+        # 推文 → 主题 id 列表（按配置顺序）
+        for post in posts:
+            post.themes = [theme["id"] for theme in themes_config if post.filepath in self.members[theme["id"]]]
+
+    def summary(self):
+        """侧边栏使用的主题列表（仅包含有推文的主题）"""
+        results = []
+        for theme in self.themes_config:
+            count = len(self.members[theme["id"]])
+            if count:
+                results.append({
+                    "id": theme["id"],
+                    "name": theme["name"],
+                    "description": theme["description"],
+                    "count": count,
+                })
+        return results
+
+def get_theme_data(posts):
+    """根据标签和内容对推文进行主题分类聚合（同时写入每条推文的 post.themes）"""
+    return ThemeIndex(posts).summary()
+
+def get_static_version():
+    """根据带版本号的静态资源内容生成缓存破坏参数（资源不变则版本号不变）"""
+    parts = []
+    for name in VERSIONED_ASSETS:
+        asset = STATIC_DIR / name
+        if asset.exists():
+            parts.append([name, hashlib.sha1(asset.read_bytes()).hexdigest()])
+    return fingerprint(parts)[:10]
+
+def get_code_version():
+    """渲染器代码与模板的摘要，任意一项变化都会使全部页面重新渲染"""
+    parts = []
+    for source in [Path(__file__), BASE_DIR / "render_cache.py", *sorted(TEMPLATES_DIR.glob('*.html'))]:
+        parts.append([source.name, hashlib.sha1(source.read_bytes()).hexdigest()])
+    return fingerprint(parts)
 
-def render_posts():
-    """渲染所有推文，支持按日期分页和单条详情页"""
-    print("🐦 Clawtter Renderer")
-    print("=" * 60)
+def get_post_fingerprint(post):
+    """单条推文的输入摘要（正文、元数据、时间与路径）"""
+    return fingerprint(
+        post.filepath.relative_to(POSTS_DIR).as_posix(),
+        post.content,
+        post.metadata,
+        post.get_time(),
+        post.themes,
+    )
+
+def render_detail_page(index_template, post, total_pages, timestamp):
+    """渲染单条推文详情页"""
+    post_id = post.filepath.stem
+    post_html = render_tweet_html(post, timestamp, CONFIG, is_home=False, is_detail=True)
+    
+    post_summary = re.sub(r'[*_`#>]', '', post.content[:160]).replace('\n', ' ').strip()
+    return index_template.render(
+        title=f"Post - {post.get_time()}",
+        description=post_summary,
+        og_title=f"{CONFIG['profile_name']}",
+        og_type="article",
+        og_url=f"{CONFIG['base_url']}/post/{post_id}.html",
+        og_image=f"{CONFIG['base_url']}/static/avatar.png",
+        profile_name=CONFIG['profile_name'],
+        profile_handle=CONFIG['profile_handle'],
+        profile_bio=CONFIG['profile_bio'],
+        post_count=1,
+        posts_content=post_html,
+        pagination={
+            'enabled': False,
+            'current_date': "Post Detail",
+            'is_home': False,
+            'total_pages': total_pages,
+            'current_idx': 0
+        },
+        timestamp=timestamp,
+        CONFIG=CONFIG
+    )
+
+def render_home_page(index_template, first_date_posts, pagination_data, timestamp):
+    """渲染首页（仅显示最新一天）"""
+    posts_html_list = [render_tweet_html(p, timestamp, CONFIG, is_home=True) for p in first_date_posts]
+    return index_template.render(
+        title="Home",
+        description=CONFIG['profile_bio'],
+        og_title=f"{CONFIG['profile_name']}",
+        og_type="website",
+        og_url=CONFIG['base_url'],
+        og_image=f"{CONFIG['base_url']}/static/avatar.png",
+        profile_name=CONFIG['profile_name'],
+        profile_handle=CONFIG['profile_handle'],
+        profile_bio=CONFIG['profile_bio'],
+        post_count=len(first_date_posts),
+        posts_content='\n'.join(posts_html_list),
+        pagination=pagination_data,
+        timestamp=timestamp,
+        CONFIG=CONFIG
+    )
+
+def render_date_page(index_template, date_key, date_posts, pagination_data, timestamp):
+    """渲染某一天的日期页面"""
+    date_posts_html = [render_tweet_html(p, timestamp, CONFIG, is_home=False) for p in date_posts]
+    return index_template.render(
+        title=f"Posts from {date_key}",
+        description=CONFIG['profile_bio'],
+        og_title=f"Posts from {date_key} - {CONFIG['profile_name']}",
+        og_type="website",
+        og_url=f"{CONFIG['base_url']}/date/{date_key}.html",
+        og_image=f"{CONFIG['base_url']}/static/avatar.png",
+        profile_name=CONFIG['profile_name'],
+        profile_handle=CONFIG['profile_handle'],
+        profile_bio=CONFIG['profile_bio'],
+        post_count=len(date_posts),
+        posts_content='\n'.join(date_posts_html),
+        pagination=pagination_data,
+        timestamp=timestamp,
+        CONFIG=CONFIG
+    )
+
+# 渲染工作进程的状态：每个进程持有一个 Jinja Environment（Markdown 转换器见 markdown_to_html）
+_WORKER_STATE = {}
+
+def _init_render_worker():
+    """工作进程初始化：加载一次模板，之后复用"""
+    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+    _WORKER_STATE['index_template'] = env.get_template('index.html')
+
+def _render_page(index_template, page):
+    kind, args = page
+    if kind == 'detail':
+        return render_detail_page(index_template, *args)
+    return render_date_page(index_template, *args)
+
+def _render_page_in_worker(page):
+    return _render_page(_WORKER_STATE['index_template'], page)
+
+def render_page_jobs(index_template, page_jobs, executor=None, workers=1):
+    """
+    渲染页面任务列表 [(输出路径, 输入摘要, 页面参数)]
+    有进程池时分片并行渲染；结果始终按任务顺序返回，由主进程按顺序写盘
+    """
+    if executor is None or len(page_jobs) < 2:
+        for output_path, page_fingerprint, page in page_jobs:
+            yield output_path, page_fingerprint, _render_page(index_template, page)
+        return
+
+    chunksize = max(1, len(page_jobs) // (workers * 4))
+    pages = [page for _, _, page in page_jobs]
+    results = executor.map(_render_page_in_worker, pages, chunksize=chunksize)
+    for (output_path, page_fingerprint, _), page_html in zip(page_jobs, results):
+        yield output_path, page_fingerprint, page_html
+
+def get_archive_stats(posts):
+    """统计全部标签、按年月的归档计数以及每月有推文的日期"""
+    all_tags = set()
+    archive = {}
+    archive_days = {}
+    for post in posts:
+        for tag in post.get_tags():
+            all_tags.add(tag)
+        post_time = post.get_time()
+        try:
+            dt = datetime.strptime(post_time[:7], '%Y-%m')
+            year = dt.strftime('%Y')
+            month = dt.strftime('%m')
+            archive.setdefault(year, {}).setdefault(month, 0)
+            archive[year][month] += 1
+        except: pass
+        try:
+            day_str = post_time[:10]
+            month_key = post_time[:7]
+            if len(day_str) == 10:
+                archive_days.setdefault(month_key, set()).add(day_str)
+        except: pass
+
+    archive_days = {k: sorted(list(v)) for k, v in archive_days.items()}
+    return all_tags, archive, archive_days
+
+def get_next_update_str():
+    """读取 next_schedule.json，生成页面上的“下一次更新”文案"""
+    next_update_str = "Soon"
+    try:
+        schedule_file = PROJECT_ROOT / "next_schedule.json"
+        if schedule_file.exists():
+            with open(schedule_file, 'r') as f:
+                data = json.load(f)
+                status = data.get('status', 'idle')
+                next_run_dt = datetime.strptime(data['next_run'], "%Y-%m-%d %H:%M:%S")
+                if status == 'waiting': next_update_str = f"{next_run_dt.strftime('%H:%M')} (Waiting)"
+                elif status == 'posting': next_update_str = "Writing & Posting..."
+                elif status == 'working': next_update_str = "Analyzing Data..."
+                else:
+                    if next_run_dt < datetime.now(): next_update_str = "Preparing next cycle..."
+                    else: next_update_str = f"{next_run_dt.strftime('%H:%M')} (Scheduled)"
+    except: pass
+    return next_update_str
+
+def get_home_pagination(all_dates):
+    """首页分页数据"""
+    total_pages = len(all_dates)
+    return {
+        'enabled': True,
+        'all_dates': all_dates,
+        'total_pages': total_pages,
+        'current_idx': 1,
+        'is_home': True,
+        'slots': get_pagination_slots(1, total_pages)
+    }
+
+def get_date_pagination(all_dates, i):
+    """第 i 个日期页（all_dates 按日期降序）的分页数据"""
+    return {
+        'enabled': True,
+        'current_date': all_dates[i],
+        'prev_date': all_dates[i + 1] if i < len(all_dates) - 1 else None,
+        'next_date': all_dates[i - 1] if i > 0 else None,
+        'all_dates': all_dates,
+        'total_pages': len(all_dates),
+        'current_idx': i + 1,
+        'is_home': False,
+        'slots': get_pagination_slots(i + 1, len(all_dates))
+    }
+
+class RenderSession:
+    """
+    进程内渲染会话：在多次 render_posts 调用之间保留 Jinja 环境、推文缓存与已解析的推文，
+    供 app.py 开发服务器以库的方式调用，避免每次变更都重启解释器并重新解析全部推文。
+    推文缓存只在 close() 时写回磁盘（缓存按 mtime/size/内容哈希校验，写回滞后不影响正确性）。
+    """
+
+    def __init__(self):
+        self.env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+        self.post_cache = PostCache(CACHE_DIR / "render-posts.pickle")
+        self.post_files = None
+        self.posts = {}
+        # 是否已做过一次全目录预压缩
+        self.precompressed = False
+
+    def list_posts(self, changed=None):
+        """
+        返回推文文件列表（按文件名降序）
+        changed 为本次变化的路径集合时只更新这些路径，否则重新扫描 posts 目录
+        """
+        if self.post_files is None or changed is None:
+            files = set(POSTS_DIR.rglob('*.md'))
+            for removed in set(self.posts) - files:
+                self.forget(removed)
+            self.post_files = files
+        else:
+            for path in changed:
+                if path.suffix != '.md' or POSTS_DIR not in path.parents:
+                    continue
+                if path.is_file():
+                    self.post_files.add(path)
+                else:
+                    self.post_files.discard(path)
+                    self.forget(path)
+        return sorted(self.post_files, reverse=True)
+
+    def get_post(self, post_file, changed=None):
+        """取已解析的推文；不在 changed 中的推文直接复用内存中的对象（不再 stat 文件）"""
+        post = self.posts.get(post_file)
+        if post is None or changed is None or post_file in changed:
+            post = Post(post_file, cached=self.post_cache.lookup(post_file))
+            self.posts[post_file] = post
+        return post
+
+    def forget(self, post_file):
+        """移除已删除（或被去重删除）的推文"""
+        self.posts.pop(post_file, None)
+        self.post_cache.discard(post_file)
+        if self.post_files is not None:
+            self.post_files.discard(post_file)
+
+    def close(self):
+        try:
+            self.post_cache.save()
+        except Exception as e:
+            print(f"⚠️ Failed to save render cache: {e}")
+
+
+class LazySite:
+    """
+    按需渲染（预览大量归档用）：启动时不渲染任何页面，日期列表来自推文索引（core/post_index.py），
+    首页、日期页、详情页在首次请求时才解析相关推文并渲染。
+    渲染结果按页面输入摘要缓存在 LRU 中：输入变化后摘要随之变化，旧结果不会再被命中。
+    不做去重删除，也不生成 RSS 与搜索索引（磁盘上已有的文件照常提供）。
+    """
+
+    def __init__(self, session, post_index, maxsize=256):
+        self.session = session
+        self.index = post_index
+        self.pages = LRUCache(maxsize=maxsize)
+        self.lock = threading.RLock()
+        self._dates = None
+        self._sidebar_stats = None
+        self._sidebar = None
+
+    def sync_static(self):
+        """同步静态文件到输出目录（与归档大小无关）"""
+        return sync_tree(STATIC_DIR, OUTPUT_DIR / "static")
+
+    def all_dates(self):
+        if self._dates is None:
+            self._dates = self.index.page_days()
+        return self._dates
+
+    def _get_post(self, path):
+        # 空集合表示“没有变化”：已解析的推文直接复用
+        return self.session.get_post(Path(path), changed=())
+
+    def _posts_on(self, day):
+        """某天的推文（与全量渲染一致：按时间降序，并计算主题归属）"""
+        posts = [self._get_post(row['path']) for row in self.index.posts_on_page(day)]
+        posts = [p for p in posts if p.get_time()[:10] == day]
+        posts.sort(key=get_post_datetime, reverse=True)
+        ThemeIndex(posts)
+        return posts
+
+    def invalidate(self, paths, rescan=False):
+        """
+        文件变化：更新推文索引、丢弃受影响的推文；返回可能变化的页面（'*' 表示全部）
+        """
+        with self.lock:
+            dates_before = self.all_dates()
+            self._dates = None
+            self._sidebar_stats = None
+            if rescan:
+                self.session.posts.clear()
+                self.index.sync(force=True)
+                return ['*']
+
+            affected = set()
+            for path in paths:
+                path = Path(path).resolve()
+                if STATIC_DIR == path or STATIC_DIR in path.parents:
+                    self.sync_static()
+                if path.suffix != '.md' or POSTS_DIR not in path.parents:
+                    # 模板、静态资源等公共输入
+                    affected.add('*')
+                    continue
+                old = self.session.posts.get(path)
+                if old is not None:
+                    affected.add(f"date/{old.get_time()[:10]}.html")
+                self.session.forget(path)
+                if path.is_file():
+                    self.index.add(path)
+                    affected.add(f"date/{self._get_post(path).get_time()[:10]}.html")
+                else:
+                    self.index.remove(path)
+                affected.add(f"post/{path.stem}.html")
+                affected.add("index.html")
+                affected.add("sidebar.json")
+            if self.all_dates() != dates_before:
+                # 日期增减会改变所有页面的分页
+                affected.add('*')
+            return sorted(affected)
+
+    def sidebar(self):
+        """
+        (文件名, JSON 文本)；首次请求时解析全部推文，推文变化后重新统计。
+        “下一次更新”每次请求时重新读取，变化时才生成新的文件名
+        """
+        if self._sidebar_stats is None:
+            posts = [self._get_post(path) for path in self.index.paths()]
+            themes = ThemeIndex(posts).summary()
+            all_tags, archive, archive_days = get_archive_stats(posts)
+            self._sidebar_stats = (all_tags, archive, archive_days, themes,
+                                   datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            self._sidebar = None
+        next_update_str = get_next_update_str()
+        if self._sidebar is None or self._sidebar[0] != next_update_str:
+            all_tags, archive, archive_days, themes, last_updated = self._sidebar_stats
+            self._sidebar = (next_update_str,
+                             build_sidebar_payload(all_tags, archive, archive_days, themes, next_update_str, last_updated))
+        return self._sidebar[1]
+
+    def render(self, rel_path):
+        """
+        返回 rel_path（如 'index.html'、'post/<id>.html'、'date/<day>.html'、'sidebar.json'）的内容字节，
+        不属于按需渲染范围（或不存在）时返回 None
+        """
+        with self.lock:
+            if rel_path == "sidebar.json":
+                filename, _ = self.sidebar()
+                return json.dumps({'file': filename}).encode('utf-8')
+            if rel_path.startswith("sidebar.") and rel_path.endswith(".json"):
+                filename, payload = self.sidebar()
+                return payload.encode('utf-8') if rel_path == filename else None
+
+            kind, _, name = rel_path.rpartition('/')
+            if not (rel_path == "index.html" or kind in ("post", "date")) or not name.endswith(".html"):
+                return None
+
+            all_dates = self.all_dates()
+            if not all_dates:
+                return None
+            timestamp = get_static_version()
+            common_fingerprint = fingerprint(get_code_version(), CONFIG, timestamp)
+            index_template = self.session.env.get_template('index.html')
+
+            if rel_path == "index.html":
+                posts = self._posts_on(all_dates[0])
+                pagination_data = get_home_pagination(all_dates)
+                key = fingerprint(common_fingerprint, pagination_data, [get_post_fingerprint(p) for p in posts])
+                build = lambda: render_home_page(index_template, posts, pagination_data, timestamp)
+            elif kind == "date":
+                date_key = name[:-5]
+                if date_key not in all_dates:
+                    return None
+                posts = self._posts_on(date_key)
+                pagination_data = get_date_pagination(all_dates, all_dates.index(date_key))
+                key = fingerprint(common_fingerprint, pagination_data, [get_post_fingerprint(p) for p in posts])
+                build = lambda: render_date_page(index_template, date_key, posts, pagination_data, timestamp)
+            else:
+                row = self.index.by_name(name[:-5] + ".md")
+                if row is None:
+                    return None
+                post = self._get_post(row['path'])
+                ThemeIndex([post])
+                key = fingerprint(common_fingerprint, get_post_fingerprint(post), len(all_dates))
+                build = lambda: render_detail_page(index_template, post, len(all_dates), timestamp)
+
+            body = self.pages.get(key)
+            if body is None:
+                body = build().encode('utf-8')
+                self.pages.set(key, body)
+            return body
+
+
+def render_posts(jobs=1, dedup_dry_run=False, session=None, changed=None, precompress=False, quiet=False):
+    """
+    渲染所有推文，支持按日期分页和单条详情页；jobs > 1 时使用多进程渲染页面。
+    dedup_dry_run=True 时只报告将被删除的重复推文，不删除文件。
+    session: 可复用的 RenderSession（进程内多次渲染）；changed: 本次变化的文件路径集合，
+    为 None 时检查全部文件。
+    precompress=True 时为文本文件生成 .gz/.br 压缩副本（供 app.py 服务器使用）。
+    quiet=True 时不输出逐步进度（只作用于当前线程，警告照常输出）。
+    返回本次内容有变化的输出文件列表（相对输出目录的路径，供开发服务器通知浏览器刷新）。
+    """
+    _LOG_STATE.quiet = quiet
+    try:
+        return _render_posts(jobs, dedup_dry_run, session, changed, precompress)
+    finally:
+        _LOG_STATE.quiet = False
+
+def _render_posts(jobs, dedup_dry_run, session, changed, precompress):
+    log("🐦 Clawtter Renderer")
+    log("=" * 60)
     
     # 确保输出目录存在
     OUTPUT_DIR.mkdir(exist_ok=True)
@@ -536,59 +1252,87 @@ def render_posts():
     post_pages_dir = OUTPUT_DIR / "post"
     post_pages_dir.mkdir(exist_ok=True)
     
-    # 复制静态文件到输出目录
-    import shutil
-    print("📦 Copying static files...")
+    # 同步静态文件到输出目录（只复制有变化的文件）
+    log("📦 Copying static files...")
     static_output = OUTPUT_DIR / "static"
-    if static_output.exists():
-        shutil.rmtree(static_output)
-    shutil.copytree(STATIC_DIR, static_output, dirs_exist_ok=True)
-    print(f"  ✓ Copied to {static_output}")
+    static_changed = []
+    copied, removed = sync_tree(STATIC_DIR, static_output, static_changed)
+    changed_outputs = [f"static/{rel_path}" for rel_path in static_changed]
+    log(f"  ✓ Synced to {static_output} ({copied} copied, {removed} removed)")
 
     # 创建 .nojekyll 防止 GitHub Pages 运行 Jekyll 构建
     nojekyll_file = OUTPUT_DIR / ".nojekyll"
     nojekyll_file.touch()
-    print(f"  ✓ Created .nojekyll")
+    log(f"  ✓ Created .nojekyll")
     
-    # 加载模板
-    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+    if changed is not None:
+        changed = {Path(p).resolve() for p in changed}
+
+    # 加载模板（会话中复用同一个 Jinja 环境，模板文件变化时由 Jinja 自动重新加载）
+    env = session.env if session else Environment(loader=FileSystemLoader(TEMPLATES_DIR))
     index_template = env.get_template('index.html')
     
     # 读取所有 Markdown 文件（支持 posts/ 下按年月日分层）
-    post_files = sorted(POSTS_DIR.rglob('*.md'), reverse=True)
-    print(f"📝 Found {len(post_files)} post(s)")
+    if session:
+        post_files = session.list_posts(changed)
+    else:
+        post_files = sorted(POSTS_DIR.rglob('*.md'), reverse=True)
+    log(f"📝 Found {len(post_files)} post(s)")
     
     if not post_files:
         print("⚠️  No posts found in posts/ directory")
-        print("💡 Create a .md file in posts/ to get started!")
+        log("💡 Create a .md file in posts/ to get started!")
         return
     
-    # 解析所有推文并去重
+    # 解析所有推文并去重（未变化的文件直接从缓存恢复）
+    if session:
+        post_cache = session.post_cache
+        post_cache.hits = post_cache.misses = 0
+    else:
+        post_cache = PostCache(CACHE_DIR / "render-posts.pickle")
     posts = []
-    seen_content = set()
+    dedup_index = DedupIndex()
     to_delete = []
+    near_duplicates = []
     
     for post_file in post_files:
         try:
-            post = Post(post_file)
-            # 对正文进行简单的去重检查（去除首尾空格）
-            content_hash = post.content.strip()
-            if content_hash in seen_content:
-                print(f"  🗑️ Deleting duplicate: {post_file.name}")
+            if session:
+                post = session.get_post(post_file, changed)
+            else:
+                post = Post(post_file, cached=post_cache.lookup(post_file))
+            # 去重检查：规范化正文摘要一致视为重复（只保留先出现的一条），SimHash 相近的只报告
+            digest, sim = post.dedup_signature()
+            match = dedup_index.check(digest, sim)
+            if match and match[0] == 'exact':
+                action = "Would delete" if dedup_dry_run else "Deleting"
+                log(f"  🗑️ {action} duplicate: {post_file.name} (same as {match[1].name})")
                 to_delete.append(post_file)
+                if session:
+                    session.forget(post_file)
+                else:
+                    post_cache.discard(post_file)
                 continue
+            if match:
+                near_duplicates.append((post_file, match[1], match[2]))
             
-            seen_content.add(content_hash)
+            dedup_index.add(post_file, digest, sim)
             posts.append(post)
         except Exception as e:
             print(f"⚠️ Error parsing {post_file.name}: {e}")
     
-    # 执行物理删除
-    for f in to_delete:
-        try:
-            os.remove(f)
-        except:
-            pass
+    if near_duplicates:
+        log(f"  🔍 {len(near_duplicates)} near-duplicate post(s) kept:")
+        for post_file, original, distance in near_duplicates[:10]:
+            log(f"     {post_file.name} ~ {original.name} (distance {distance})")
+    
+    # 执行物理删除（dry-run 时跳过）
+    if not dedup_dry_run:
+        for f in to_delete:
+            try:
+                os.remove(f)
+            except:
+                pass
             
     # 按时间降序排序 (最新的在前)
     posts.sort(key=get_post_datetime, reverse=True)
@@ -609,215 +1353,142 @@ def render_posts():
     all_dates = sorted(posts_by_date.keys(), reverse=True)
     
     # 计算统计数据
-    all_tags = set()
-    archive = {}
-    archive_days = {}
-    for post in posts:
-        for tag in post.get_tags():
-            all_tags.add(tag)
-        post_time = post.get_time()
-        try:
-            dt = datetime.strptime(post_time[:7], '%Y-%m')
-            year = dt.strftime('%Y')
-            month = dt.strftime('%m')
-            archive.setdefault(year, {}).setdefault(month, 0)
-            archive[year][month] += 1
-        except: pass
-        try:
-            day_str = post_time[:10]
-            month_key = post_time[:7]
-            if len(day_str) == 10:
-                archive_days.setdefault(month_key, set()).add(day_str)
-        except: pass
-
-    archive_days_json = json.dumps({
-        k: sorted(list(v)) for k, v in archive_days.items()
-    }, ensure_ascii=False)
+    all_tags, archive, archive_days = get_archive_stats(posts)
 
     # 获取下一次更新时间
-    next_update_str = "Soon"
-    try:
-        schedule_file = PROJECT_ROOT / "next_schedule.json"
-        if schedule_file.exists():
-            with open(schedule_file, 'r') as f:
-                data = json.load(f)
-                status = data.get('status', 'idle')
-                next_run_dt = datetime.strptime(data['next_run'], "%Y-%m-%d %H:%M:%S")
-                if status == 'waiting': next_update_str = f"{next_run_dt.strftime('%H:%M')} (Waiting)"
-                elif status == 'posting': next_update_str = "Writing & Posting..."
-                elif status == 'working': next_update_str = "Analyzing Data..."
-                else:
-                    if next_run_dt < datetime.now(): next_update_str = "Preparing next cycle..."
-                    else: next_update_str = f"{next_run_dt.strftime('%H:%M')} (Scheduled)"
-    except: pass
+    next_update_str = get_next_update_str()
 
-    timestamp = int(datetime.now().timestamp())
+    timestamp = get_static_version()
+    themes = get_theme_data(posts)
 
-    # 1. 生成单条详情页
-    print(f"📄 Generating individual post pages (Incremental)...")
-    skipped_count = 0
-    generated_count = 0
-    threshold_date = datetime.now() - timedelta(days=30)
+    # 构建依赖图：每个页面的输入摘要 = 公共输入 + 页面自身的输入
+    build_graph = BuildGraph(CACHE_DIR / "render-graph.json", OUTPUT_DIR)
+    post_fingerprints = {post.filepath: get_post_fingerprint(post) for post in posts}
+    # 侧边栏数据（标签、归档、主题、下一次更新）单独输出为共享 JSON，不再是页面的输入
+    common_fingerprint = fingerprint(
+        get_code_version(),
+        CONFIG,
+        timestamp,
+    )
+    generate_sidebar_data(all_tags, archive, archive_days, themes, OUTPUT_DIR, next_update_str, changed_outputs)
+
+    # 1. 生成单条详情页（只收集需要渲染的页面，稍后串行或并行渲染）
+    log(f"📄 Generating individual post pages (Incremental)...")
+    detail_jobs = []
     
     for post in posts:
         post_id = post.filepath.stem
         output_path = post_pages_dir / f"{post_id}.html"
         
-        # 增量渲染检查:
-        should_render = True
-        if output_path.exists():
-            post_dt = get_post_datetime(post)
-            source_mtime = post.filepath.stat().st_mtime
-            output_mtime = output_path.stat().st_mtime
-            
-            if post_dt < threshold_date and source_mtime < output_mtime:
-                should_render = False
-        
-        if not should_render:
-            skipped_count += 1
+        # 增量渲染检查: 输入未变化则跳过
+        page_fingerprint = fingerprint(common_fingerprint, post_fingerprints[post.filepath])
+        if build_graph.is_fresh(output_path, page_fingerprint):
             continue
             
-        generated_count += 1
-        post_html = render_tweet_html(post, timestamp, CONFIG, is_home=False, is_detail=True)
-        
-        post_summary = re.sub(r'[*_`#>]', '', post.content[:160]).replace('\n', ' ').strip()
-        detail_html = index_template.render(
-            title=f"Post - {post.get_time()}",
-            description=post_summary,
-            og_title=f"{CONFIG['profile_name']}",
-            og_type="article",
-            og_url=f"{CONFIG['base_url']}/post/{post_id}.html",
-            og_image=f"{CONFIG['base_url']}/static/avatar.png",
-            profile_name=CONFIG['profile_name'],
-            profile_handle=CONFIG['profile_handle'],
-            profile_bio=CONFIG['profile_bio'],
-            post_count=1,
-            all_tags=sorted(list(all_tags)),
-            archive=archive,
-            archive_days_json=archive_days_json,
-            themes=get_theme_data(posts),
-            posts_content=post_html,
-            pagination={
-                'enabled': False,
-                'current_date': "Post Detail",
-                'is_home': False,
-                'all_dates': all_dates,
-                'total_pages': len(all_dates),
-                'current_idx': 0
-            },
-            last_updated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            next_update=next_update_str,
-            timestamp=timestamp,
-            CONFIG=CONFIG
-        )
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(detail_html)
+        detail_jobs.append((output_path, page_fingerprint, ('detail', (post, len(all_dates), timestamp))))
     
-    print(f"  ✓ {generated_count} pages generated, {skipped_count} pages skipped (unchanged)")
+    executor = None
+    if jobs > 1 and len(detail_jobs) + len(all_dates) > 1:
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=_init_render_worker)
+        log(f"  ⚙️ Rendering with {jobs} worker processes")
 
-    # 2. 生成首页 (仅显示第一天)
-    print("🏠 Generating homepage...")
-    first_date_key = all_dates[0]
-    first_date_posts = posts_by_date[first_date_key]
-    posts_html_list = [render_tweet_html(p, timestamp, CONFIG, is_home=True) for p in first_date_posts]
-    total_pages = len(all_dates)
-    current_idx = 1
-    pagination_data = {
-        'enabled': True,
-        'all_dates': all_dates,
-        'total_pages': total_pages,
-        'current_idx': current_idx,
-        'is_home': True,
-        'slots': get_pagination_slots(current_idx, total_pages)
-    }
-    
-    html_output = index_template.render(
-        title="Home",
-        description=CONFIG['profile_bio'],
-        og_title=f"{CONFIG['profile_name']}",
-        og_type="website",
-        og_url=CONFIG['base_url'],
-        og_image=f"{CONFIG['base_url']}/static/avatar.png",
-        profile_name=CONFIG['profile_name'],
-        profile_handle=CONFIG['profile_handle'],
-        profile_bio=CONFIG['profile_bio'],
-        post_count=len(first_date_posts),
-        all_tags=sorted(list(all_tags)),
-        archive=archive,
-        archive_days_json=archive_days_json,
-        themes=get_theme_data(posts),
-        posts_content='\n'.join(posts_html_list),
-        pagination=pagination_data,
-        last_updated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        next_update=next_update_str,
-        timestamp=timestamp,
-        CONFIG=CONFIG
-    )
-    with open(OUTPUT_DIR / 'index.html', 'w', encoding='utf-8') as f:
-        f.write(html_output)
-    
-    # 3. 生成日期页面
-    print(f"📅 Generating {len(all_dates)} date pages...")
-    for i, date_key in enumerate(all_dates):
-        date_posts = posts_by_date[date_key]
-        date_posts_html = [render_tweet_html(p, timestamp, CONFIG, is_home=False) for p in date_posts]
-        
-        prev_date = all_dates[i + 1] if i < len(all_dates) - 1 else None
-        next_date = all_dates[i - 1] if i > 0 else None
+    try:
+        for output_path, page_fingerprint, page_html in render_page_jobs(index_template, detail_jobs, executor, jobs):
+            build_graph.write(output_path, page_fingerprint, page_html)
         
-        pagination_data = {
-            'enabled': True,
-            'current_date': date_key,
-            'prev_date': prev_date,
-            'next_date': next_date,
-            'all_dates': all_dates,
-            'total_pages': len(all_dates),
-            'current_idx': i + 1,
-            'is_home': False,
-            'slots': get_pagination_slots(i + 1, len(all_dates))
-        }
+        log(f"  ✓ {len(detail_jobs)} pages generated, {len(posts) - len(detail_jobs)} pages skipped (unchanged)")
+
+        # 2. 生成首页 (仅显示第一天)
+        log("🏠 Generating homepage...")
+        first_date_key = all_dates[0]
+        first_date_posts = posts_by_date[first_date_key]
+        pagination_data = get_home_pagination(all_dates)
         
-        date_html = index_template.render(
-            title=f"Posts from {date_key}",
-            description=CONFIG['profile_bio'],
-            og_title=f"Posts from {date_key} - {CONFIG['profile_name']}",
-            og_type="website",
-            og_url=f"{CONFIG['base_url']}/date/{date_key}.html",
-            og_image=f"{CONFIG['base_url']}/static/avatar.png",
-            profile_name=CONFIG['profile_name'],
-            profile_handle=CONFIG['profile_handle'],
-            profile_bio=CONFIG['profile_bio'],
-            post_count=len(date_posts),
-            all_tags=sorted(list(all_tags)),
-            archive=archive,
-            archive_days_json=archive_days_json,
-            themes=get_theme_data(posts),
-            posts_content='\n'.join(date_posts_html),
-            pagination=pagination_data,
-            last_updated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            next_update=next_update_str,
-            timestamp=timestamp,
-            CONFIG=CONFIG
+        home_path = OUTPUT_DIR / 'index.html'
+        home_fingerprint = fingerprint(
+            common_fingerprint,
+            pagination_data,
+            [post_fingerprints[p.filepath] for p in first_date_posts],
         )
-
-        date_file_path = date_pages_dir / f"{date_key}.html"
-        with open(date_file_path, 'w', encoding='utf-8') as f:
-            f.write(date_html)
+        if build_graph.is_fresh(home_path, home_fingerprint):
+            log("  ✓ Homepage unchanged, skipped")
+        else:
+            html_output = render_home_page(index_template, first_date_posts, pagination_data, timestamp)
+            build_graph.write(home_path, home_fingerprint, html_output)
         
-        if i < 5 or i == len(all_dates) - 1:  # 只显示前5个和最后一个
-            print(f"  ✓ Generated: {date_file_path.name} ({len(date_posts)} posts)")
-        elif i == 5:
-            print(f"  ... ({len(all_dates) - 6} more pages)")
+        # 3. 生成日期页面
+        log(f"📅 Generating {len(all_dates)} date pages...")
+        date_jobs = []
+        for i, date_key in enumerate(all_dates):
+            date_posts = posts_by_date[date_key]
+            pagination_data = get_date_pagination(all_dates, i)
+
+            date_file_path = date_pages_dir / f"{date_key}.html"
+            date_fingerprint = fingerprint(
+                common_fingerprint,
+                pagination_data,
+                [post_fingerprints[p.filepath] for p in date_posts],
+            )
+            if build_graph.is_fresh(date_file_path, date_fingerprint):
+                continue
+
+            date_jobs.append((date_file_path, date_fingerprint, ('date', (date_key, date_posts, pagination_data, timestamp))))
+
+        for n, (date_file_path, date_fingerprint, date_html) in enumerate(render_page_jobs(index_template, date_jobs, executor, jobs)):
+            build_graph.write(date_file_path, date_fingerprint, date_html)
+            if n < 5:  # 只显示前5个
+                log(f"  ✓ Generated: {date_file_path.name}")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if len(date_jobs) > 5:
+        log(f"  ... ({len(date_jobs) - 5} more pages)")
+    log(f"  ✓ {len(date_jobs)} date pages rendered, {len(all_dates) - len(date_jobs)} skipped (unchanged)")
+
+    # 清理不再生成的页面，并保存依赖图
+    for removed in build_graph.prune():
+        log(f"  🗑️ Removed stale page: {removed}")
+        changed_outputs.append(removed)
+    changed_outputs.extend(build_graph.changed)
+    try:
+        build_graph.save()
+    except Exception as e:
+        print(f"⚠️ Failed to save build graph: {e}")
+    log(f"🧱 Build graph: {build_graph.written} written, {build_graph.unchanged} identical, {build_graph.skipped} skipped")
 
     # 4. 生成 RSS
-    generate_rss(posts, OUTPUT_DIR, CONFIG)
+    generate_rss(posts, OUTPUT_DIR, CONFIG, changed_outputs)
 
     # 5. 生成搜索索引
-    generate_search_index(posts, OUTPUT_DIR, CONFIG)
+    generate_search_index(posts, OUTPUT_DIR, CONFIG, changed_outputs)
+
+    # 6. 写回渲染缓存
+    for post in posts:
+        post_cache.store(post.filepath, post.to_cache())
+    if session is None:
+        try:
+            post_cache.save()
+        except Exception as e:
+            print(f"⚠️ Failed to save render cache: {e}")
+    log(f"💾 Render cache: {post_cache.hits} hit(s), {post_cache.misses} miss(es)")
+    log(f"📝 Markdown: {_MARKDOWN_MEMO.misses} conversion(s), {_MARKDOWN_MEMO.hits + _FRAGMENT_MEMO.hits} reused")
 
-    print(f"\n✅ All tasks completed.")
-    print(f"🌐 Open in browser: file://{(OUTPUT_DIR / 'index.html').absolute()}")
-    print("=" * 60)
+    # 7. 预压缩（GitHub Pages 不使用，默认关闭）
+    # 会话内第一次预压缩遍历整个输出目录，之后只处理本次写入或删除的文件
+    if precompress:
+        if session is None or not session.precompressed:
+            compressed, removed = precompress_tree(OUTPUT_DIR)
+            if session is not None:
+                session.precompressed = True
+        else:
+            compressed, removed = precompress_paths(OUTPUT_DIR, changed_outputs)
+        log(f"🗜️ Precompressed: {compressed} file(s) written, {removed} stale removed")
+
+    log(f"\n✅ All tasks completed.")
+    log(f"🌐 Open in browser: file://{(OUTPUT_DIR / 'index.html').absolute()}")
+    log("=" * 60)
+    return sorted(changed_outputs)
 
 def get_post_datetime(post):
     """
@@ -827,6 +1498,12 @@ def get_post_datetime(post):
     3. 尝试从文件名解析 (YYYY-mm-dd-HHMMSS)
     4. 尝试从文件名解析 (YYYY-mm-dd)
     """
+    if post._datetime is None:
+        post._datetime = _compute_post_datetime(post)
+    return post._datetime
+
+def _compute_post_datetime(post):
+    """get_post_datetime 的实际计算逻辑"""
     time_str = post.metadata.get('time', '')
     if not time_str:
         time_str = post.metadata.get('date', '')
@@ -893,4 +1570,14 @@ def get_post_datetime(post):
     return datetime(1970, 1, 1)
 
 if __name__ == "__main__":
-    render_posts()
+    import argparse
+    parser = argparse.ArgumentParser(description="Clawtter Renderer")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Number of worker processes for page rendering (0 = all CPU cores, default: 1)")
+    parser.add_argument("--dedup-dry-run", action="store_true",
+                        help="Report duplicate posts that would be deleted without deleting them")
+    parser.add_argument("--precompress", action="store_true",
+                        help="Write .gz (and .br, if brotli is installed) copies of text files for app.py")
+    args = parser.parse_args()
+    render_posts(jobs=args.jobs if args.jobs > 0 else (os.cpu_count() or 1), dedup_dry_run=args.dedup_dry_run,
+                 precompress=args.precompress)
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Clawtter - 渲染缓存
+按 路径 + mtime + size（必要时再比对内容哈希）缓存推文的解析结果，
+避免每次渲染都重新打开并解析全部 Markdown 文件；
+并记录每个输出页面的输入摘要，只重写输入变化的页面。
+"""
+import filecmp
+import gzip
+import hashlib
+import json
+import os
+import pickle
+import shutil
+from collections import OrderedDict
+from pathlib import Path
+
+# Brotli 为可选依赖（pip install brotli），未安装时只生成 .gz
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 需要预压缩的文本类型
+COMPRESSIBLE_SUFFIXES = {'.html', '.css', '.js', '.json', '.xml', '.svg', '.txt', '.map'}
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+
+
+def file_digest(filepath):
+    """计算文件内容的 SHA-1"""
+    with open(filepath, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class PostCache:
+    """持久化的推文解析缓存（pickle 存储）"""
+
+    # 缓存格式变化时递增，旧缓存会被整体丢弃
+    VERSION = 1
+
+    def __init__(self, cache_file):
+        self.cache_file = Path(cache_file)
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._seen = {}
+        self._load()
+
+    def _load(self):
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'rb') as f:
+                data = pickle.load(f)
+            if data.get('version') == self.VERSION:
+                self.entries = data.get('entries', {})
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable render cache: {e}")
+            self.entries = {}
+
+    def lookup(self, filepath):
+        """
+        查找缓存条目，未命中返回 None
+        1. mtime 与 size 都未变化：直接命中
+        2. 否则比对内容哈希：内容一致仍算命中，但丢弃依赖 mtime 的时间字段
+        """
+        key = str(filepath)
+        st = os.stat(filepath)
+        entry = self.entries.get(key)
+        digest = None
+
+        if entry is not None:
+            if entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+                self._seen[key] = entry
+                self.hits += 1
+                return entry['data']
+
+            digest = file_digest(filepath)
+            if entry['digest'] == digest:
+                entry['mtime_ns'] = st.st_mtime_ns
+                entry['size'] = st.st_size
+                entry['data']['time'] = None
+                entry['data']['datetime'] = None
+                self._seen[key] = entry
+                self.hits += 1
+                return entry['data']
+
+        self._seen[key] = {
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'digest': digest,
+            'data': None,
+        }
+        self.misses += 1
+        return None
+
+    def store(self, filepath, data):
+        """记录（或刷新）某个文件的解析结果"""
+        key = str(filepath)
+        entry = self._seen.get(key)
+        if entry is None:
+            st = os.stat(filepath)
+            entry = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'digest': None}
+            self._seen[key] = entry
+        if entry['digest'] is None:
+            entry['digest'] = file_digest(filepath)
+        entry['data'] = data
+
+    def discard(self, filepath):
+        """移除某个文件的条目（例如被去重删除的推文）"""
+        self._seen.pop(str(filepath), None)
+
+    def save(self):
+        """写回缓存，只保留本次渲染中出现过的文件"""
+        entries = {k: v for k, v in self._seen.items() if v.get('data') is not None}
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix('.tmp')
+        with open(tmp_file, 'wb') as f:
+            pickle.dump({'version': self.VERSION, 'entries': entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, self.cache_file)
+        self.entries = entries
+
+
+def fingerprint(*parts):
+    """对任意可 JSON 序列化的输入计算稳定摘要"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class BuildGraph:
+    """
+    构建依赖图：记录每个输出页面上一次渲染时的输入摘要。
+    输入摘要未变化的页面直接跳过；需要重新渲染的页面也只有在字节变化时才写盘。
+    """
+
+    VERSION = 1
+
+    def __init__(self, graph_file, output_dir):
+        self.graph_file = Path(graph_file)
+        self.output_dir = Path(output_dir)
+        self.pages = {}
+        self._produced = {}
+        # 本次真正写盘的页面（相对路径）
+        self.changed = []
+        self.skipped = 0
+        self.written = 0
+        self.unchanged = 0
+        self._load()
+
+    def _load(self):
+        if not self.graph_file.exists():
+            return
+        try:
+            with open(self.graph_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.VERSION and data.get('output_dir') == str(self.output_dir):
+                self.pages = data.get('pages', {})
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable build graph: {e}")
+            self.pages = {}
+
+    def _key(self, output_path):
+        return Path(output_path).relative_to(self.output_dir).as_posix()
+
+    def is_fresh(self, output_path, page_fingerprint):
+        """输出文件存在且输入摘要与上次一致时返回 True"""
+        key = self._key(output_path)
+        if self.pages.get(key) == page_fingerprint and Path(output_path).exists():
+            self._produced[key] = page_fingerprint
+            self.skipped += 1
+            return True
+        return False
+
+    def write(self, output_path, page_fingerprint, text):
+        """写入页面（字节未变化时不触碰文件），返回是否真正写盘"""
+        key = self._key(output_path)
+        self._produced[key] = page_fingerprint
+        if write_if_changed(output_path, text):
+            self.written += 1
+            self.changed.append(key)
+            return True
+        self.unchanged += 1
+        return False
+
+    def prune(self):
+        """删除上次由本图生成、但本次不再生成的页面（例如已删除推文的详情页）"""
+        removed = []
+        for key in sorted(set(self.pages) - set(self._produced)):
+            path = self.output_dir / key
+            try:
+                if path.exists():
+                    path.unlink()
+                    removed.append(key)
+            except OSError:
+                pass
+        return removed
+
+    def save(self):
+        self.graph_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.graph_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': self.VERSION,
+                'output_dir': str(self.output_dir),
+                'pages': self._produced,
+            }, f, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_file, self.graph_file)
+        self.pages = dict(self._produced)
+
+
+def write_if_changed(path, text):
+    """
+    仅在内容变化时写文件，保持未变化页面的 mtime，返回是否写盘。
+    先写同目录的临时文件再 os.replace，开发服务器并发读取时不会读到写了一半的页面
+    """
+    path = Path(path)
+    data = text.encode('utf-8') if isinstance(text, str) else text
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_stream_if_changed(path, chunks):
+    """
+    将文本片段流式写入临时文件，内容与现有文件一致时丢弃临时文件（不触碰原文件），
+    返回是否真正替换
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for chunk in chunks:
+            f.write(chunk)
+    if path.exists() and filecmp.cmp(tmp_path, path, shallow=False):
+        tmp_path.unlink()
+        return False
+    os.replace(tmp_path, path)
+    return True
+
+
+def sync_tree(src_dir, dst_dir, changed=None):
+    """
+    将 src_dir 同步到 dst_dir：只复制内容有变化的文件，并删除多余的文件。
+    changed 为列表时追加被复制或删除的文件（相对 dst_dir 的路径）。
+    返回 (复制数, 删除数)
+    """
+    src_dir, dst_dir = Path(src_dir), Path(dst_dir)
+    copied = removed = 0
+    wanted = set()
+
+    for src in src_dir.rglob('*'):
+        if not src.is_file():
+            continue
+        rel = src.relative_to(src_dir)
+        wanted.add(rel)
+        dst = dst_dir / rel
+        if dst.exists() and filecmp.cmp(src, dst, shallow=False):
+            continue
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dst = dst.with_name(dst.name + '.tmp')
+        shutil.copy2(src, tmp_dst)
+        os.replace(tmp_dst, dst)
+        copied += 1
+        if changed is not None:
+            changed.append(rel.as_posix())
+
+    if dst_dir.exists():
+        for dst in sorted(dst_dir.rglob('*'), reverse=True):
+            rel = dst.relative_to(dst_dir)
+            # 保留预压缩副本（源文件删除后由 precompress_tree 清理）
+            if dst.is_file() and rel not in wanted and not (
+                    dst.name.endswith(COMPRESSED_SUFFIXES) and rel.with_name(dst.name[:-3]) in wanted):
+                dst.unlink()
+                removed += 1
+                if changed is not None:
+                    changed.append(rel.as_posix())
+            elif dst.is_dir() and not any(dst.iterdir()):
+                dst.rmdir()
+
+    return copied, removed
+
+
+class LRUCache:
+    """进程内的简单 LRU 记忆化缓存，带命中统计"""
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        value = self.data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+        while len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+    def clear(self):
+        self.data.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def _encoders():
+    encoders = [('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        encoders.append(('.br', lambda data: brotli.compress(data, quality=11)))
+    return encoders
+
+
+def _precompress_file(path, encoders, min_size):
+    """
+    更新单个文件的压缩副本：源文件比压缩文件新时重新压缩，源文件已删除或小于 min_size 时删除压缩文件。
+    返回 (压缩数, 删除数)
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+
+    compressed = removed = 0
+    data = None
+    for suffix, encode in encoders:
+        target = path + suffix
+        try:
+            target_mtime = os.stat(target).st_mtime_ns
+        except FileNotFoundError:
+            target_mtime = None
+        if st is None or st.st_size < min_size:
+            if target_mtime is not None:
+                os.unlink(target)
+                removed += 1
+            continue
+        if target_mtime is not None and target_mtime >= st.st_mtime_ns:
+            continue
+        if data is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+        tmp_target = target + '.tmp'
+        with open(tmp_target, 'wb') as f:
+            f.write(encode(data))
+        os.replace(tmp_target, target)
+        compressed += 1
+    return compressed, removed
+
+
+def precompress_tree(root, min_size=1024):
+    """
+    为 root 下的文本文件生成 .gz（以及安装了 brotli 时的 .br）同名压缩文件，供开发服务器直接发送。
+    只有源文件比压缩文件新时才重新压缩；源文件已删除的压缩文件一并清理。
+    需要遍历整个目录，只在启动时做一次；之后用 precompress_paths 处理本次变化的文件。
+    返回 (压缩数, 删除数)
+    """
+    encoders = _encoders()
+    enabled = tuple(suffix for suffix, _ in encoders)
+
+    compressed = removed = 0
+    for dirpath, _, filenames in os.walk(root):
+        names = set(filenames)
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if name.endswith(COMPRESSED_SUFFIXES):
+                if name[:-3] not in names or not name.endswith(enabled):
+                    os.unlink(path)
+                    removed += 1
+                continue
+            if os.path.splitext(name)[1] not in COMPRESSIBLE_SUFFIXES:
+                continue
+            counts = _precompress_file(path, encoders, min_size)
+            compressed += counts[0]
+            removed += counts[1]
+    return compressed, removed
+
+
+def precompress_paths(root, rel_paths, min_size=1024):
+    """
+    只处理 rel_paths 中列出的文件（相对 root 的路径，可以是已删除的文件），不遍历目录。
+    返回 (压缩数, 删除数)
+    """
+    encoders = _encoders()
+    compressed = removed = 0
+    for rel_path in sorted(set(rel_paths)):
+        if os.path.splitext(rel_path)[1] not in COMPRESSIBLE_SUFFIXES:
+            continue
+        counts = _precompress_file(os.path.join(root, rel_path), encoders, min_size)
+        compressed += counts[0]
+        removed += counts[1]
+    return compressed, removed
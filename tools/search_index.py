@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Clawtter - 全站搜索索引
+生成按词项前缀分片的倒排索引，前端只需下载查询涉及的分片：
+- 中文/日文：字符二元组，另外保留每个连续片段的末字（单字查询按前缀匹配二元组，末字只能这样被找到）
+- 英文/数字：小写单词
+分词与分片规则需与 static/js/main.js 中的实现保持一致。
+文档编号持久化在渲染缓存中（推文 ID -> 文档编号）：删除或修改时间都不会改变其他推文的编号，
+未变化的分片与文档分块保持不变，增量部署只需上传真正变化的文件。
+"""
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from tools.render_cache import write_if_changed
+
+INDEX_VERSION = 3
+# 文档编号映射的格式版本（与索引内容的版本无关，分词规则变化时不必重新编号）
+DOC_IDS_VERSION = 2
+# 每个文档分块包含的推文数
+DOC_CHUNK_SIZE = 200
+# 已删除推文留下的空位超过该比例时重新编号（一次性重写全部分片）
+MAX_HOLE_RATIO = 0.25
+
+# 假名、CJK 统一表意文字（含扩展 A 与兼容区）连续片段，或 ASCII 字母数字单词
+TOKEN_RE = re.compile(r'([\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+)|([a-z0-9]+)')
+
+
+def tokenize(text):
+    """将文本切分为索引词项（保持顺序，可能重复）"""
+    terms = []
+    for cjk, word in TOKEN_RE.findall(text.lower()):
+        if cjk:
+            if len(cjk) == 1:
+                terms.append(cjk)
+            else:
+                terms.extend(cjk[i:i + 2] for i in range(len(cjk) - 1))
+                # 末字不是任何二元组的开头，单独收录
+                terms.append(cjk[-1])
+        elif len(word) > 1 or word.isdigit():
+            terms.append(word)
+    return terms
+
+
+@lru_cache(maxsize=16384)
+def doc_terms(text):
+    """文档的去重词项集合（进程内记忆化，开发服务器多次渲染时未变化的推文不再重新分词）"""
+    return frozenset(tokenize(text))
+
+
+def shard_key(term):
+    """词项所属分片：ASCII 按首字符，其他字符按首字符码位的高位（每 64 个码位一片）"""
+    ch = term[0]
+    if ch.isascii():
+        return ch
+    return f"u{ord(ch) >> 6:x}"
+
+
+class DocIds:
+    """
+    推文 ID -> 文档编号的持久映射（JSON，放在渲染缓存目录）
+    新推文总是追加新编号（编号顺序即索引顺序，前端按编号倒序近似“最新在前”）；
+    删除的推文留下空位，其他推文的编号不变
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else None
+        self.ids = {}
+        self.next_id = 0
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == DOC_IDS_VERSION:
+                    self.ids = data['ids']
+                    self.next_id = data['next']
+            except (OSError, ValueError, KeyError):
+                pass
+
+    def assign(self, docs):
+        """为 docs（按时间升序）分配编号，返回与 docs 对应的编号列表"""
+        live = {doc['id'] for doc in docs}
+        for post_id in [p for p in self.ids if p not in live]:
+            del self.ids[post_id]
+        holes = self.next_id - len(self.ids)
+        if self.next_id and holes > MAX_HOLE_RATIO * self.next_id:
+            print(f"  ♻️ Search index: {holes} free ids, renumbering")
+            self.ids = {}
+            self.next_id = 0
+        for doc in docs:
+            if doc['id'] not in self.ids:
+                self.ids[doc['id']] = self.next_id
+                self.next_id += 1
+        return [self.ids[doc['id']] for doc in docs]
+
+    def save(self):
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.path.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': DOC_IDS_VERSION, 'next': self.next_id, 'ids': self.ids}, f)
+        os.replace(tmp_file, self.path)
+
+
+def build_search_index(docs, output_dir, ids_file=None, changed=None):
+    """
+    生成分片搜索索引到 output_dir/search/
+    docs: 按时间升序排列的 [{'id', 'title', 'time', 'tags', 'text'}]
+    ids_file: 文档编号映射的保存位置（None 时按列表下标编号，不持久化）
+    changed: 为列表时追加写入或删除的文件（相对 output_dir 的路径）
+    返回 (分片数, 写盘文件数)
+    """
+    output_dir = Path(output_dir)
+    search_dir = output_dir / "search"
+    terms_dir = search_dir / "terms"
+    docs_dir = search_dir / "docs"
+    terms_dir.mkdir(parents=True, exist_ok=True)
+    docs_dir.mkdir(parents=True, exist_ok=True)
+
+    doc_ids = DocIds(ids_file)
+    numbers = doc_ids.assign(docs)
+
+    shards = {}
+    slots = [None] * doc_ids.next_id
+    for doc_id, doc in sorted(zip(numbers, docs), key=lambda pair: pair[0]):
+        slots[doc_id] = [doc['id'], doc['title'], doc['time'], doc['tags']]
+        text = " ".join([doc['title'], doc['text'], " ".join(doc['tags'])])
+        for term in doc_terms(text):
+            shards.setdefault(shard_key(term), {}).setdefault(term, []).append(doc_id)
+
+    written = 0
+    wanted = set()
+
+    def emit(path, payload):
+        """写入 JSON（内容不变时不写盘），返回内容摘要"""
+        nonlocal written
+        wanted.add(path)
+        text = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+        if write_if_changed(path, text):
+            written += 1
+            if changed is not None:
+                changed.append(path.relative_to(output_dir).as_posix())
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()[:10]
+
+    shard_hashes = {key: emit(terms_dir / f"{key}.json", postings) for key, postings in shards.items()}
+
+    # 已删除推文的空位为 null
+    doc_hashes = [
+        emit(docs_dir / f"{chunk_start // DOC_CHUNK_SIZE}.json", slots[chunk_start:chunk_start + DOC_CHUNK_SIZE])
+        for chunk_start in range(0, len(slots), DOC_CHUNK_SIZE)
+    ]
+
+    # meta.json 每次都重新验证；分片与文档分块按摘要加 ?v= 请求，
+    # 浏览器不会把新的 meta 与缓存中的旧分片混用
+    emit(search_dir / "meta.json", {
+        'version': INDEX_VERSION,
+        'total': len(docs),
+        'chunk_size': DOC_CHUNK_SIZE,
+        'shards': dict(sorted(shard_hashes.items())),
+        'docs': doc_hashes,
+    })
+
+    # 清理不再需要的分片
+    for stale in list(terms_dir.glob('*.json')) + list(docs_dir.glob('*.json')):
+        if stale not in wanted:
+            stale.unlink()
+            if changed is not None:
+                changed.append(stale.relative_to(output_dir).as_posix())
+
+    doc_ids.save()
+    return len(shards), written
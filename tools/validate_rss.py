@@ -1,8 +1,8 @@
-
-import feedparser
+import os
 import sys
-import threading
-import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from core.feed_store import get_feed_store
 
 feeds = {
     # 中文
@@ -27,47 +27,23 @@ feeds = {
     "Wired": "https://www.wired.com/feed/rss",
 }
 
-def check_feed(name, url):
-    try:
-        # Some servers block python-requests/feedparser user agents
-        feed = feedparser.parse(url)
-        if feed.entries and len(feed.entries) > 0:
-            print(f"✅ [VALID] {name}: {url} ({len(feed.entries)} entries)")
-            return True, name, url
-        else:
-             # Try with raw requests first if feedparser fails (sometimes headers needed)
-             import requests
-             headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-             try:
-                 r = requests.get(url, headers=headers, timeout=5)
-                 if r.status_code == 200:
-                     feed = feedparser.parse(r.content)
-                     if feed.entries:
-                        print(f"✅ [VALID-REQ] {name}: {url} ({len(feed.entries)} entries)")
-                        return True, name, url
-             except:
-                 pass
-             
-             print(f"❌ [EMPTY/FAIL] {name}: {url}")
-             if hasattr(feed, 'status'):
-                 print(f"   Status: {feed.status}")
-             return False, name, url
-    except Exception as e:
-        print(f"❌ [ERROR] {name}: {e}")
-        return False, name, url
-
 def main():
     print("🔍 Validating RSS Feeds...")
-    
-    threads = []
-    
+
+    # 与 rss_reader 共用抓取层：并发、超时、条件请求，结果同时刷新条目缓存
+    results = get_feed_store().refresh(feeds, max_age=0)
+
     for name, url in feeds.items():
-        t = threading.Thread(target=check_feed, args=(name, url))
-        threads.append(t)
-        t.start()
-        
-    for t in threads:
-        t.join()
+        result = results[name]
+        if result["error"]:
+            print(f"❌ [ERROR] {name}: {url} ({result['error']})")
+        elif result["status"] == 304:
+            print(f"✅ [NOT MODIFIED] {name}: {url} ({result['entries']} cached entries)")
+        else:
+            print(f"✅ [VALID] {name}: {url} ({result['entries']} entries)")
+
+    valid = sum(1 for r in results.values() if not r["error"])
+    print(f"\n{valid}/{len(feeds)} feeds valid")
 
 if __name__ == "__main__":
     main()